@@ -1,7 +1,8 @@
 from application.common import PaginationParams, SortParams
 
+from .conditional_get import conditional_get, conditional_response
 from .filters.base_filter import BaseFilterParams, get_base_filter_params
-from .pagination import get_pagination_params
+from .pagination import get_cursor_pagination_params, get_pagination_params
 from .response_utils import (
     PaginatedResponseDTO,
     create_paginated_response,
@@ -0,0 +1,138 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Awaitable, Callable, Optional
+
+from fastapi import Request, Response, status
+from infrastructure.cache import get_read_cache
+from pydantic import BaseModel
+
+# Los clientes siempre revalidan; el ETag evita reenviar el cuerpo
+CONDITIONAL_CACHE_CONTROL = "no-cache"
+
+
+def compute_etag(body: bytes) -> str:
+    """ETag fuerte a partir del hash del cuerpo serializado"""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    Evalúa If-None-Match y, solo si no viene, If-Modified-Since (RFC 9110).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        return etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return _to_http_precision(last_modified) <= since
+    return False
+
+
+def conditional_response(
+    request: Request, content: BaseModel, last_modified: Optional[datetime] = None
+) -> Response:
+    """Serializa el DTO y responde 304 si la copia del cliente sigue vigente"""
+    body = _serialize(content)
+    etag = compute_etag(body)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    return _full_response(body, etag, last_modified)
+
+
+def not_modified_response(
+    etag: str, last_modified: Optional[datetime] = None
+) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=_validator_headers(etag, last_modified),
+    )
+
+
+async def conditional_get(
+    request: Request,
+    cache_namespace: str,
+    produce: Callable[[], Awaitable[BaseModel]],
+) -> Response:
+    """
+    GET condicional con validadores memorizados en la caché de lectura.
+
+    El ETag de cada URL se guarda en la caché del espacio de nombres de sus
+    datos, así que se invalida junto con ellos. Si el cliente ya tiene esa
+    versión se responde 304 sin ejecutar el caso de uso.
+
+    Last-Modified es el momento en que se generó esa versión: los
+    updated_at no sirven porque las respuestas incluyen datos relacionados
+    y conteos que cambian sin modificarlos.
+    """
+    cache = get_read_cache(cache_namespace)
+    key = _validators_key(request)
+
+    validators = cache.get(key)
+    if isinstance(validators, tuple) and is_not_modified(request, *validators):
+        return not_modified_response(*validators)
+
+    generation = cache.generation
+    body = _serialize(await produce())
+    etag = compute_etag(body)
+
+    last_modified = datetime.now(timezone.utc)
+    if isinstance(validators, tuple) and validators[0] == etag:
+        last_modified = validators[1]
+    cache.set(key, (etag, last_modified), generation)
+
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    return _full_response(body, etag, last_modified)
+
+
+def _serialize(content: BaseModel) -> bytes:
+    """Misma serialización JSON que usa FastAPI con response_model"""
+    return content.model_dump_json(by_alias=True).encode()
+
+
+def _full_response(
+    body: bytes, etag: str, last_modified: Optional[datetime]
+) -> Response:
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=_validator_headers(etag, last_modified),
+    )
+
+
+def _validators_key(request: Request) -> tuple:
+    """Clave por ruta y query string normalizada"""
+    return (
+        "http_validators",
+        request.url.path,
+        tuple(sorted(request.query_params.multi_items())),
+    )
+
+
+def _validator_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    headers = {"ETag": etag, "Cache-Control": CONDITIONAL_CACHE_CONTROL}
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(
+            _to_http_precision(last_modified), usegmt=True
+        )
+    return headers
+
+
+def _to_http_precision(value: datetime) -> datetime:
+    """Las fechas HTTP no tienen zona ni fracciones de segundo: se usa UTC"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
@@ -1 +1,2 @@
 from .base_filter import BaseFilterParams, get_base_filter_params
+from .search import FullTextSearch, IlikeSearch, SearchStrategy, TrigramSearch
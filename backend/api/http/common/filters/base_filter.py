@@ -1,14 +1,19 @@
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, List, Optional
 
 from application.common.base_filter import BaseFilterParams as DomainBaseFilterParams
 from fastapi import Query
-from sqlalchemy import or_
+
+from .search import IlikeSearch, SearchStrategy, contains
 
 
 class BaseFilterParams(DomainBaseFilterParams):
     """Clase base para filtros comunes con extensiones específicas de la API"""
 
+    # Campos de texto de `search` y cómo se buscan (ver search.py)
+    search_fields: ClassVar[List[str]] = []
+    search_strategy: ClassVar[SearchStrategy] = IlikeSearch()
+
     def filter_created_after(self, query, model, value):
         if hasattr(model, "created_at") and value:
             # Convertir string a datetime si es necesario
@@ -42,17 +47,23 @@ class BaseFilterParams(DomainBaseFilterParams):
     def filter_search(self, query, model, value, fields: Optional[list[str]] = None):
         """Filtra por búsqueda en campos específicos del modelo."""
         if fields is None:
-            fields = []
-        conditions = []
-        for attr in fields:
-            if hasattr(model, attr):
-                conditions.append(getattr(model, attr).ilike(f"%{value}%"))
-        if conditions:
-            return query.filter(or_(*conditions))
+            fields = self.search_fields
+        condition = self.search_strategy.condition(model, value, fields)
+        if condition is not None:
+            return query.filter(condition)
         return query
 
+    def search_rank(self, model):
+        """Relevancia de `search` para ordenar resultados (None si no aplica)"""
+        if not self.search:
+            return None
+        return self.search_strategy.rank(model, self.search, self.search_fields)
+
     def ilike_filter(self, query, model_field, value):
-        return query.filter(model_field.ilike(f"%{value}%")) if value else query
+        return query.filter(contains(model_field, value)) if value else query
+
+    def contains_filter(self, query, model_field, value):
+        return self.ilike_filter(query, model_field, value)
 
     def any_filter(
         self, query, relationship_field, attr_name: str, value, ilike: bool = False
@@ -63,7 +74,7 @@ class BaseFilterParams(DomainBaseFilterParams):
         related_model = relationship_field.prop.mapper.class_
         column = getattr(related_model, attr_name)
 
-        condition = column.ilike(f"%{value}%") if ilike else column == value
+        condition = contains(column, value) if ilike else column == value
 
         return query.filter(relationship_field.any(condition))
 
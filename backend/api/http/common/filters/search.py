@@ -0,0 +1,148 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional
+
+from sqlalchemy import func, literal, literal_column, or_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+# Configuración de texto de los tsvector (sin stemming: nombres propios y
+# textos en varios idiomas)
+DEFAULT_TEXT_SEARCH_CONFIG = "simple"
+
+
+class PostgresOrFallback(ColumnElement):
+    """
+    Expresión que se compila distinta según el dialecto: la de PostgreSQL
+    (tsvector, pg_trgm) o la alternativa portable (ILIKE) en los demás,
+    por ejemplo SQLite en pruebas.
+    """
+
+    inherit_cache = True
+    _traverse_internals = [
+        ("postgres", InternalTraversal.dp_clauseelement),
+        ("fallback", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, postgres: ColumnElement, fallback: ColumnElement):
+        self.postgres = postgres
+        self.fallback = fallback
+        self.type = postgres.type
+
+
+@compiles(PostgresOrFallback)
+def _compile_fallback(element, compiler, **kw):
+    return compiler.process(element.fallback.self_group(), **kw)
+
+
+@compiles(PostgresOrFallback, "postgresql")
+def _compile_postgres(element, compiler, **kw):
+    return compiler.process(element.postgres.self_group(), **kw)
+
+
+def escape_like(value: str) -> str:
+    """Escapa los comodines de LIKE para buscar el texto literal"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def contains(column, value: str) -> ColumnElement:
+    """column ILIKE '%value%' sin interpretar % ni _ del usuario"""
+    return column.ilike(f"%{escape_like(value)}%", escape="\\")
+
+
+class SearchStrategy(ABC):
+    """Cómo filtra y ordena por relevancia una búsqueda de texto"""
+
+    @abstractmethod
+    def condition(
+        self, model, value: str, fields: List[str]
+    ) -> Optional[ColumnElement]:
+        """Condición WHERE de la búsqueda; None si no hay campos que buscar"""
+
+    def rank(self, model, value: str, fields: List[str]) -> Optional[ColumnElement]:
+        """Expresión de relevancia (mayor es mejor); None si no ordena"""
+        return None
+
+    @staticmethod
+    def _columns(model, fields: List[str]) -> List[Any]:
+        return [getattr(model, field) for field in fields if hasattr(model, field)]
+
+
+class IlikeSearch(SearchStrategy):
+    """OR de ILIKE '%value%' sobre los campos; no usa índices btree"""
+
+    def condition(self, model, value, fields):
+        conditions = [
+            contains(column, value) for column in self._columns(model, fields)
+        ]
+        return or_(*conditions) if conditions else None
+
+
+class TrigramSearch(IlikeSearch):
+    """
+    Mismo ILIKE, acelerado en PostgreSQL por índices GIN gin_trgm_ops
+    (pg_trgm) en cada campo, y ordenado por similitud.
+    """
+
+    def rank(self, model, value, fields):
+        columns = self._columns(model, fields)
+        if not columns:
+            return None
+        similarities = [func.similarity(column, value) for column in columns]
+        best = (
+            similarities[0] if len(similarities) == 1 else func.greatest(*similarities)
+        )
+        return PostgresOrFallback(best, literal(0.0))
+
+
+class FullTextSearch(SearchStrategy):
+    """
+    Búsqueda de palabras sobre una columna tsvector generada con índice GIN,
+    ordenada por ts_rank. Cada palabra buscada es un prefijo ("conn" encuentra
+    "Connect4") y deben aparecer todas. Los substring_fields además se buscan
+    por subcadena (ILIKE con su índice gin_trgm_ops). Fuera de PostgreSQL
+    recurre a ILIKE en los campos.
+    """
+
+    def __init__(
+        self,
+        vector_field: str = "search_vector",
+        config: str = DEFAULT_TEXT_SEARCH_CONFIG,
+        substring_fields: Optional[List[str]] = None,
+    ):
+        self.vector_field = vector_field
+        self.config = config
+        self.substring_fields = substring_fields or []
+
+    def _query(self, value: str):
+        """to_tsquery con 'palabra':* por término, o None si no hay palabras"""
+        terms = re.findall(r"\w+", value.lower())
+        if not terms:
+            return None
+        prefixes = " & ".join(f"'{term}':*" for term in terms)
+        config = literal_column(f"'{self.config}'::regconfig")
+        return func.to_tsquery(config, prefixes)
+
+    def condition(self, model, value, fields):
+        fallback = IlikeSearch().condition(model, value, fields)
+        vector = getattr(model, self.vector_field, None)
+        query = self._query(value)
+        if vector is None or query is None:
+            return fallback
+
+        conditions = [vector.bool_op("@@")(query)]
+        substring = IlikeSearch().condition(model, value, self.substring_fields)
+        if substring is not None:
+            conditions.append(substring)
+        match = or_(*conditions) if len(conditions) > 1 else conditions[0]
+        if fallback is None:
+            return match
+        return PostgresOrFallback(match, fallback)
+
+    def rank(self, model, value, fields):
+        vector = getattr(model, self.vector_field, None)
+        query = self._query(value)
+        if vector is None or query is None:
+            return None
+        return PostgresOrFallback(func.ts_rank(vector, query), literal(0.0))
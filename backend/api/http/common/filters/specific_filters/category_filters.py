@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import ClassVar, List, Optional
 
 from pydantic import Field
 
@@ -9,16 +9,13 @@ from ..filter_dependency_factory import build_filter_dependency
 class CategoryFilterParams(BaseFilterParams):
     """Filtros específicos para usuarios - hereda filtros base + específicos"""
 
+    search_fields: ClassVar[List[str]] = ["category_name", "category_description"]
+
     category_name: Optional[str] = Field(None, description="Nombre de la categoría")
     category_description: Optional[str] = Field(
         None, description="Descripción de la categoría"
     )
 
-    def filter_search(self, query, model, value, fields: Optional[list[str]] = None):
-        if fields is None:
-            fields = ["category_name", "category_description"]
-        return super().filter_search(query, model, value, fields)
-
     def filter_category_name(self, query, model, value):
         return self.ilike_filter(query, model.category_name, value)
 
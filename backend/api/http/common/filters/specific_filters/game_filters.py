@@ -1,15 +1,23 @@
-from typing import Optional
+from typing import ClassVar, List, Optional
 
 from domain.enums import GameTypeEnum
 from pydantic import Field
 
 from ..base_filter import BaseFilterParams
+from ..search import FullTextSearch, SearchStrategy
 from ..filter_dependency_factory import build_filter_dependency
 
 
 class GameFilterParams(BaseFilterParams):
     """Filtros específicos para juegos - hereda filtros base + específicos"""
 
+    # games.search_vector: tsvector generado de nombre y descripción; el
+    # nombre también por subcadena (ix_games_game_name_trgm)
+    search_fields: ClassVar[List[str]] = ["game_name", "game_description"]
+    search_strategy: ClassVar[SearchStrategy] = FullTextSearch(
+        substring_fields=["game_name"]
+    )
+
     filter_category_id: Optional[str] = Field(
         None, description="Filtrar por ID de categoría del juego", alias="category_id"
     )
@@ -25,11 +33,6 @@ class GameFilterParams(BaseFilterParams):
         None, description="Tipo de juego (ej. 'online', 'offline', 'luck')"
     )
 
-    def filter_search(self, query, model, value, fields: Optional[list[str]] = None):
-        if fields is None:
-            fields = ["game_name", "game_description"]
-        return super().filter_search(query, model, value, fields)
-
     def filter_filter_category_id(self, query, model, value):
         return self.any_filter(query, model.categories, "category_id", value)
 
@@ -7,6 +7,7 @@ from infrastructure.db.models.user.user_model import UserModel
 from pydantic import Field
 
 from ..base_filter import BaseFilterParams
+from ..search import contains
 from ..filter_dependency_factory import build_filter_dependency
 
 
@@ -59,9 +60,7 @@ class MatchFilterParams(BaseFilterParams):
         if value:
             return query.filter(
                 model.participants.any(
-                    MatchParticipationModel.user.has(
-                        UserModel.email.ilike(f"%{value}%")
-                    )
+                    MatchParticipationModel.user.has(contains(UserModel.email, value))
                 )
             )
         return query
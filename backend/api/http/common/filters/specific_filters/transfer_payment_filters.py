@@ -1,15 +1,20 @@
-from typing import Optional
+from typing import ClassVar, List, Optional
 
 from domain.enums import TransferStateEnum
 from pydantic import Field
 
 from ..base_filter import BaseFilterParams
+from ..search import SearchStrategy, TrigramSearch
 from ..filter_dependency_factory import build_filter_dependency
 
 
 class TransferPaymentFilterParams(BaseFilterParams):
     """Filtros específicos para Transfer Payments - hereda filtros base + específicos"""
 
+    # Índice GIN gin_trgm_ops en transfer_payments.transfer_description
+    search_fields: ClassVar[List[str]] = ["transfer_description"]
+    search_strategy: ClassVar[SearchStrategy] = TrigramSearch()
+
     transfer_state: Optional[TransferStateEnum] = Field(
         None, description="Filtrar por estado de transferencia"
     )
@@ -1,14 +1,19 @@
-from typing import Optional
+from typing import ClassVar, List, Optional
 
 from pydantic import Field
 
 from ..base_filter import BaseFilterParams
+from ..search import SearchStrategy, TrigramSearch
 from ..filter_dependency_factory import build_filter_dependency
 
 
 class UserFilterParams(BaseFilterParams):
     """Filtros específicos para usuarios - hereda filtros base + específicos"""
 
+    # Índice GIN gin_trgm_ops en users.email (también sirve a filter_email)
+    search_fields: ClassVar[List[str]] = ["email"]
+    search_strategy: ClassVar[SearchStrategy] = TrigramSearch()
+
     email: Optional[str] = Field(
         None, description="Filtrar por email (búsqueda parcial)"
     )
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from application.common.pagination import PaginationParams
 from fastapi import Query
 
@@ -8,3 +10,22 @@ def get_pagination_params(
 ) -> PaginationParams:
     """Dependency genérico para obtener parámetros de paginación"""
     return PaginationParams(page=page, limit=limit)
+
+
+def get_cursor_pagination_params(
+    page: int = Query(1, ge=1, description="Número de página"),
+    limit: int = Query(10, ge=1, le=100, description="Elementos por página"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor de la página siguiente (next_cursor)"
+    ),
+    include_total: bool = Query(
+        True, description="Incluir el conteo total; si es false se pagina por cursor"
+    ),
+) -> PaginationParams:
+    """
+    Parámetros de paginación con modo cursor. Solo para rutas cuyo
+    repositorio indica cursor_field.
+    """
+    return PaginationParams(
+        page=page, limit=limit, cursor=cursor, include_total=include_total
+    )
@@ -1,16 +1,18 @@
 from math import ceil
-from typing import Callable, List, TypeVar
+from typing import Callable, List, Optional, TypeVar
 
 from application.common import PaginationParams, SortParams
 from dtos.common import PaginatedResponseDTO, PaginationInfoDTO
 from fastapi import Request
 
+from .conditional_get import conditional_get, conditional_response
+
 ItemType = TypeVar("ItemType")
 
 
 def create_paginated_response(
     items: List[ItemType],
-    total_count: int,
+    total_count: Optional[int],
     pagination: PaginationParams,
     request: Request,
 ) -> PaginatedResponseDTO[ItemType]:
@@ -20,12 +22,17 @@ def create_paginated_response(
     Args:
         items: Lista de elementos para la página actual (entities, models, etc.)
         total_count: Número total de elementos en la base de datos
+            (None si la consulta por cursor omitió el conteo)
         pagination: Parámetros de paginación
         request: Request de FastAPI para construir URLs
 
     Returns:
         PaginatedResponseDTO con la información paginada
     """
+    # Modo cursor solo si la consulta lo usó; si no, enlaces por página
+    if pagination.keyset_used:
+        return _create_cursor_response(items, total_count, pagination, request)
+
     # Transformar elementos si se proporciona función
 
     # Calcular información de paginación
@@ -58,6 +65,38 @@ def create_paginated_response(
     return PaginatedResponseDTO(info=pagination_info, results=items)
 
 
+def _create_cursor_response(
+    items: List[ItemType],
+    total_count: Optional[int],
+    pagination: PaginationParams,
+    request: Request,
+) -> PaginatedResponseDTO[ItemType]:
+    """Crea la respuesta paginada por cursor; solo se puede avanzar"""
+    total_pages = None
+    if total_count is not None:
+        total_pages = ceil(total_count / pagination.limit) if total_count > 0 else 1
+
+    next_url = None
+    if pagination.next_cursor:
+        base_url = str(request.url.remove_query_params(["page", "cursor"]))
+        next_url = (
+            f"{base_url}{'&' if '?' in base_url else '?'}"
+            f"cursor={pagination.next_cursor}"
+        )
+
+    pagination_info = PaginationInfoDTO(
+        count=total_count,
+        pages=total_pages,
+        page_number=pagination.page,
+        next=next_url,
+        prev=None,
+    )
+
+    return PaginatedResponseDTO(
+        info=pagination_info, results=items, next_cursor=pagination.next_cursor
+    )
+
+
 async def handle_paginated_request(
     *,
     endpoint_name: str,
@@ -67,18 +106,35 @@ async def handle_paginated_request(
     filters,
     use_case_execute: Callable,
     logger,
+    cache_namespace: Optional[str] = None,
+    conditional: bool = False,
 ):
+    """
+    Ejecuta un caso de uso paginado y construye la respuesta.
+    Con cache_namespace la respuesta es condicional (ETag/Last-Modified) y
+    puede resolverse con 304 sin ejecutar el caso de uso; solo sirve si todo
+    lo que incluye la respuesta invalida ese espacio de nombres. Con
+    conditional el ETag se calcula del cuerpo recién generado en cada petición.
+    """
     logger.info(
         f"{endpoint_name} - Request received - page: {pagination.page}, limit: {pagination.limit}"
     )
-    items, total_count = await use_case_execute(pagination, filters, sort_params)
-    logger.info(
-        f"{endpoint_name} - Response: {len(items)} items from {total_count} total"
-    )
 
-    return create_paginated_response(
-        items=items,
-        total_count=total_count,
-        pagination=pagination,
-        request=request,
-    )
+    async def produce() -> PaginatedResponseDTO:
+        items, total_count = await use_case_execute(pagination, filters, sort_params)
+        logger.info(
+            f"{endpoint_name} - Response: {len(items)} items from {total_count} total"
+        )
+
+        return create_paginated_response(
+            items=items,
+            total_count=total_count,
+            pagination=pagination,
+            request=request,
+        )
+
+    if cache_namespace is not None:
+        return await conditional_get(request, cache_namespace, produce)
+    if conditional:
+        return conditional_response(request, await produce())
+    return await produce()
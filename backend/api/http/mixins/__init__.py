@@ -1,3 +1,4 @@
+from .cursor_mixin import CursorPaginationMixin
 from .filter_mixin import FilterMixin
 from .query_mixin import QueryMixin
 from .sort_mixin import SortingMixin
@@ -0,0 +1,103 @@
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional, Tuple
+from uuid import UUID
+
+from api.http.common.sort import SortParams
+from domain.exceptions import ValidationError
+from sqlalchemy import tuple_
+
+INVALID_CURSOR_MESSAGE = "Invalid pagination cursor"
+
+
+class CursorPaginationMixin:
+    """
+    Mixin para paginación por cursor (keyset).
+
+    El cursor es opaco para el cliente: codifica el valor de la columna de
+    ordenamiento y la clave primaria de la última fila, y la página siguiente
+    se obtiene con WHERE (sort_col, pk) > (...) en lugar de OFFSET.
+    """
+
+    def get_keyset_columns(
+        self, model, cursor_field, sort_params: Optional[SortParams]
+    ) -> Optional[Tuple[Any, Any, bool]]:
+        """
+        Obtiene (columna de orden, clave primaria, descendente).
+        Retorna None si la columna de orden admite NULL y no sirve como cursor.
+        """
+        descending = bool(sort_params and sort_params.sort_order == "desc")
+        sort_column = cursor_field
+        if sort_params and sort_params.sort_by:
+            sort_column = getattr(model, sort_params.sort_by)
+
+        if sort_column is not cursor_field and getattr(sort_column, "nullable", True):
+            return None
+        return sort_column, cursor_field, descending
+
+    def apply_keyset_sorting(self, stmt, sort_column, cursor_field, descending: bool):
+        """Ordena por la columna de orden y desempata por la clave primaria"""
+        columns = [sort_column]
+        if sort_column is not cursor_field:
+            columns.append(cursor_field)
+        return stmt.order_by(
+            *(column.desc() if descending else column.asc() for column in columns)
+        )
+
+    def apply_keyset_seek(
+        self, stmt, sort_column, cursor_field, descending: bool, cursor: str
+    ):
+        """Filtra las filas posteriores a la posición codificada en el cursor"""
+        sort_value, key_value = self.decode_cursor(cursor)
+        if sort_column is cursor_field:
+            left, right = sort_column, key_value
+        else:
+            left = tuple_(sort_column, cursor_field)
+            right = tuple_(sort_value, key_value)
+        return stmt.where(left < right if descending else left > right)
+
+    def build_next_cursor(self, row, sort_column, cursor_field) -> str:
+        """Codifica la posición de la última fila de la página"""
+        return self.encode_cursor(
+            getattr(row, sort_column.key), getattr(row, cursor_field.key)
+        )
+
+    @staticmethod
+    def encode_cursor(sort_value: Any, key_value: Any) -> str:
+        payload = json.dumps(
+            [_encode_value(sort_value), _encode_value(key_value)],
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[Any, Any]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            sort_value, key_value = json.loads(base64.urlsafe_b64decode(padded))
+            return _decode_value(sort_value), _decode_value(key_value)
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValidationError(INVALID_CURSOR_MESSAGE) from e
+
+
+def _encode_value(value: Any) -> Any:
+    """Convierte un valor de columna a JSON conservando su tipo"""
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, "value"):  # Enums
+        return value.value
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "uuid" in value:
+            return UUID(value["uuid"])
+        return datetime.fromisoformat(value["dt"])
+    return value
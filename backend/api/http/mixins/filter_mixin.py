@@ -17,3 +17,10 @@ class FilterMixin:
                 method = getattr(filters, method_name)
                 stmt = method(stmt, model, value)
         return stmt
+
+    def apply_search_ranking(self, stmt, model, filters: BaseFilterParams) -> Any:
+        """Ordena por relevancia de la búsqueda de texto, si la estrategia la da"""
+        rank = filters.search_rank(model)
+        if rank is not None:
+            stmt = stmt.order_by(rank.desc())
+        return stmt
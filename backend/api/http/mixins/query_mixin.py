@@ -8,12 +8,13 @@ from fastapi import Query
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .cursor_mixin import CursorPaginationMixin
 from .filter_mixin import FilterMixin
 from .pagination_mixin import PaginationMixin
 from .sort_mixin import SortingMixin
 
 
-class QueryMixin(FilterMixin, SortingMixin, PaginationMixin):
+class QueryMixin(FilterMixin, SortingMixin, PaginationMixin, CursorPaginationMixin):
     async def get_paginated_mixin(
         self,
         model: Type,
@@ -24,9 +25,18 @@ class QueryMixin(FilterMixin, SortingMixin, PaginationMixin):
         to_entity: Optional[Callable] = None,
         custom_filter_fn: Optional[Callable[[Query], Query]] = None,
         load_options: Optional[List[Any]] = None,
-    ) -> Tuple[List, int]:
+        cursor_field: Optional[Any] = None,
+    ) -> Tuple[List, Optional[int]]:
         """
         Consulta genérica con filtros, ordenamiento y paginación.
+
+        Si se indica cursor_field (la clave primaria) y el cliente pide el modo
+        cursor (envía cursor o include_total=False), pagination.cursor
+        reemplaza a OFFSET, se completa pagination.next_cursor y, con
+        include_total=False, se omite el conteo (el total retornado es None).
+        pagination.keyset_used indica si se usó ese modo; si no (sin
+        cursor_field o con un orden por columna nullable), se mantiene la
+        paginación por página de siempre, con conteo.
         """
         stmt = select(model)
 
@@ -36,6 +46,17 @@ class QueryMixin(FilterMixin, SortingMixin, PaginationMixin):
             stmt = self.apply_filters(stmt, model, filters)
         if custom_filter_fn:
             stmt = custom_filter_fn(stmt)
+
+        keyset = None
+        if cursor_field is not None and pagination.use_cursor:
+            keyset = self.get_keyset_columns(model, cursor_field, sort_params)
+        pagination.keyset_used = bool(keyset)
+
+        if keyset:
+            return await self._get_keyset_page(
+                stmt, db_session, pagination, keyset, to_entity
+            )
+
         if sort_params:
             stmt = self.apply_sorting(stmt, model, sort_params)
 
@@ -44,6 +65,10 @@ class QueryMixin(FilterMixin, SortingMixin, PaginationMixin):
         count_result = await db_session.execute(count_stmt)
         total_count = count_result.scalar()
 
+        # Sin orden explícito, los resultados de `search` van por relevancia
+        if filters and not (sort_params and sort_params.sort_by):
+            stmt = self.apply_search_ranking(stmt, model, filters)
+
         # Apply pagination
         stmt = self.apply_pagination(stmt, pagination)
 
@@ -55,3 +80,43 @@ class QueryMixin(FilterMixin, SortingMixin, PaginationMixin):
             results = [to_entity(r) for r in results]
 
         return results, total_count
+
+    async def _get_keyset_page(
+        self,
+        stmt,
+        db_session: AsyncSession,
+        pagination: PaginationParams,
+        keyset: Tuple[Any, Any, bool],
+        to_entity: Optional[Callable] = None,
+    ) -> Tuple[List, Optional[int]]:
+        """Obtiene una página buscando desde el cursor en lugar de usar OFFSET"""
+        sort_column, cursor_field, descending = keyset
+
+        total_count = None
+        if pagination.include_total:
+            count_stmt = select(func.count()).select_from(stmt.subquery())
+            total_count = await db_session.scalar(count_stmt)
+
+        stmt = self.apply_keyset_sorting(stmt, sort_column, cursor_field, descending)
+        if pagination.cursor:
+            stmt = self.apply_keyset_seek(
+                stmt, sort_column, cursor_field, descending, pagination.cursor
+            )
+        else:
+            stmt = stmt.offset(pagination.offset)
+
+        # Una fila extra indica si existe una página siguiente
+        result = await db_session.execute(stmt.limit(pagination.limit + 1))
+        results = result.scalars().all()
+
+        pagination.next_cursor = None
+        if len(results) > pagination.limit:
+            results = results[: pagination.limit]
+            pagination.next_cursor = self.build_next_cursor(
+                results[-1], sort_column, cursor_field
+            )
+
+        if to_entity:
+            results = [to_entity(r) for r in results]
+
+        return results, total_count
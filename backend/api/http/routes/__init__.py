@@ -2,7 +2,9 @@ from .app_info_routes import app_info_router
 from .auth_routes import auth_router
 from .category_routes import category_router
 from .game_routes import game_router
+from .health_routes import health_router
 from .match_routes import match_router
+from .metrics_routes import metrics_router
 from .transfer_payment_routes import transfer_router
 from .user_routes import user_router
 
@@ -14,4 +16,6 @@ http_routers = [
     category_router,
     game_router,
     match_router,
+    metrics_router,
+    health_router,
 ]
@@ -1,6 +1,8 @@
+from api.http.common import conditional_get
 from application.use_cases.get_app_info_use_case import GetAppInfoUseCase
 from dtos.response.app_info_response import AppInfoResponseDTO
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
+from infrastructure.cache import APP_INFO_CACHE
 from infrastructure.dependencies.use_cases.app_info_use_cases import (
     get_app_info_use_case,
 )
@@ -11,9 +13,12 @@ logger = get_logger("app_info_routes")
 
 
 @app_info_router.get("/", response_model=AppInfoResponseDTO)
-async def get_app_info(use_case: GetAppInfoUseCase = Depends(get_app_info_use_case)):
+async def get_app_info(
+    request: Request,
+    use_case: GetAppInfoUseCase = Depends(get_app_info_use_case),
+) -> Response:
     """
-    Obtener información de la aplicación
+    Obtener información de la aplicación (GET condicional con ETag)
     """
     logger.info("Fetching app info")
-    return await use_case.execute()
+    return await conditional_get(request, APP_INFO_CACHE, use_case.execute)
@@ -3,6 +3,7 @@ from uuid import UUID
 from api.http.common import (
     PaginationParams,
     SortParams,
+    conditional_get,
     get_pagination_params,
     get_sort_params,
 )
@@ -15,7 +16,8 @@ from application.use_cases.game import (
 from dtos.common import PaginatedResponseDTO
 from dtos.response.game import CategoryResponseDTO
 from dtos.response.game.game_response import GameResponseDTO
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Request, Response
+from infrastructure.cache import CATEGORIES_CACHE
 from infrastructure.dependencies import (
     get_all_categories_use_case,
     get_category_by_id_use_case,
@@ -72,23 +74,28 @@ async def get_all_categories(
         filters=filters,
         use_case_execute=use_case.execute,
         logger=logger,
+        cache_namespace=CATEGORIES_CACHE,
     )
 
 
 @category_router.get("/{category_id}", response_model=CategoryResponseDTO)
 async def get_category_by_id(
     category_id: UUID,
+    request: Request,
     use_case: GetCategoryByIdUseCase = Depends(get_category_by_id_use_case),
-) -> CategoryResponseDTO:
+) -> Response:
     """
     Retrieve a specific category by ID.
+    Honors If-None-Match/If-Modified-Since with 304 Not Modified.
 
     :param category_id: The ID of the category to retrieve
     :return: CategoryResponseDTO object
     """
     logger.info(f"GET /categories/{category_id} - Request received")
 
-    return await use_case.execute(str(category_id))
+    return await conditional_get(
+        request, CATEGORIES_CACHE, lambda: use_case.execute(str(category_id))
+    )
 
 
 @category_router.get(
@@ -119,4 +126,6 @@ async def get_games_by_category_id(
         filters=filters,
         use_case_execute=lambda p, f, s: use_case.execute(str(category_id), p, f, s),
         logger=logger,
+        # Incluye conteos de partidas, que no invalidan GAMES_CACHE
+        conditional=True,
     )
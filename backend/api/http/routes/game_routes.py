@@ -3,6 +3,7 @@ from uuid import UUID
 from api.http.common import (
     PaginationParams,
     SortParams,
+    conditional_response,
     get_pagination_params,
     get_sort_params,
 )
@@ -20,7 +21,8 @@ from application.use_cases.game import (
 )
 from dtos.common import PaginatedResponseDTO
 from dtos.response.game import CategoryResponseDTO, GameResponseDTO
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Request, Response
+from infrastructure.cache import CATEGORIES_CACHE
 from infrastructure.dependencies import (
     get_all_games_use_case,
     get_categories_by_game_id_use_case,
@@ -56,6 +58,7 @@ async def get_all_games(
     Query Parameters:
     - page: Número de página (default: 1)
     - limit: Elementos por página (default: 10, max: 100)
+    - sort_by: Campo de ordenamiento (ej. rating_avg usa la columna indexada)
     - email: Filtrar por email (búsqueda parcial)
     - min_currency: Moneda virtual mínima
     - max_currency: Moneda virtual máxima
@@ -73,23 +76,29 @@ async def get_all_games(
         filters=filters,
         use_case_execute=use_case.execute,
         logger=logger,
+        # Incluye conteos de partidas, que no invalidan GAMES_CACHE
+        conditional=True,
     )
 
 
 @game_router.get("/{game_id}", response_model=GameResponseDTO)
 async def get_game_by_id(
     game_id: UUID,
+    request: Request,
     use_case: GetGameByIdUseCase = Depends(get_game_by_id_use_case),
-) -> GameResponseDTO:
+) -> Response:
     """
     Retrieve a specific game by ID.
+    Honors If-None-Match with 304 Not Modified.
 
     :param game_id: The ID of the game to retrieve
     :return: GameResponseDTO object
     """
     logger.info(f"GET /games/{game_id} - Request received")
 
-    return await use_case.execute(str(game_id))
+    # Incluye conteos de partidas, que no invalidan GAMES_CACHE: el ETag se
+    # calcula de la respuesta recién generada
+    return conditional_response(request, await use_case.execute(str(game_id)))
 
 
 @game_router.get(
@@ -121,4 +130,5 @@ async def get_categories_by_game_id(
         filters=filters,
         use_case_execute=lambda p, f, s: use_case.execute(str(game_id), p, f, s),
         logger=logger,
+        cache_namespace=CATEGORIES_CACHE,
     )
@@ -0,0 +1,24 @@
+from dtos.response.health_response import HealthResponseDTO
+from fastapi import APIRouter
+from infrastructure.core import settings
+from infrastructure.db import get_pool_status
+
+health_router = APIRouter(tags=["Health"])
+
+
+@health_router.get("/health", response_model=HealthResponseDTO)
+async def get_health() -> HealthResponseDTO:
+    """
+    Estado del servicio sin consultar la base de datos: solo lee los
+    contadores de los pools. "degraded" indica que algún pool abrió
+    conexiones de overflow; "saturated", que superó el umbral configurado.
+    """
+    threshold = settings.database_settings.db_pool_saturation_threshold
+    pools = get_pool_status()
+
+    status = "ok"
+    if any(pool["saturation"] >= threshold for pool in pools.values()):
+        status = "saturated"
+    elif any(pool["overflow"] > 0 for pool in pools.values()):
+        status = "degraded"
+    return HealthResponseDTO(status=status, pools=pools)
@@ -3,7 +3,7 @@ from uuid import UUID
 from api.http.common import (
     PaginationParams,
     SortParams,
-    get_pagination_params,
+    get_cursor_pagination_params,
     get_sort_params,
 )
 from api.http.common.filters.specific_filters.match_filters import (
@@ -17,15 +17,18 @@ from application.use_cases.match import (
     CreateMatchUseCase,
     GetMatchByIdUseCase,
     GetMatchesByGameIdUseCase,
+    GetOpenMatchesByGameIdUseCase,
 )
 from dtos import PaginatedResponseDTO
 from dtos.request.match.match_request_dto import CreateMatchRequestDTO
 from dtos.response.match.match_response import MatchResponseDTO
 from fastapi import APIRouter, Depends, Request
+from infrastructure.db import use_primary_for_reads
 from infrastructure.dependencies.use_cases.match_use_cases import (
     get_create_match_use_case,
     get_match_by_id_use_case,
     get_matches_by_game_id_use_case,
+    get_open_matches_by_game_id_use_case,
 )
 from infrastructure.logging import get_logger
 
@@ -66,7 +69,7 @@ async def create_match(
 async def get_matches_by_game_id(
     game_id: UUID,
     request: Request,
-    pagination: PaginationParams = Depends(get_pagination_params),
+    pagination: PaginationParams = Depends(get_cursor_pagination_params),
     sort_params: SortParams = Depends(get_sort_params),
     filters: MatchFilterParams = Depends(get_match_filter_params),
     use_case: GetMatchesByGameIdUseCase = Depends(get_matches_by_game_id_use_case),
@@ -79,6 +82,9 @@ async def get_matches_by_game_id(
     - limit: Elementos por página (default: 10, max: 100)
     - sort_by: Campo para ordenar (default: created_at)
     - sort_order: Orden ascendente (asc) o descendente (desc) (default: desc)
+    - cursor: Cursor de la página siguiente (next_cursor de la respuesta anterior);
+      activa el modo cursor
+    - include_total: Si es false se omite el conteo total (activa el modo cursor)
 
     Returns:
         PaginatedResponseDTO[MatchSummaryResponseDTO]: Lista paginada de partidas
@@ -94,6 +100,44 @@ async def get_matches_by_game_id(
     )
 
 
+@match_router.get(
+    "/{game_id}/matches/open", response_model=PaginatedResponseDTO[MatchResponseDTO]
+)
+@use_primary_for_reads
+async def get_open_matches_by_game_id(
+    game_id: UUID,
+    request: Request,
+    pagination: PaginationParams = Depends(get_cursor_pagination_params),
+    use_case: GetOpenMatchesByGameIdUseCase = Depends(
+        get_open_matches_by_game_id_use_case
+    ),
+) -> PaginatedResponseDTO[MatchResponseDTO]:
+    """
+    Lobby: partidas sin terminar y con lugar libre, de la más antigua a la
+    más nueva. Se lee justo después de crear o unirse a una partida y los
+    lugares libres deben estar al día: lee de la base principal.
+
+    Query Parameters:
+    - page: Número de página (default: 1)
+    - limit: Elementos por página (default: 10, max: 100)
+    - cursor: Cursor de la página siguiente (next_cursor de la respuesta anterior);
+      activa el modo cursor
+    - include_total: Si es false se omite el conteo total (activa el modo cursor)
+
+    Returns:
+        PaginatedResponseDTO[MatchResponseDTO]: Partidas a las que unirse
+    """
+    return await handle_paginated_request(
+        endpoint_name=f"GET /{game_id}/matches/open",
+        request=request,
+        pagination=pagination,
+        sort_params=None,
+        filters=None,
+        use_case_execute=lambda p, f, s: use_case.execute(str(game_id), p),
+        logger=logger,
+    )
+
+
 @match_router.get("/matches/{match_id}", response_model=MatchResponseDTO)
 async def get_match(
     match_id: UUID,
@@ -0,0 +1,23 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from infrastructure.metrics import get_metrics_registry
+from infrastructure.metrics.collectors import register_default_collectors
+
+# Formato de texto de Prometheus
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+register_default_collectors()
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> PlainTextResponse:
+    """
+    Métricas del proceso en formato de exposición de texto de Prometheus:
+    latencia HTTP por ruta, mensajes WebSocket, broadcasts, partidas y
+    conexiones por tipo de juego, liquidaciones y espera del pool de la BD.
+    """
+    return PlainTextResponse(
+        get_metrics_registry().render(), media_type=METRICS_CONTENT_TYPE
+    )
@@ -1,6 +1,8 @@
 from application.services.game_finish_service import GameFinishService
+from application.services.settlement_queue import SettlementQueue
 from application.use_cases.match.finish_match import FinishMatchUseCase
 from fastapi import Depends
+from infrastructure.dependencies.sockets import get_settlement_queue
 from infrastructure.dependencies.use_cases.match_participations_use_cases import (
     get_finish_match_use_case,
 )
@@ -8,6 +10,7 @@ from infrastructure.dependencies.use_cases.match_participations_use_cases import
 
 def get_game_finish_service(
     finish_match_use_case: FinishMatchUseCase = Depends(get_finish_match_use_case),
+    settlement_queue: SettlementQueue = Depends(get_settlement_queue),
 ) -> GameFinishService:
     """
     Factory function to create GameFinishService with all required dependencies.
@@ -15,4 +18,7 @@ def get_game_finish_service(
     Returns:
         GameFinishService: Configured service instance
     """
-    return GameFinishService(finish_match_use_case=finish_match_use_case)
+    return GameFinishService(
+        finish_match_use_case=finish_match_use_case,
+        settlement_queue=settlement_queue,
+    )
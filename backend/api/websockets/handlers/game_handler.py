@@ -1,3 +1,4 @@
+import logging
 from typing import Optional
 
 from domain.entities.match.match import MatchEntity
@@ -70,10 +71,13 @@ class WebSocketGameHandler:
     ) -> None:
         """Handle incoming game message"""
         try:
-            self.logger.info(f"Received message: {data}")
-            self.logger.info(
-                f"Active connections: {self.unified_game_manager.active_connections}"
-            )
+            # Mensaje completo solo en DEBUG: se registra en cada jugada
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Received message: %s - Active connections in match: %d",
+                    data,
+                    len(self.unified_game_manager.active_connections.get(match_id, ())),
+                )
 
             # Record metrics
             from ..utils.message_logger import message_logger
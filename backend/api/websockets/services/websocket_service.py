@@ -1,6 +1,7 @@
 from application.use_cases.auth.get_current_user import GetCurrentUserUseCase
 from domain.repositories.match_repository import IMatchRepository
 from fastapi import WebSocket, WebSocketDisconnect
+from infrastructure.logging import bind_log_context
 from infrastructure.logging.logging_config import get_logger
 from infrastructure.websockets.unified_game_manager import UnifiedGameWebSocketManager
 
@@ -55,6 +56,7 @@ class WebSocketService:
         Uses middleware chain for modular processing.
         """
         context = {}
+        bind_log_context(match_id=match_id)
 
         try:
             # Process connection through middleware chain
@@ -71,6 +73,7 @@ class WebSocketService:
                 f"WebSocket connection established for match_id: {match_id}"
             )
             if user:
+                bind_log_context(user_id=user.user_id)
                 self.logger.info(f"User: {user.user_id}")
 
             # Message handling loop
@@ -3,6 +3,7 @@
 from typing import Any, Dict
 
 from infrastructure.logging.logging_config import get_logger
+from infrastructure.metrics import WEBSOCKET_MESSAGES, message_type_label
 
 logger = get_logger("websockets.message_logger")
 
@@ -17,16 +18,24 @@ class MessageLogger:
         self, match_id: str, user_id: str, message: Dict[str, Any]
     ) -> None:
         """Log a message sent to client"""
+        WEBSOCKET_MESSAGES.labels("out", message_type_label(message)).inc()
         self.logger.info(
-            f"Message sent - Match: {match_id}, User: {user_id}, Type: {message.get('type', 'unknown')}"
+            "Message sent - Match: %s, User: %s, Type: %s",
+            match_id,
+            user_id,
+            message.get("type", "unknown"),
         )
 
     def log_message_received(
         self, match_id: str, user_id: str, message: Dict[str, Any]
     ) -> None:
         """Log a message received from client"""
+        WEBSOCKET_MESSAGES.labels("in", message_type_label(message)).inc()
         self.logger.info(
-            f"Message received - Match: {match_id}, User: {user_id}, Type: {message.get('type', 'unknown')}"
+            "Message received - Match: %s, User: %s, Type: %s",
+            match_id,
+            user_id,
+            message.get("type", "unknown"),
         )
 
     def log_connection_established(self, match_id: str, user_id: str) -> None:
@@ -53,6 +53,7 @@ class GameMessageSchema(BaseModel):
     game_type: Optional[str] = None
     match_id: Optional[str] = None
     move: Optional[Dict[str, Any]] = None
+    seq: Optional[int] = None
 
     class Config:
         extra = "allow"  # Allow additional fields
@@ -64,6 +65,7 @@ class JoinGameSchema(BaseModel):
     type: str = "join_game"
     player_id: Optional[str] = None
     game_type: Optional[str] = None
+    protocol_version: Optional[int] = None
 
 
 class MakeMoveSchema(BaseModel):
@@ -1,12 +1,17 @@
+from app_setup.admin.mixins import CacheInvalidationAdminMixin
+from infrastructure.cache import APP_INFO_CACHE
 from infrastructure.db.models import AccountModel
 from sqladmin import ModelView
 
 
-class AccountAdmin(ModelView, model=AccountModel):
+class AccountAdmin(CacheInvalidationAdminMixin, ModelView, model=AccountModel):
     name = "Cuenta"
     name_plural = "Cuentas"
     icon = "fa-solid fa-user"
 
+    # Las cuentas se devuelven dentro de la información de la aplicación
+    cache_namespaces = (APP_INFO_CACHE,)
+
     # Columnas que se muestran
     column_list = [
         AccountModel.account_id,
@@ -2,7 +2,9 @@ import asyncio
 import re
 from typing import Optional
 
+from app_setup.admin.mixins import CacheInvalidationAdminMixin
 from application.services.file_upload_service import FileUploadService
+from infrastructure.cache import APP_INFO_CACHE
 from infrastructure.db.connection import SessionLocal
 from infrastructure.db.models import AppInfoModel
 from markupsafe import Markup
@@ -12,13 +14,15 @@ from starlette.requests import Request
 from wtforms import FileField, validators
 
 
-class AppInfoAdmin(ModelView, model=AppInfoModel):
+class AppInfoAdmin(CacheInvalidationAdminMixin, ModelView, model=AppInfoModel):
     """Panel de administración para información de la aplicación"""
 
     name = "Información de la Aplicación"
     name_plural = "Información de la Aplicación"
     icon = "fa-solid fa-info-circle"
 
+    cache_namespaces = (APP_INFO_CACHE,)
+
     # Configuración de campos de imagen
     image_fields = {"site_icon": "site_icons", "site_logo": "site_logos"}
 
@@ -1,9 +1,12 @@
-from app_setup.admin.mixins import ImageUploadAdminMixin
+from app_setup.admin.mixins import CacheInvalidationAdminMixin, ImageUploadAdminMixin
+from infrastructure.cache import CATEGORIES_CACHE, GAMES_CACHE
 from infrastructure.db.models import CategoryModel
 from sqladmin import ModelView
 
 
-class CategoryAdmin(ImageUploadAdminMixin, ModelView, model=CategoryModel):
+class CategoryAdmin(
+    CacheInvalidationAdminMixin, ImageUploadAdminMixin, ModelView, model=CategoryModel
+):
     """Panel de administración para categorías"""
 
     # Configuración de categoría/módulo
@@ -11,6 +14,9 @@ class CategoryAdmin(ImageUploadAdminMixin, ModelView, model=CategoryModel):
     name_plural = "Categorías"
     icon = "fa-solid fa-tags"
 
+    # Los juegos incluyen los IDs de sus categorías
+    cache_namespaces = (CATEGORIES_CACHE, GAMES_CACHE)
+
     # Propiedades requeridas por ImageUploadMixin
     @property
     def image_field_name(self) -> str:
@@ -1,10 +1,13 @@
-from app_setup.admin.mixins import ImageUploadAdminMixin
+from app_setup.admin.mixins import CacheInvalidationAdminMixin, ImageUploadAdminMixin
+from infrastructure.cache import CATEGORIES_CACHE, GAMES_CACHE
 from infrastructure.db.models import GameModel
 from markupsafe import Markup
 from sqladmin import ModelView
 
 
-class GameAdmin(ImageUploadAdminMixin, ModelView, model=GameModel):
+class GameAdmin(
+    CacheInvalidationAdminMixin, ImageUploadAdminMixin, ModelView, model=GameModel
+):
     """Panel de administración para juegos"""
 
     # Configuración de categoría/módulo
@@ -12,6 +15,9 @@ class GameAdmin(ImageUploadAdminMixin, ModelView, model=GameModel):
     name_plural = "Juegos"
     icon = "fa-solid fa-gamepad"
 
+    # Las categorías incluyen los IDs de sus juegos
+    cache_namespaces = (GAMES_CACHE, CATEGORIES_CACHE)
+
     # Propiedades requeridas por ImageUploadMixin
     @property
     def image_field_name(self) -> str:
@@ -1,4 +1,5 @@
 from app_setup.admin.mixins import ImageUploadAdminMixin
+from infrastructure.cache import invalidate_principal
 from infrastructure.db.connection import AsyncSessionLocal
 from infrastructure.db.models import TransferPaymentModel
 from infrastructure.db.models.user.user_model import UserModel
@@ -168,6 +169,7 @@ class TransferPaymentAdmin(
 
                         if update_result.rowcount == 1:
                             await session.commit()
+                            invalidate_principal(model.user_id)
 
         except Exception:
             import traceback
@@ -210,6 +212,7 @@ class TransferPaymentAdmin(
 
                         if result.rowcount == 1:
                             await session.commit()
+                            invalidate_principal(model.user_id)
 
         except Exception:
             import traceback
@@ -1,5 +1,7 @@
+from infrastructure.cache import invalidate_principal
 from infrastructure.db.models import UserModel
 from sqladmin import ModelView
+from starlette.requests import Request
 
 
 class UserAdmin(ModelView, model=UserModel):
@@ -81,3 +83,13 @@ class UserAdmin(ModelView, model=UserModel):
     can_export = True
     export_max_rows = 1000
     export_types = ["csv", "xlsx"]
+
+    async def after_model_change(
+        self, data: dict, model: UserModel, is_created: bool, request: Request
+    ) -> None:
+        """El saldo o el rol pudieron cambiar: descartar el usuario cacheado"""
+        if not is_created:
+            invalidate_principal(model.user_id)
+
+    async def after_model_delete(self, model: UserModel, request: Request) -> None:
+        invalidate_principal(model.user_id)
@@ -1,3 +1,4 @@
+from .cache_invalidation_mixin import CacheInvalidationAdminMixin
 from .image_upload_mixin import ImageUploadAdminMixin
 
-__all__ = ["ImageUploadAdminMixin"]
+__all__ = ["CacheInvalidationAdminMixin", "ImageUploadAdminMixin"]
@@ -0,0 +1,23 @@
+from typing import Tuple
+
+from infrastructure.cache import invalidate_read_cache
+from starlette.requests import Request
+
+
+class CacheInvalidationAdminMixin:
+    """
+    Vacía las cachés de lectura afectadas cuando el admin crea, edita o
+    elimina un registro. Las vistas definen cache_namespaces.
+    """
+
+    cache_namespaces: Tuple[str, ...] = ()
+
+    async def after_model_change(
+        self, data: dict, model, is_created: bool, request: Request
+    ) -> None:
+        await super().after_model_change(data, model, is_created, request)
+        invalidate_read_cache(*self.cache_namespaces)
+
+    async def after_model_delete(self, model, request: Request) -> None:
+        await super().after_model_delete(model, request)
+        invalidate_read_cache(*self.cache_namespaces)
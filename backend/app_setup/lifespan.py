@@ -1,7 +1,8 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from infrastructure.db import create_tables
+from infrastructure.db import async_engine, async_read_engine, create_tables
+from infrastructure.dependencies.sockets import get_settlement_queue
 from infrastructure.logging import get_logger
 
 # Configurar logger
@@ -27,3 +28,11 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("👋 Shutting down application...")
+
+    # Terminar de liquidar las partidas pendientes antes de salir
+    await get_settlement_queue().stop()
+
+    # Cerrar las conexiones de los pools (principal y réplica)
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
@@ -6,7 +6,11 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from infrastructure.core.settings_config import AppSettings
 from infrastructure.logging import get_logger
-from infrastructure.middleware import LoggingMiddleware, SimpleProxyHeadersMiddleware
+from infrastructure.middleware import (
+    LoggingMiddleware,
+    MetricsMiddleware,
+    SimpleProxyHeadersMiddleware,
+)
 
 # Configurar logger
 logger = get_logger("middlewares")
@@ -39,6 +43,9 @@ def add_middlewares(app: FastAPI, app_settings: AppSettings) -> None:
         max_age=86400,
     )
 
+    # Latencia por plantilla de ruta para /metrics
+    app.add_middleware(MetricsMiddleware)
+
     # Middleware de logging de requests y tracking de errores
     logger.info("Adding request logging and error tracking middleware")
     app.add_middleware(LoggingMiddleware)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -13,6 +15,27 @@ class PaginationParams(BaseModel):
         le=100,
         description="Número de elementos por página (máximo 100)",
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor opaco de la página siguiente (reemplaza a page)",
+    )
+    include_total: bool = Field(
+        default=True,
+        description="Si es False se omite el conteo total y se pagina por cursor",
+    )
+    keyset_used: bool = Field(
+        default=False,
+        description="La consulta paginó por cursor, lo completa la consulta",
+    )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor de la página siguiente, lo completa la consulta",
+    )
+
+    @property
+    def use_cursor(self) -> bool:
+        """El cliente pidió paginación por cursor (cursor o include_total=False)"""
+        return self.cursor is not None or not self.include_total
 
     @property
     def offset(self) -> int:
@@ -34,6 +34,10 @@ class GameEntityToDTOConverter(
             house_odds=entity.house_odds,
             game_type=entity.game_type,
             category_ids=category_ids,  # Siempre IDs de string
+            review_count=entity.review_count,
+            average_rating=entity.average_rating,
+            open_match_count=entity.open_match_count,
+            total_match_count=entity.total_match_count,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from typing import Optional
 
 from application.mixins import (
     BidirectionalConverter,
@@ -55,10 +56,16 @@ class MatchEntityToDTOConverter(
 
     def to_dto(self, entity: MatchEntity, game: GameEntity) -> MatchResponseDTO:
         """Convierte MatchEntity a MatchResponseDTO."""
+        return self.to_dto_with_house_odds(entity, game.house_odds)
+
+    def to_dto_with_house_odds(
+        self, entity: MatchEntity, house_odds: Optional[float]
+    ) -> MatchResponseDTO:
+        """Convierte MatchEntity a MatchResponseDTO usando solo el house_odds del juego."""
         self.logger.debug(
             f"Converting MatchEntity to MatchResponseDTO for match: {entity.match_id}"
         )
-        odds = entity.calculate_odds_for_match(game.house_odds)
+        odds = entity.calculate_odds_for_match(house_odds)
 
         dto = MatchResponseDTO(
             match_id=str(entity.match_id),
@@ -102,6 +109,12 @@ class MatchBidirectionalConverter(
         )
         return self.entity_to_dto.to_dto(entity, game)
 
+    def to_dto_with_house_odds(
+        self, entity: MatchEntity, house_odds: Optional[float]
+    ) -> MatchResponseDTO:
+        """Convierte entidad a DTO de respuesta sin cargar el juego completo."""
+        return self.entity_to_dto.to_dto_with_house_odds(entity, house_odds)
+
     def to_entity(self, dto: MatchResponseDTO) -> MatchEntity:
         """Convierte DTO de respuesta a entidad."""
         self.logger.debug("Converting MatchResponseDTO to MatchEntity for match")
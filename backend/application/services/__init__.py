@@ -1,4 +1,6 @@
+from .bounded_executor import BoundedExecutor, ExecutorSaturatedError
 from .file_upload_service import FileUploadService
 from .game_finish_service import GameFinishService
 from .google_cloud_storage_service import GoogleCloudStorageService
 from .password_hasher import PasswordHasher
+from .settlement_queue import SettlementQueue
@@ -0,0 +1,117 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple
+
+from infrastructure.logging.logging_config import get_logger
+
+logger = get_logger("application.bounded_executor")
+
+# Hilos dedicados a trabajo de CPU que libera el GIL (ej. bcrypt)
+DEFAULT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# Trabajos en espera o en curso a partir de los cuales se rechazan nuevos
+DEFAULT_MAX_PENDING = 64
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """El ejecutor alcanzó su límite de trabajos pendientes"""
+
+
+class BoundedExecutor:
+    """
+    Pool de hilos de tamaño fijo con límite de trabajos pendientes.
+
+    Saca del event loop las llamadas bloqueantes y expone la profundidad de
+    la cola y los tiempos de espera; cuando la cola se llena rechaza trabajo
+    en lugar de acumular latencia.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=name
+        )
+        self._lock = threading.Lock()
+
+        # Métricas
+        self.pending = 0
+        self.running = 0
+        self.max_queue_depth = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_run = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Trabajos esperando un hilo libre"""
+        return max(self.pending - self.running, 0)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Ejecuta func(*args) en el pool y espera su resultado"""
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            logger.warning(
+                f"Executor {self.name} saturated ({self.pending} pending), "
+                f"rejecting work"
+            )
+            raise ExecutorSaturatedError(f"Executor {self.name} is saturated")
+
+        self.pending += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        submitted_at = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result, started_at, finished_at = await loop.run_in_executor(
+                self._executor, self._timed, func, args
+            )
+        finally:
+            self.pending -= 1
+
+        wait = started_at - submitted_at
+        self.completed += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.total_run += finished_at - started_at
+        return result
+
+    def _timed(self, func: Callable[..., Any], args: tuple) -> Tuple[Any, float, float]:
+        """Se ejecuta en el hilo: registra cuándo empezó y terminó el trabajo"""
+        started_at = time.perf_counter()
+        with self._lock:
+            self.running += 1
+        try:
+            return func(*args), started_at, time.perf_counter()
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        completed = self.completed or 1
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "running": self.running,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.total_wait / completed * 1000, 3),
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+            "avg_run_ms": round(self.total_run / completed * 1000, 3),
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
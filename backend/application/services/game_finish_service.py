@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from application.use_cases.match.finish_match import FinishMatchUseCase
 from dtos.request.match.match_request_dto import (
@@ -7,6 +7,8 @@ from dtos.request.match.match_request_dto import (
 )
 from infrastructure.logging.logging_config import get_logger
 
+from .settlement_queue import OnSettled, SettlementQueue
+
 # Alias para mayor claridad
 
 logger = get_logger("application.game_finish_service")
@@ -20,12 +22,96 @@ class GameFinishService:
     1. Receives game finish events from WebSocket
     2. Calls the FinishMatchUseCase to persist the results
     3. Broadcasts the results to all connected players
+
+    When a settlement queue is provided, automatic finishes are settled in
+    the background instead of on the WebSocket coroutine.
     """
 
-    def __init__(self, finish_match_use_case: FinishMatchUseCase):
+    def __init__(
+        self,
+        finish_match_use_case: FinishMatchUseCase,
+        settlement_queue: Optional[SettlementQueue] = None,
+    ):
         self.finish_match_use_case = finish_match_use_case
+        self.settlement_queue = settlement_queue
         self.logger = logger
 
+    async def schedule_game_finished(
+        self,
+        match_id: str,
+        participants_data: List[Dict[str, Any]],
+        websocket_manager=None,
+        on_settled: Optional[OnSettled] = None,
+    ) -> bool:
+        """
+        Queue the match settlement without waiting for it.
+
+        The settlement queue broadcasts the game_over message when done and
+        then calls on_settled with it. Without a queue the match is settled
+        inline, as handle_game_finished does.
+
+        Returns:
+            False if the match was already queued or settled
+        """
+        if self.settlement_queue:
+            return self.settlement_queue.submit(
+                match_id, participants_data, websocket_manager, on_settled
+            )
+
+        message = await self.handle_game_finished(
+            match_id, participants_data, websocket_manager
+        )
+        if on_settled:
+            await on_settled(message)
+        return True
+
+    async def finish_match(
+        self, match_id: str, participants_data: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Persist the match results and build the game_over message.
+
+        Args:
+            match_id: The match that finished
+            participants_data: List of participants with their scores
+
+        Returns:
+            Dict with the game_over message to broadcast
+        """
+        self.logger.info(f"Processing game finish for match {match_id}")
+
+        # Convert participants data to DTO format
+        participants_dto = [
+            MatchParticipationInputDTO(user_id=p["user_id"], score=p["score"])
+            for p in participants_data
+        ]
+
+        participation_results = MatchParticipationResultsDTO(
+            participants=participants_dto
+        )
+
+        # Execute the use case to persist the results
+        finished_match = await self.finish_match_use_case.execute(
+            match_id=match_id, participation_data=participation_results
+        )
+
+        self.logger.info(
+            f"Match {match_id} finished successfully. Winner: {finished_match.winner_id}"
+        )
+
+        return {
+            "type": "game_over",
+            "match_id": match_id,
+            "winner_id": finished_match.winner_id,
+            "final_scores": participants_data,
+            "match_data": (
+                finished_match.model_dump()
+                if hasattr(finished_match, "model_dump")
+                else finished_match.__dict__
+            ),
+            "message": "¡El juego ha finalizado correctamente!",
+        }
+
     async def handle_game_finished(
         self,
         match_id: str,
@@ -45,40 +131,7 @@ class GameFinishService:
             Dict with the finished match data
         """
         try:
-            self.logger.info(f"Processing game finish for match {match_id}")
-
-            # Convert participants data to DTO format
-            participants_dto = [
-                MatchParticipationInputDTO(user_id=p["user_id"], score=p["score"])
-                for p in participants_data
-            ]
-
-            participation_results = MatchParticipationResultsDTO(
-                participants=participants_dto
-            )
-
-            # Execute the use case to persist the results
-            finished_match = await self.finish_match_use_case.execute(
-                match_id=match_id, participation_data=participation_results
-            )
-
-            self.logger.info(
-                f"Match {match_id} finished successfully. Winner: {finished_match.winner_id}"
-            )
-
-            # Prepare broadcast message
-            broadcast_message = {
-                "type": "game_over",
-                "match_id": match_id,
-                "winner_id": finished_match.winner_id,
-                "final_scores": participants_data,
-                "match_data": (
-                    finished_match.model_dump()
-                    if hasattr(finished_match, "model_dump")
-                    else finished_match.__dict__
-                ),
-                "message": "¡El juego ha finalizado correctamente!",
-            }
+            broadcast_message = await self.finish_match(match_id, participants_data)
 
             # Broadcast to all connected players
             if websocket_manager:
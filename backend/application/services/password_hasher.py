@@ -1,12 +1,23 @@
+from typing import Callable, Optional
+
 from application.mixins import LoggingMixin
 from domain.exceptions import DomainException
 from domain.interfaces import IPasswordHasher
 
+from .bounded_executor import BoundedExecutor, ExecutorSaturatedError
+
 
 class PasswordHasher(IPasswordHasher, LoggingMixin):
-    def __init__(self, hasher):
+    def __init__(self, hasher, executor: Optional[BoundedExecutor] = None):
         super().__init__()
         self._pwd_context = hasher
+        # bcrypt tarda decenas de ms por llamada: las variantes async lo
+        # ejecutan en un pool acotado para no congelar el event loop
+        self._executor = executor
+
+    @property
+    def executor(self) -> Optional[BoundedExecutor]:
+        return self._executor
 
     def verify(self, plain_password: str, hashed_password: str) -> bool:
         self.logger.debug("Verifying password hash")
@@ -33,3 +44,21 @@ class PasswordHasher(IPasswordHasher, LoggingMixin):
             raise DomainException(
                 "Password hashing failed", 500, "password_hashing_error"
             )
+
+    async def averify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(self.verify, plain_password, hashed_password)
+
+    async def ahash(self, password: str) -> str:
+        return await self._run(self.hash, password)
+
+    async def _run(self, func: Callable, *args):
+        if self._executor is None:
+            return func(*args)
+        try:
+            return await self._executor.run(func, *args)
+        except ExecutorSaturatedError:
+            raise DomainException(
+                "Too many authentication requests, try again later",
+                503,
+                "password_hasher_busy",
+            )
@@ -0,0 +1,228 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, AsyncContextManager, Awaitable, Callable, Dict, List, Optional
+
+from domain.exceptions import DomainException
+from infrastructure.logging.logging_config import get_logger
+from infrastructure.metrics import SETTLEMENT_DURATION
+
+logger = get_logger("application.settlement_queue")
+
+# Workers que liquidan partidas en paralelo (cada uno con su propia sesión)
+SETTLEMENT_WORKERS = 4
+
+# Reintentos ante errores transitorios (ej. base de datos no disponible)
+SETTLEMENT_MAX_ATTEMPTS = 3
+SETTLEMENT_RETRY_DELAY = 0.5
+
+# Partidas liquidadas que se recuerdan para descartar duplicados
+SETTLED_HISTORY_SIZE = 10_000
+
+PENDING = "pending"
+RUNNING = "running"
+SETTLED = "settled"
+
+OnSettled = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class SettlementJob:
+    match_id: str
+    participants_data: List[Dict[str, Any]]
+    websocket_manager: Any = None
+    on_settled: Optional[OnSettled] = None
+    attempts: int = 0
+
+
+class SettlementQueue:
+    """
+    Cola en proceso para liquidar partidas terminadas fuera del hilo de juego.
+
+    Un grupo fijo de workers consume la cola, de modo que una ráfaga de
+    partidas terminadas nunca abre más de SETTLEMENT_WORKERS sesiones a la vez.
+    Los trabajos son idempotentes por match_id: mientras una partida está
+    pendiente, en curso o ya liquidada, los duplicados se descartan.
+    """
+
+    def __init__(
+        self,
+        finish_service_factory: Callable[[], AsyncContextManager[Any]],
+        workers: int = SETTLEMENT_WORKERS,
+        max_attempts: int = SETTLEMENT_MAX_ATTEMPTS,
+        retry_delay: float = SETTLEMENT_RETRY_DELAY,
+    ):
+        self.finish_service_factory = finish_service_factory
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._status: "OrderedDict[str, str]" = OrderedDict()
+
+        # Métricas
+        self.settled = 0
+        self.failed = 0
+        self.retries = 0
+        self.duplicates = 0
+
+    def submit(
+        self,
+        match_id: str,
+        participants_data: List[Dict[str, Any]],
+        websocket_manager=None,
+        on_settled: Optional[OnSettled] = None,
+    ) -> bool:
+        """Encola la liquidación de una partida; retorna False si es un duplicado"""
+        if match_id in self._status:
+            self.duplicates += 1
+            logger.info(
+                f"Settlement for match {match_id} ignored "
+                f"(already {self._status[match_id]})"
+            )
+            return False
+
+        self._ensure_workers()
+        self._status[match_id] = PENDING
+        self._queue.put_nowait(
+            SettlementJob(match_id, participants_data, websocket_manager, on_settled)
+        )
+        logger.info(
+            f"Settlement for match {match_id} queued "
+            f"(queue depth: {self._queue.qsize()})"
+        )
+        return True
+
+    def get_status(self, match_id: str) -> Optional[str]:
+        """Obtiene el estado de liquidación de una partida"""
+        return self._status.get(match_id)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Obtiene métricas de la cola de liquidación"""
+        return {
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "running": sum(1 for s in self._status.values() if s == RUNNING),
+            "settled": self.settled,
+            "failed": self.failed,
+            "retries": self.retries,
+            "duplicates": self.duplicates,
+        }
+
+    async def stop(self):
+        """Espera a que se liquiden los trabajos pendientes y detiene los workers"""
+        if not self._worker_tasks:
+            return
+        await self._queue.join()
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        logger.info("Settlement workers stopped")
+
+    def _ensure_workers(self):
+        """Inicia los workers la primera vez que se encola un trabajo"""
+        if self._worker_tasks:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"settlement-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"Started {self.workers} settlement workers")
+
+    async def _worker(self):
+        while True:
+            job: SettlementJob = await self._queue.get()
+            try:
+                await self._run_job(job)
+            except Exception as e:
+                logger.error(
+                    f"Unexpected error settling match {job.match_id}: {str(e)}"
+                )
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job: SettlementJob):
+        """Liquida una partida, reintentando ante errores transitorios"""
+        self._status[job.match_id] = RUNNING
+        started_at = time.perf_counter()
+
+        while True:
+            job.attempts += 1
+            try:
+                async with self.finish_service_factory() as finish_service:
+                    message = await finish_service.finish_match(
+                        job.match_id, job.participants_data
+                    )
+                break
+            except DomainException as e:
+                # Errores de negocio: reintentar daría el mismo resultado
+                await self._fail(job, e, started_at)
+                return
+            except Exception as e:
+                if job.attempts >= self.max_attempts:
+                    await self._fail(job, e, started_at)
+                    return
+                self.retries += 1
+                delay = self.retry_delay * 2 ** (job.attempts - 1)
+                logger.warning(
+                    f"Settlement attempt {job.attempts} for match {job.match_id} "
+                    f"failed: {str(e)}. Retrying in {delay}s"
+                )
+                await asyncio.sleep(delay)
+
+        self._mark_settled(job.match_id)
+        self.settled += 1
+        SETTLEMENT_DURATION.labels(SETTLED).observe(time.perf_counter() - started_at)
+        logger.info(
+            f"Match {job.match_id} settled after {job.attempts} attempt(s). "
+            f"Winner: {message.get('winner_id')}"
+        )
+
+        await self._broadcast(job, message)
+        if job.on_settled:
+            await job.on_settled(message)
+
+    async def _fail(self, job: SettlementJob, error: Exception, started_at: float):
+        """Registra un fallo definitivo y avisa a los jugadores"""
+        # Se olvida la partida para permitir volver a intentarlo más tarde
+        self._status.pop(job.match_id, None)
+        self.failed += 1
+        SETTLEMENT_DURATION.labels("failed").observe(time.perf_counter() - started_at)
+        logger.error(
+            f"Settlement for match {job.match_id} failed after "
+            f"{job.attempts} attempt(s): {type(error).__name__}: {str(error)}"
+        )
+        logger.error(f"Participants data: {job.participants_data}")
+
+        await self._broadcast(
+            job,
+            {
+                "type": "game_finish_error",
+                "match_id": job.match_id,
+                "error": "Failed to finish game properly",
+                "details": str(error),
+            },
+        )
+
+    def _mark_settled(self, match_id: str):
+        self._status[match_id] = SETTLED
+        self._status.move_to_end(match_id)
+        while len(self._status) > SETTLED_HISTORY_SIZE:
+            oldest_id, status = next(iter(self._status.items()))
+            if status != SETTLED:
+                break
+            self._status.pop(oldest_id)
+
+    async def _broadcast(self, job: SettlementJob, message: Dict[str, Any]):
+        if not job.websocket_manager:
+            return
+        try:
+            await job.websocket_manager.broadcast(job.match_id, message)
+        except Exception as e:
+            logger.error(
+                f"Failed to broadcast settlement result for match "
+                f"{job.match_id}: {str(e)}"
+            )
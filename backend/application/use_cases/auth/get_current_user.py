@@ -1,9 +1,12 @@
+from typing import Optional
+
 from application.mixins.dto_converter_mixin import EntityToDTOConverter
 from domain.exceptions import InvalidTokenError, UserNotFoundError
 from domain.interfaces import BaseUseCase, ITokenProvider
 from domain.repositories import IUserRepository
 from dtos.response.user import UserResponseDTO
-from infrastructure.logging import log_execution, log_performance
+from infrastructure.cache import PrincipalCache
+from infrastructure.logging import bind_log_context, log_execution, log_performance
 
 
 class GetCurrentUserUseCase(BaseUseCase[str, UserResponseDTO]):
@@ -14,11 +17,13 @@ class GetCurrentUserUseCase(BaseUseCase[str, UserResponseDTO]):
         user_repo: IUserRepository,
         token_provider: ITokenProvider,
         user_converter: EntityToDTOConverter,
+        principal_cache: Optional[PrincipalCache] = None,
     ):
         super().__init__()
         self.user_repo = user_repo
         self.token_provider = token_provider
         self.converter = user_converter
+        self.principal_cache = principal_cache
 
     @log_execution(include_args=False, include_result=False, log_level="DEBUG")
     @log_performance(threshold_seconds=1.0)
@@ -39,6 +44,14 @@ class GetCurrentUserUseCase(BaseUseCase[str, UserResponseDTO]):
         """
         self.logger.debug("Authenticating user from token")
 
+        # Un token ya verificado se resuelve sin decodificar ni consultar la BD
+        if self.principal_cache is not None:
+            cached_user = self.principal_cache.get(token)
+            if cached_user is not None:
+                bind_log_context(user_id=cached_user.user_id)
+                return cached_user
+            generation = self.principal_cache.generation
+
         # Decodificar token
         self.logger.debug("Decoding JWT token")
         payload = self.token_provider.decode_token(token)
@@ -61,4 +74,9 @@ class GetCurrentUserUseCase(BaseUseCase[str, UserResponseDTO]):
             raise UserNotFoundError(f"User with ID {user_id} not found")
 
         self.logger.info(f"User authenticated successfully: {user_id}")
-        return self.converter.to_dto(user)
+        bind_log_context(user_id=user_id)
+        user_dto = self.converter.to_dto(user)
+
+        if self.principal_cache is not None:
+            self.principal_cache.set(token, user_id, user_dto, payload.exp, generation)
+        return user_dto
@@ -59,7 +59,7 @@ class LoginUserUseCase(BaseUseCase[LoginRequestDTO, LoginResponseDTO]):
             raise AuthenticationError("Invalid credentials")
 
         # Verificar contraseña
-        self._validate_credentials(login_request.password, user.hashed_password)
+        await self._validate_credentials(login_request.password, user.hashed_password)
 
         # Generar token
         self.logger.debug(f"Generating token for user: {user.email}")
@@ -72,7 +72,7 @@ class LoginUserUseCase(BaseUseCase[LoginRequestDTO, LoginResponseDTO]):
         # Usar converters para mantener consistencia arquitectónica
         return self.login_assembler.assemble(user, token_data)
 
-    def _validate_credentials(self, password: str, hashed: str) -> None:
+    async def _validate_credentials(self, password: str, hashed: str) -> None:
         """Valida las credenciales del usuario."""
-        if not self.password_hasher.verify(password, hashed):
+        if not await self.password_hasher.averify(password, hashed):
             raise AuthenticationError("Invalid credentials")
@@ -45,7 +45,7 @@ class RegisterUserUseCase(BaseUseCase[UserCreateRequestDTO, UserBaseResponseDTO]
 
         self.logger.debug(f"Password hashing for user: {request.email}")
         # Hash de la contraseña
-        hashed_password = self.password_hasher.hash(request.password)
+        hashed_password = await self.password_hasher.ahash(request.password)
         self.logger.debug(f"Password hashed successfully for user: {request.email}")
 
         # Crear nueva entidad de usuario
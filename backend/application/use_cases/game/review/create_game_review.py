@@ -1,6 +1,7 @@
 from application.mixins.dto_converter_mixin import BidirectionalConverter
 from domain.entities.game.game_review import GameReviewEntity
 from domain.interfaces.base_use_case import BaseUseCase
+from domain.repositories.game_repository import IGameRepository
 from domain.repositories.game_review_repository import IGameReviewRepository
 from dtos.request.game.game_review_request import CreateGameReviewRequestDTO
 from dtos.response.game.game_review_response import GameReviewResponseDTO
@@ -15,6 +16,7 @@ class CreateGameReviewUseCase(
         self,
         user: UserBaseResponseDTO,
         review_repository: IGameReviewRepository,
+        game_repository: IGameRepository,
         game_review_converter: BidirectionalConverter[
             GameReviewEntity, GameReviewResponseDTO
         ],
@@ -22,6 +24,7 @@ class CreateGameReviewUseCase(
         super().__init__()
         self.user = user
         self.review_repository = review_repository
+        self.game_repository = game_repository
         self.converter = game_review_converter
 
     @log_execution(include_args=False, include_result=True, log_level="INFO")
@@ -40,6 +43,13 @@ class CreateGameReviewUseCase(
         new_review.user_id = self.user.user_id
         new_review.game_id = game_id
 
+        # Ajustar los agregados del juego; se confirman en la misma
+        # transacción que la review (y se revierten si save falla).
+        # La calificación se guarda como entero
+        await self.game_repository.apply_review_change(
+            game_id, 1, int(new_review.rating)
+        )
+
         # Guardar la review en el repositorio (save method handles duplicate check)
         saved_review = await self.review_repository.save(new_review)
 
@@ -1,6 +1,7 @@
 from domain.exceptions.auth import AuthenticationError
 from domain.exceptions.game import GameReviewNotFoundError
 from domain.interfaces.base_use_case import BaseUseCase
+from domain.repositories.game_repository import IGameRepository
 from domain.repositories.game_review_repository import IGameReviewRepository
 from dtos.request.game.game_review_request import CreateGameReviewRequestDTO
 from dtos.response.game.game_review_response import GameReviewResponseDTO
@@ -15,10 +16,12 @@ class DeleteGameReviewUseCase(
         self,
         user: UserBaseResponseDTO,
         review_repository: IGameReviewRepository,
+        game_repository: IGameRepository,
     ):
         super().__init__()
         self.user = user
         self.review_repository = review_repository
+        self.game_repository = game_repository
 
     @log_execution(include_args=False, include_result=True, log_level="INFO")
     @log_performance(threshold_seconds=2.0)
@@ -27,7 +30,10 @@ class DeleteGameReviewUseCase(
             f"Deleting review for game {game_review_id} by user {self.user.user_id}"
         )
 
-        existing_review = await self.review_repository.get_by_id(game_review_id)
+        # Bloquear la reseña: se descuenta la calificación vigente
+        existing_review = await self.review_repository.get_by_id_for_update(
+            game_review_id
+        )
 
         if not existing_review:
             self.logger.error(
@@ -41,6 +47,11 @@ class DeleteGameReviewUseCase(
             )
             raise AuthenticationError("User is not authorized to delete this review")
 
+        # Descontar la reseña de los agregados del juego; delete confirma ambos
+        await self.game_repository.apply_review_change(
+            existing_review.game_id, -1, -existing_review.rating
+        )
+
         # Lógica para eliminar la reseña
         await self.review_repository.delete(game_review_id)
 
@@ -3,6 +3,7 @@ from domain.entities.game.game_review import GameReviewEntity
 from domain.exceptions.auth import AuthenticationError
 from domain.exceptions.game import GameReviewNotFoundError
 from domain.interfaces.base_use_case import BaseUseCase
+from domain.repositories.game_repository import IGameRepository
 from domain.repositories.game_review_repository import IGameReviewRepository
 from dtos.request.game.game_review_request import UpdateGameReviewRequestDTO
 from dtos.response.game.game_review_response import GameReviewResponseDTO
@@ -17,6 +18,7 @@ class UpdateGameReviewUseCase(
         self,
         user: UserBaseResponseDTO,
         review_repository: IGameReviewRepository,
+        game_repository: IGameRepository,
         game_review_converter: BidirectionalConverter[
             GameReviewEntity, GameReviewResponseDTO
         ],
@@ -24,6 +26,7 @@ class UpdateGameReviewUseCase(
         super().__init__()
         self.user = user
         self.review_repository = review_repository
+        self.game_repository = game_repository
         self.converter = game_review_converter
 
     @log_execution(include_args=False, include_result=True, log_level="INFO")
@@ -33,8 +36,9 @@ class UpdateGameReviewUseCase(
     ) -> GameReviewResponseDTO:
         self.logger.info(f"Updating review {review_id} by user {self.user.user_id}")
 
-        # Buscar la reseña existente
-        existing_review = await self.review_repository.get_by_id(review_id)
+        # Buscar la reseña existente y bloquearla: la diferencia de
+        # calificación se calcula sobre el valor vigente
+        existing_review = await self.review_repository.get_by_id_for_update(review_id)
         if not existing_review:
             self.logger.error(f"Review {review_id} not found")
             raise GameReviewNotFoundError(f"Review with ID {review_id} not found")
@@ -46,6 +50,15 @@ class UpdateGameReviewUseCase(
             )
             raise AuthenticationError("You can only update your own reviews")
 
+        # Ajustar la suma de calificaciones del juego antes del commit de la
+        # reseña (la calificación se guarda como entero)
+        if update_dto.rating is not None:
+            rating_delta = int(update_dto.rating) - existing_review.rating
+            if rating_delta:
+                await self.game_repository.apply_review_change(
+                    existing_review.game_id, 0, rating_delta
+                )
+
         existing_review.comment = update_dto.comment
         existing_review.rating = update_dto.rating
 
@@ -5,6 +5,7 @@ from .finish_match import FinishMatchUseCase
 from .get_all_matches_by_game_id import GetMatchesByGameIdUseCase
 from .get_match_by_id import GetMatchByIdUseCase
 from .get_match_participants import GetMatchParticipantsUseCase
+from .get_open_matches_by_game_id import GetOpenMatchesByGameIdUseCase
 from .join_match import JoinMatchUseCase
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "JoinMatchUseCase",
     "FinishMatchUseCase",
     "GetMatchParticipantsUseCase",
+    "GetOpenMatchesByGameIdUseCase",
 ]
@@ -6,7 +6,6 @@ from domain.interfaces.base_use_case import BaseUseCase
 from domain.repositories.game_repository import IGameRepository
 from domain.repositories.match_repository import IMatchRepository
 from domain.repositories.user_repository import IUserRepository
-from domain.services.user_balance_service import UserBalanceService
 from dtos.request.match.match_request_dto import CreateMatchRequestDTO
 from dtos.response.match.match_response import MatchResponseDTO
 from dtos.response.user.user_response import UserResponseDTO
@@ -55,21 +54,6 @@ class CreateMatchUseCase(BaseUseCase[CreateMatchRequestDTO, MatchResponseDTO]):
             f"Creating match for game {match_data} by user {self.user.user_id}"
         )
 
-        # Validar que el usuario tiene saldo suficiente para crear la partida
-        if not UserBalanceService.has_sufficient_balance(
-            self.user, match_data.base_bet_amount
-        ):
-            self.logger.warning(
-                f"User {self.user.user_id} has insufficient balance. "
-                f"Required: {match_data.base_bet_amount}, Available: {self.user.virtual_currency}"
-            )
-            raise InsufficientBalanceError(
-                self.user.virtual_currency,
-                match_data.base_bet_amount,
-                f"Insufficient balance to create match. Required: {match_data.base_bet_amount}, "
-                f"Available: {self.user.virtual_currency}",
-            )
-
         # Validar que el juego existe
         game = await self.game_repo.get_by_id(game_id)
         if not game:
@@ -79,24 +63,32 @@ class CreateMatchUseCase(BaseUseCase[CreateMatchRequestDTO, MatchResponseDTO]):
         # Crear entidad de partida usando el converter
         match_entity = self.match_converter.to_entity(match_data)
 
-        # Deducir el monto de la apuesta del balance del usuario
-
-        # Obtener la entidad completa del usuario para actualizar
-        user_entity = await self.user_repo.get_by_id(self.user.user_id)
+        match_entity.created_by_id = self.user.user_id
+        match_entity.game_id = game_id
 
-        UserBalanceService.deduct_balance(user_entity, match_data.base_bet_amount)
+        match_entity.add_participant(self.user.user_id)
 
-        await self.user_repo.update(self.user.user_id, user_entity)
+        # Descontar la apuesta de forma atómica; se confirma junto con la
+        # creación de la partida en la misma transacción
+        new_balance = await self.user_repo.debit_if_sufficient(
+            self.user.user_id, match_data.base_bet_amount
+        )
+        if new_balance is None:
+            self.logger.warning(
+                f"User {self.user.user_id} has insufficient balance. "
+                f"Required: {match_data.base_bet_amount}, Available: {self.user.virtual_currency}"
+            )
+            raise InsufficientBalanceError(
+                self.user.virtual_currency,
+                match_data.base_bet_amount,
+                f"Insufficient balance to create match. Required: {match_data.base_bet_amount}, "
+                f"Available: {self.user.virtual_currency}",
+            )
 
         self.logger.info(
-            f"Deducted {match_data.base_bet_amount} from user {user_entity.user_id} balance"
+            f"Deducted {match_data.base_bet_amount} from user {self.user.user_id} balance"
         )
 
-        match_entity.created_by_id = user_entity.user_id
-        match_entity.game_id = game_id
-
-        match_entity.add_participant(user_entity.user_id)
-
         created_match = await self.match_repo.save(match_entity)
 
         self.logger.info(
@@ -0,0 +1,37 @@
+from application.mixins.dto_converter_mixin import EntityToDTOConverter
+from domain.exceptions.game import GameNotFoundError
+from domain.interfaces.base_use_case import BaseUseCase
+from domain.repositories.game_repository import IGameRepository
+from domain.repositories.match_repository import IMatchRepository
+from dtos.response.match.match_response import MatchResponseDTO
+from infrastructure.logging import log_execution, log_performance
+
+
+class GetOpenMatchesByGameIdUseCase(BaseUseCase):
+    """Caso de uso para el lobby: partidas abiertas a las que unirse."""
+
+    def __init__(
+        self,
+        match_repo: IMatchRepository,
+        game_repo: IGameRepository,
+        match_converter: EntityToDTOConverter,
+    ):
+        super().__init__()
+        self.match_repo = match_repo
+        self.game_repo = game_repo
+        self.converter = match_converter
+
+    @log_execution(include_args=True, include_result=False, log_level="INFO")
+    @log_performance(threshold_seconds=2.0)
+    async def execute(self, game_id, pagination) -> tuple[list[MatchResponseDTO], int]:
+        game = await self.game_repo.get_by_id(game_id)
+        if not game:
+            self.logger.error(f"Game not found: {game_id}")
+            raise GameNotFoundError(f"Game with ID {game_id} not found")
+
+        matches, count = await self.match_repo.get_open_by_game_id(
+            game_id, game.game_capacity, pagination
+        )
+        self.logger.debug(f"Found {len(matches)} open matches for game {game_id}")
+
+        return self.converter.to_dto_list(matches, game), count
@@ -5,7 +5,6 @@ from domain.exceptions.user import InsufficientBalanceError
 from domain.interfaces.base_use_case import BaseUseCase
 from domain.repositories import IGameRepository, IMatchRepository, IUserRepository
 from domain.services.match_service import MatchService
-from domain.services.user_balance_service import UserBalanceService
 from dtos.response.match.match_response import MatchResponseDTO
 from dtos.response.user.user_response import UserResponseDTO
 from infrastructure.logging import log_execution, log_performance
@@ -58,20 +57,6 @@ class JoinMatchUseCase(BaseUseCase[str, MatchResponseDTO]):
             self.logger.error(f"Match with ID {match_id} not found")
             raise MatchNotFoundError(f"Match with ID {match_id} not found")
 
-        if not UserBalanceService.has_sufficient_balance(
-            self.user, match.base_bet_amount
-        ):
-            self.logger.warning(
-                f"User {self.user.user_id} has insufficient balance. "
-                f"Required: {match.base_bet_amount}, Available: {self.user.virtual_currency}"
-            )
-            raise InsufficientBalanceError(
-                self.user.virtual_currency,
-                match.base_bet_amount,
-                f"Insufficient balance to join match. Required: {match.base_bet_amount}, "
-                f"Available: {self.user.virtual_currency}",
-            )
-
         game = await self.game_repo.get_by_id(match.game_id)
         if not game:
             self.logger.error(f"Game not found for match: {match_id}")
@@ -81,19 +66,36 @@ class JoinMatchUseCase(BaseUseCase[str, MatchResponseDTO]):
             self.logger.error(f"Match {match_id} is full")
             raise MatchJoinError("Match is already full")
 
-        # Obtener la entidad completa del usuario para actualizar
-        user_entity = await self.user_repo.get_by_id(self.user.user_id)
+        match.add_participant(self.user.user_id)
 
-        UserBalanceService.deduct_balance(user_entity, match.base_bet_amount)
+        # Ocupar el lugar de forma atómica (se confirma con el resto)
+        if not await self.match_repo.reserve_participant_slot(
+            match_id, game.game_capacity
+        ):
+            self.logger.error(f"Match {match_id} is full or finished")
+            raise MatchJoinError("Match is already full")
 
-        await self.user_repo.update(self.user.user_id, user_entity)
+        # Descontar la apuesta de forma atómica; se confirma junto con la
+        # actualización de la partida en la misma transacción
+        new_balance = await self.user_repo.debit_if_sufficient(
+            self.user.user_id, match.base_bet_amount
+        )
+        if new_balance is None:
+            self.logger.warning(
+                f"User {self.user.user_id} has insufficient balance. "
+                f"Required: {match.base_bet_amount}, Available: {self.user.virtual_currency}"
+            )
+            raise InsufficientBalanceError(
+                self.user.virtual_currency,
+                match.base_bet_amount,
+                f"Insufficient balance to join match. Required: {match.base_bet_amount}, "
+                f"Available: {self.user.virtual_currency}",
+            )
 
         self.logger.info(
-            f"Deducted {match.base_bet_amount} from self.user {self.user.user_id} balance"
+            f"Deducted {match.base_bet_amount} from user {self.user.user_id} balance"
         )
 
-        match.add_participant(user_entity.user_id)
-
         updated_match = await self.match_repo.update(match_id, match)
 
         self.logger.info(
@@ -1,5 +1,5 @@
 from .game import CategoryEntity, GameEntity
-from .match import MatchEntity
+from .match import MatchEntity, MatchSettlement
 from .transfer import TransferPaymentEntity
 from .user import TokenData, UserEntity
 from .app_info import AppInfoEntity
\ No newline at end of file
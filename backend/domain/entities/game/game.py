@@ -21,6 +21,10 @@ class GameEntity(TimeStampEntityMixin):
         game_type: Optional[str] = None,
         created_at: Optional[str] = None,
         updated_at: Optional[str] = None,
+        review_count: Optional[int] = None,
+        average_rating: Optional[float] = None,
+        open_match_count: Optional[int] = None,
+        total_match_count: Optional[int] = None,
     ):
         super().__init__(created_at, updated_at)
 
@@ -36,5 +40,11 @@ class GameEntity(TimeStampEntityMixin):
         self.house_odds = house_odds
         self.game_type = game_type
 
+        # Estadísticas calculadas por el repositorio (None si no se cargaron)
+        self.review_count = review_count
+        self.average_rating = average_rating
+        self.open_match_count = open_match_count
+        self.total_match_count = total_match_count
+
     def __repr__(self):
         return f"GameEntity(game_id={self.game_id}, game_name='{self.game_name}')"
@@ -1 +1,2 @@
 from .match import MatchEntity
+from .match_settlement import MatchSettlement
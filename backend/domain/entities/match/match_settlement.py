@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from .match import MatchEntity
+
+
+@dataclass
+class MatchSettlement:
+    """Resultado de liquidar una partida en una sola transacción"""
+
+    match: MatchEntity
+    house_odds: Optional[float]
+    reward: float = 0.0
+    winner_balance: Optional[float] = None
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -6,6 +7,7 @@ class TokenData:
     """Entidad que representa los datos internos del token"""
 
     sub: str  # Subject (identificador del usuario)
+    exp: Optional[float] = None  # Expiración (timestamp UNIX), si se conoce
 
     def __post_init__(self):
         """Validaciones de la entidad"""
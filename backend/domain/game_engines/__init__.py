@@ -1,2 +1,3 @@
 from .connect4 import Conecta4Game
+from .connect4_bitboard import Conecta4BitboardGame
 from .tictactoe import TictactoeGame
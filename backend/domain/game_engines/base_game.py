@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Tuple
 
 
 class BaseGameEngine(ABC):
@@ -17,3 +18,48 @@ class BaseGameEngine(ABC):
     @abstractmethod
     def check_winner(self):
         ...
+
+
+class SnapshotCacheMixin:
+    """
+    Instantáneas del tablero y del estado que solo se reconstruyen cuando
+    cambia move_count.
+
+    Requiere board, numeric_board, move_count y _build_game_state(). Las
+    instantáneas del tablero son tuplas inmutables; get_game_state devuelve
+    una copia del diccionario para que ningún llamador altere la compartida.
+    """
+
+    def __init__(self):
+        self._board_snapshot_move_count = -1
+        self._board_snapshot: Tuple[Tuple[str, ...], ...] = ()
+        self._numeric_board_snapshot: Tuple[Tuple[int, ...], ...] = ()
+        self._game_state_move_count = -1
+        self._game_state_snapshot: Dict[str, Any] = {}
+        super().__init__()
+
+    @abstractmethod
+    def _build_game_state(self) -> Dict[str, Any]:
+        """Construye el diccionario con el estado completo del juego"""
+
+    def get_game_state(self) -> Dict[str, Any]:
+        """Retorna el estado completo del juego"""
+        if self._game_state_move_count != self.move_count:
+            self._game_state_snapshot = self._build_game_state()
+            self._game_state_move_count = self.move_count
+        return dict(self._game_state_snapshot)
+
+    def get_board(self) -> Tuple[Tuple[int, ...], ...]:
+        """Retorna el tablero numérico (R -> 1, Y -> 2, vacío -> 0)"""
+        self._get_board_snapshot()
+        return self._numeric_board_snapshot
+
+    def _get_board_snapshot(self) -> Tuple[Tuple[str, ...], ...]:
+        """Reconstruye las instantáneas inmutables del tablero si hubo movimientos"""
+        if self._board_snapshot_move_count != self.move_count:
+            self._board_snapshot = tuple(tuple(row) for row in self.board)
+            self._numeric_board_snapshot = tuple(
+                tuple(row) for row in self.numeric_board
+            )
+            self._board_snapshot_move_count = self.move_count
+        return self._board_snapshot
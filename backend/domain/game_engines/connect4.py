@@ -1,9 +1,9 @@
 from typing import Any, Dict, List, Optional
 
-from .base_game import BaseGameEngine
+from .base_game import BaseGameEngine, SnapshotCacheMixin
 
 
-class Conecta4Game(BaseGameEngine):
+class Conecta4Game(SnapshotCacheMixin, BaseGameEngine):
     def __init__(self):
         # Inicializar propiedades específicas del juego primero
         self.rows = 6
@@ -23,6 +23,10 @@ class Conecta4Game(BaseGameEngine):
         self.winning_positions = []
         self.players = {"R": "Rojo", "Y": "Amarillo"}
 
+        # Vista numérica del tablero (R -> 1, Y -> 2, vacío -> 0),
+        # actualizada celda por celda en cada movimiento
+        self.numeric_board = [[0] * self.columns for _ in range(self.rows)]
+
         # Llamar al constructor padre después de inicializar propiedades
         super().__init__()
 
@@ -47,6 +51,7 @@ class Conecta4Game(BaseGameEngine):
         # Colocar la pieza
         row = self.curr_columns[col]
         self.board[row][col] = self.current_player
+        self.numeric_board[row][col] = 1 if self.current_player == "R" else 2
         self.move_count += 1
 
         # Actualizar disponibilidad de columna
@@ -62,7 +67,7 @@ class Conecta4Game(BaseGameEngine):
             "column": col,
             "player": self.current_player,
             "move_count": self.move_count,
-            "board": self.board,
+            "board": self._get_board_snapshot(),
             "game_over": self.game_over,
             "winner": self.winner,
             "winning_positions": self.winning_positions,
@@ -137,16 +142,15 @@ class Conecta4Game(BaseGameEngine):
         self.game_over = True
         self.winner = winner_symbol
 
-    def get_game_state(self) -> Dict[str, Any]:
-        """Retorna el estado completo del juego"""
+    def _build_game_state(self) -> Dict[str, Any]:
         return {
-            "board": self.board,
+            "board": self._get_board_snapshot(),
             "current_player": self.current_player,
             "move_count": self.move_count,
             "game_over": self.game_over,
             "winner": self.winner,
             "winning_positions": self.winning_positions,
-            "curr_columns": self.curr_columns,
+            "curr_columns": tuple(self.curr_columns),
             "players": self.players,
         }
 
@@ -157,20 +161,3 @@ class Conecta4Game(BaseGameEngine):
         if column < 0 or column >= self.columns:
             return False
         return self.curr_columns[column] >= 0
-
-    def get_board(self) -> List[List]:
-        """Retorna el estado actual del tablero"""
-        # Convertir el tablero a números para el frontend
-        # R -> 1, Y -> 2, " " -> 0
-        numeric_board = []
-        for row in self.board:
-            numeric_row = []
-            for cell in row:
-                if cell == "R":
-                    numeric_row.append(1)
-                elif cell == "Y":
-                    numeric_row.append(2)
-                else:
-                    numeric_row.append(0)
-            numeric_board.append(numeric_row)
-        return numeric_board
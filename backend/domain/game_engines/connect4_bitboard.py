@@ -0,0 +1,187 @@
+from typing import Any, Dict, List, Optional
+
+from .base_game import BaseGameEngine, SnapshotCacheMixin
+
+# Cada columna ocupa 7 bits: 6 filas jugables + 1 bit centinela siempre en 0
+# que evita que las líneas "salten" de una columna a la siguiente.
+# bit = columna * 7 + altura, donde altura 0 es la fila inferior (fila 5).
+_COLUMN_HEIGHT = 7
+
+# (desplazamiento en bits, el inicio de la línea es el bit más bajo)
+# El orden replica el de Conecta4Game.check_winner para que
+# winning_positions sea idéntico.
+_DIRECTIONS = (
+    (7, True),  # Horizontal: el inicio es la columna más a la izquierda
+    (1, False),  # Vertical: el inicio es la fila superior (bit más alto)
+    (6, True),  # Diagonal ↘: el inicio es la celda superior izquierda
+    (8, False),  # Diagonal ↙: el inicio es la celda superior derecha
+)
+
+
+class Conecta4BitboardGame(SnapshotCacheMixin, BaseGameEngine):
+    """
+    Motor de Conecta 4 basado en bitboards.
+
+    Guarda las fichas de cada jugador en un entero de 64 bits y solo revisa
+    las líneas que pasan por la última ficha colocada. La salida de
+    apply_move/get_game_state es idéntica a la de Conecta4Game.
+    """
+
+    def __init__(self):
+        # Inicializar propiedades específicas del juego primero
+        self.rows = 6
+        self.columns = 7
+        self.curr_columns = [5] * self.columns
+        self.move_count = 0
+        self.game_over = False
+        self.winner = None
+        self.winning_positions = []
+        self.players = {"R": "Rojo", "Y": "Amarillo"}
+        self.bitboards = {"R": 0, "Y": 0}
+        self._last_bit: Optional[int] = None
+
+        # Vista numérica del tablero (R -> 1, Y -> 2, vacío -> 0),
+        # actualizada celda por celda en cada movimiento
+        self.numeric_board = [[0] * self.columns for _ in range(self.rows)]
+
+        # Llamar al constructor padre después de inicializar propiedades
+        super().__init__()
+
+    def create_board(self):
+        return [[" " for _ in range(self.columns)] for _ in range(self.rows)]
+
+    def apply_move(self, move: dict) -> Dict[str, Any]:
+        """
+        Aplica un movimiento al tablero y retorna el estado del juego
+        """
+        if self.game_over:
+            raise ValueError("El juego ya ha terminado")
+
+        col = move.get("column")
+        if col is None or col < 0 or col >= self.columns:
+            raise ValueError("Columna inválida")
+
+        # Verificar si la columna está llena
+        if self.curr_columns[col] < 0:
+            raise ValueError("Columna llena")
+
+        # Colocar la pieza en el tablero y en el bitboard del jugador
+        row = self.curr_columns[col]
+        self.board[row][col] = self.current_player
+        self._last_bit = self._to_bit(row, col)
+        self.bitboards[self.current_player] |= 1 << self._last_bit
+        self.numeric_board[row][col] = 1 if self.current_player == "R" else 2
+        self.move_count += 1
+
+        # Actualizar disponibilidad de columna
+        self.curr_columns[col] -= 1
+
+        # Verificar ganador
+        self.check_winner()
+
+        # Crear respuesta del movimiento
+        move_result = {
+            "valid": True,
+            "row": row,
+            "column": col,
+            "player": self.current_player,
+            "move_count": self.move_count,
+            "board": self._get_board_snapshot(),
+            "game_over": self.game_over,
+            "winner": self.winner,
+            "winning_positions": self.winning_positions,
+            "is_tie": False,
+        }
+
+        # Verificar empate (tablero lleno)
+        if not self.game_over and self.move_count == self.rows * self.columns:
+            self.game_over = True
+            move_result["is_tie"] = True
+            move_result["game_over"] = True
+
+        # Cambiar turno si el juego continúa
+        if not self.game_over:
+            self.current_player = "Y" if self.current_player == "R" else "R"
+
+        return move_result
+
+    def check_winner(self) -> Optional[Dict[str, Any]]:
+        """
+        Verifica si la última ficha colocada completa una línea de cuatro
+        """
+        if self._last_bit is None:
+            return None
+
+        player = self.current_player
+        bitboard = self.bitboards[player]
+
+        for shift, start_is_low in _DIRECTIONS:
+            # Descarte rápido: ¿existe alguna línea de 4 en esta dirección?
+            pairs = bitboard & (bitboard >> shift)
+            if not pairs & (pairs >> (2 * shift)):
+                continue
+
+            positions = self._get_line_through_last(bitboard, shift, start_is_low)
+            if len(positions) >= 4:
+                self.winning_positions = positions[:4]
+                self._set_winner(player)
+                return {
+                    "winner": self.winner,
+                    "positions": self.winning_positions,
+                }
+
+        return None
+
+    def _get_line_through_last(
+        self, bitboard: int, shift: int, start_is_low: bool
+    ) -> List[List[int]]:
+        """Obtiene la línea de fichas consecutivas que pasa por la última ficha"""
+        step = -shift if start_is_low else shift
+
+        # Retroceder hasta el inicio de la línea
+        start = self._last_bit
+        while start + step >= 0 and bitboard >> (start + step) & 1:
+            start += step
+
+        # Recorrer la línea desde el inicio, en el mismo orden que Conecta4Game
+        positions = []
+        bit = start
+        while bit >= 0 and bitboard >> bit & 1:
+            positions.append(self._to_position(bit))
+            bit -= step
+
+        return positions
+
+    def _to_bit(self, row: int, col: int) -> int:
+        """Convierte una celda (fila, columna) a su índice en el bitboard"""
+        return col * _COLUMN_HEIGHT + (self.rows - 1 - row)
+
+    def _to_position(self, bit: int) -> List[int]:
+        """Convierte un índice del bitboard a [fila, columna]"""
+        col, height = divmod(bit, _COLUMN_HEIGHT)
+        return [self.rows - 1 - height, col]
+
+    def _set_winner(self, winner_symbol: str):
+        """Establece el ganador del juego"""
+        self.game_over = True
+        self.winner = winner_symbol
+
+    def _build_game_state(self) -> Dict[str, Any]:
+        return {
+            "board": self._get_board_snapshot(),
+            "current_player": self.current_player,
+            "move_count": self.move_count,
+            "game_over": self.game_over,
+            "winner": self.winner,
+            "winning_positions": self.winning_positions,
+            "curr_columns": tuple(self.curr_columns),
+            "players": self.players,
+        }
+
+    def is_valid_move(self, column: int) -> bool:
+        """Verifica si un movimiento es válido"""
+        if self.game_over:
+            return False
+        if column < 0 or column >= self.columns:
+            return False
+        return self.curr_columns[column] >= 0
@@ -11,3 +11,11 @@ class IPasswordHasher(ABC):
     @abstractmethod
     def verify(self, plain_password: str, hashed_password: str) -> bool:
         """Verifica si la contraseña coincide con el hash"""
+
+    @abstractmethod
+    async def ahash(self, password: str) -> str:
+        """Genera un hash de la contraseña sin bloquear el event loop"""
+
+    @abstractmethod
+    async def averify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verifica la contraseña sin bloquear el event loop"""
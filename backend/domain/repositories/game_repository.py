@@ -21,3 +21,17 @@ class IGameRepository(IReadOnlyRepository[GameEntity, BaseFilterParams, ModelTyp
         :param category_id: The ID of the category to retrieve games for.
         :return: A list of Game objects corresponding to the given category.
         """
+
+    @abstractmethod
+    async def apply_review_change(
+        self, game_id: str, review_count_delta: int, rating_delta: int
+    ) -> None:
+        """
+        Ajusta los agregados de reseñas del juego (cantidad, suma y promedio)
+        en un solo UPDATE. No confirma la transacción: se confirma junto con
+        la escritura de la reseña en la misma sesión.
+
+        :param game_id: ID del juego.
+        :param review_count_delta: Cambio en la cantidad de reseñas (+1, 0 o -1).
+        :param rating_delta: Cambio en la suma de calificaciones.
+        """
@@ -28,3 +28,10 @@ class IGameReviewRepository(
         self, user_id: str, game_id: str
     ) -> Optional[GameReviewEntity]:
         """Obtiene una reseña de un juego específico por el ID del usuario y del juego."""
+
+    @abstractmethod
+    async def get_by_id_for_update(self, review_id: str) -> Optional[GameReviewEntity]:
+        """
+        Obtiene una reseña bloqueando su fila hasta el commit, para ajustar
+        los agregados del juego con la calificación vigente.
+        """
@@ -1,8 +1,8 @@
 from abc import abstractmethod
-from typing import List
+from typing import Callable, List, Optional
 
 from application.common import BaseFilterParams
-from domain.entities import MatchEntity
+from domain.entities import MatchEntity, MatchSettlement
 
 from .base_repository import IBaseRepository
 from .common import ModelType
@@ -25,7 +25,39 @@ class IMatchRepository(IBaseRepository[MatchEntity, BaseFilterParams, ModelType]
             sort_params: Parámetros de ordenamiento
 
         Returns:
-            Tupla con lista de partidas y total de registros
+            Tupla con lista de partidas y total de registros (None si la
+            paginación por cursor omitió el conteo)
+        """
+
+    @abstractmethod
+    async def get_open_by_game_id(
+        self, game_id: str, capacity: int, pagination
+    ) -> tuple[List[MatchEntity], Optional[int]]:
+        """
+        Obtiene las partidas abiertas de un juego con lugar libre, de la más
+        antigua a la más nueva (paginación por cursor).
+
+        Args:
+            game_id: ID del juego
+            capacity: Capacidad del juego (máximo de participantes)
+            pagination: Parámetros de paginación
+
+        Returns:
+            Tupla con lista de partidas y total (None si se omitió el conteo)
+        """
+
+    @abstractmethod
+    async def reserve_participant_slot(self, match_id: str, capacity: int) -> bool:
+        """
+        Incrementa de forma atómica el contador de participantes si la
+        partida sigue abierta y tiene lugar.
+
+        Args:
+            match_id: ID de la partida
+            capacity: Capacidad del juego
+
+        Returns:
+            False si la partida está llena o finalizada
         """
 
     @abstractmethod
@@ -39,3 +71,26 @@ class IMatchRepository(IBaseRepository[MatchEntity, BaseFilterParams, ModelType]
         Returns:
             Lista de IDs de usuarios participantes
         """
+
+    @abstractmethod
+    async def settle(
+        self,
+        match_id: str,
+        winner_id: Optional[str],
+        calculate_reward: Callable[[MatchEntity, Optional[float]], float],
+    ) -> MatchSettlement:
+        """
+        Finaliza una partida y acredita la recompensa al ganador en una
+        sola transacción, con la fila de la partida bloqueada.
+
+        Args:
+            match_id: ID de la partida
+            winner_id: ID del ganador, o None si hubo empate
+            calculate_reward: Valida la partida bloqueada y calcula la
+                recompensa a partir de ella y del house_odds del juego;
+                si lanza una excepción la transacción se revierte
+
+        Returns:
+            Partida finalizada, house_odds del juego, recompensa y nuevo
+            saldo del ganador
+        """
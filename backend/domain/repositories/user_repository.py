@@ -19,3 +19,15 @@ class IUserRepository(IBaseRepository[UserEntity, BaseFilterParams, ModelType]):
         :param email: The email address of the user to retrieve.
         :return: The User object corresponding to the given email.
         """
+
+    @abstractmethod
+    async def debit_if_sufficient(self, user_id: str, amount: float) -> Optional[float]:
+        """
+        Descuenta un monto del saldo del usuario solo si le alcanza, en una
+        sola operación atómica. No confirma la transacción: se confirma con la
+        siguiente escritura de la misma sesión.
+
+        :param user_id: ID del usuario.
+        :param amount: Monto a descontar.
+        :return: El nuevo saldo, o None si el saldo no alcanza o el usuario no existe.
+        """
@@ -8,8 +8,8 @@ ResultType = TypeVar("ResultType")
 class PaginationInfoDTO(BaseModel):
     """DTO para información de paginación"""
 
-    count: int
-    pages: int
+    count: Optional[int]
+    pages: Optional[int]
     page_number: int
     next: Optional[str]
     prev: Optional[str]
@@ -20,3 +20,4 @@ class PaginatedResponseDTO(BaseModel, Generic[ResultType]):
 
     info: PaginationInfoDTO
     results: List[ResultType]
+    next_cursor: Optional[str] = None
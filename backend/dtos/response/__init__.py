@@ -1,4 +1,5 @@
 from .app_info_response import AccountResponseDTO, AppInfoResponseDTO
+from .health_response import HealthResponseDTO, PoolStatusDTO
 from .auth.auth_response_dto import *
 from .game.category_response import *
 from .game.game_response import *
@@ -40,6 +40,17 @@ class GameResponseDTO(TimeStampBase):
         None, description="Tipo de juego (Online, Presencial, etc.)"
     )
 
+    review_count: Optional[int] = Field(None, description="Número de reseñas del juego")
+    average_rating: Optional[float] = Field(
+        None, description="Calificación promedio de las reseñas"
+    )
+    open_match_count: Optional[int] = Field(
+        None, description="Número de partidas sin finalizar"
+    )
+    total_match_count: Optional[int] = Field(
+        None, description="Número total de partidas del juego"
+    )
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -52,6 +63,10 @@ class GameResponseDTO(TimeStampBase):
                 "category_ids": [EXAMPLE_CATEGORY_ID],
                 "house_odds": EXAMPLE_HOUSE_ODDS,
                 "game_type": "Online",
+                "review_count": 12,
+                "average_rating": 4.25,
+                "open_match_count": 3,
+                "total_match_count": 40,
                 "created_at": EXAMPLE_CREATED_AT,
                 "updated_at": EXAMPLE_UPDATED_AT,
             }
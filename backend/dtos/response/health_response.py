@@ -0,0 +1,42 @@
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+
+class PoolStatusDTO(BaseModel):
+    """DTO con la ocupación de un pool de conexiones"""
+
+    size: int = Field(..., description="Tamaño base del pool")
+    max_overflow: int = Field(..., description="Conexiones extra permitidas")
+    capacity: int = Field(..., description="Máximo de conexiones simultáneas")
+    checked_out: int = Field(..., description="Conexiones prestadas")
+    checked_in: int = Field(..., description="Conexiones libres en el pool")
+    overflow: int = Field(..., description="Conexiones abiertas por encima de size")
+    saturation: float = Field(..., description="checked_out / capacity")
+
+
+class HealthResponseDTO(BaseModel):
+    """DTO para respuesta del estado del servicio"""
+
+    status: str = Field(..., description="ok, degraded o saturated")
+    pools: Dict[str, PoolStatusDTO] = Field(
+        ..., description="Ocupación de cada pool de la base de datos"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "status": "ok",
+                "pools": {
+                    "primary": {
+                        "size": 10,
+                        "max_overflow": 10,
+                        "capacity": 20,
+                        "checked_out": 3,
+                        "checked_in": 5,
+                        "overflow": 0,
+                        "saturation": 0.15,
+                    }
+                },
+            }
+        }
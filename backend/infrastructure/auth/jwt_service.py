@@ -62,7 +62,7 @@ class JWTService(ITokenProvider):
                 raise jwt.InvalidTokenError("Token missing subject")
 
             self.logger.debug(f"Token decoded successfully for subject: {sub}")
-            return TokenData(sub=sub)
+            return TokenData(sub=sub, exp=payload.get("exp"))
 
         except jwt.ExpiredSignatureError:
             self.logger.warning("Token decode failed: token has expired")
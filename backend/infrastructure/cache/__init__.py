@@ -0,0 +1,31 @@
+from .invalidation import invalidate_after_commit
+from .principal_cache import (
+    PrincipalCache,
+    get_principal_cache,
+    invalidate_principal,
+)
+from .read_cache import (
+    APP_INFO_CACHE,
+    CATEGORIES_CACHE,
+    GAMES_CACHE,
+    ReadCache,
+    cached_read,
+    get_read_cache,
+    get_read_cache_stats,
+    invalidate_read_cache,
+)
+
+__all__ = [
+    "APP_INFO_CACHE",
+    "CATEGORIES_CACHE",
+    "GAMES_CACHE",
+    "PrincipalCache",
+    "ReadCache",
+    "cached_read",
+    "get_principal_cache",
+    "get_read_cache",
+    "get_read_cache_stats",
+    "invalidate_after_commit",
+    "invalidate_principal",
+    "invalidate_read_cache",
+]
@@ -0,0 +1,16 @@
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def invalidate_after_commit(session: AsyncSession, callback: Callable[[], None]):
+    """
+    Ejecuta la invalidación cuando la transacción actual se confirme.
+    Invalidar antes del commit permitiría que otra petición vuelva a llenar la
+    caché con los datos anteriores; si la transacción se revierte, la
+    invalidación queda pendiente para el siguiente commit (es inofensiva).
+    """
+    event.listen(
+        session.sync_session, "after_commit", lambda _session: callback(), once=True
+    )
@@ -0,0 +1,115 @@
+import hashlib
+import time
+from typing import Any, Dict, Optional, Set
+
+from cachetools import TLRUCache
+from infrastructure.logging.logging_config import get_logger
+
+logger = get_logger("cache.principal_cache")
+
+# Usuarios autenticados recordados y tiempo máximo que se confía en ellos
+PRINCIPAL_CACHE_SIZE = 10_000
+PRINCIPAL_CACHE_TTL = 60.0
+
+
+class PrincipalCache:
+    """
+    Caché del usuario autenticado por token.
+
+    La clave es el hash del token (el token ya fue verificado al guardarlo) y
+    cada entrada vive como máximo PRINCIPAL_CACHE_TTL segundos, sin pasar de
+    la expiración del token. Los cambios de saldo o rol invalidan las
+    entradas del usuario.
+    """
+
+    def __init__(
+        self, maxsize: int = PRINCIPAL_CACHE_SIZE, ttl: float = PRINCIPAL_CACHE_TTL
+    ):
+        self.ttl = ttl
+        # Cada valor es (segundos de vida, user_id, usuario)
+        self._cache: TLRUCache = TLRUCache(
+            maxsize=maxsize, ttu=lambda key, value, now: now + value[0]
+        )
+        self._keys_by_user: Dict[str, Set[str]] = {}
+        self.generation = 0
+
+        # Métricas
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def token_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[Any]:
+        entry = self._cache.get(self.token_key(token))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[2]
+
+    def set(
+        self,
+        token: str,
+        user_id: str,
+        user: Any,
+        expires_at: Optional[float],
+        generation: int,
+    ):
+        """
+        Guarda el usuario si no hubo invalidaciones desde que se leyó.
+        expires_at es la expiración del token (timestamp UNIX).
+        """
+        if generation != self.generation:
+            return
+        ttl = self.ttl
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl <= 0:
+            return
+
+        key = self.token_key(token)
+        user_id = str(user_id)
+        self._cache[key] = (ttl, user_id, user)
+
+        # Olvidar tokens del usuario que ya expiraron o fueron desalojados
+        keys = {k for k in self._keys_by_user.get(user_id, ()) if k in self._cache}
+        keys.add(key)
+        self._keys_by_user[user_id] = keys
+
+    def invalidate_user(self, user_id: str):
+        """Elimina las entradas de todos los tokens del usuario"""
+        self.generation += 1
+        self.invalidations += 1
+        for key in self._keys_by_user.pop(str(user_id), ()):
+            self._cache.pop(key, None)
+        logger.debug(f"Principal cache invalidated for user {user_id}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "maxsize": self._cache.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+_principal_cache_instance = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    global _principal_cache_instance
+    if _principal_cache_instance is None:
+        _principal_cache_instance = PrincipalCache()
+    return _principal_cache_instance
+
+
+def invalidate_principal(user_id: str):
+    """Invalida el usuario autenticado cacheado (ej. cambió su saldo o rol)"""
+    get_principal_cache().invalidate_user(user_id)
@@ -0,0 +1,204 @@
+import copy
+import functools
+import time
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any, Dict, Hashable, Optional, Tuple
+from uuid import UUID
+
+from application.common.sort import SortParams
+from cachetools import TTLCache
+from infrastructure.logging.logging_config import get_logger
+from pydantic import BaseModel
+
+logger = get_logger("cache.read_cache")
+
+GAMES_CACHE = "games"
+CATEGORIES_CACHE = "categories"
+APP_INFO_CACHE = "app_info"
+
+# (tamaño máximo, TTL en segundos) por espacio de nombres.
+# Los conteos de partidas de los juegos no se guardan (se leen en cada
+# petición); el TTL corto acota lo que tarda en verse un cambio hecho en
+# otro proceso, que no vacía esta caché.
+READ_CACHE_CONFIG: Dict[str, Tuple[int, float]] = {
+    GAMES_CACHE: (512, 30.0),
+    CATEGORIES_CACHE: (256, 300.0),
+    APP_INFO_CACHE: (4, 300.0),
+}
+DEFAULT_CACHE_CONFIG: Tuple[int, float] = (256, 60.0)
+
+# Segundos tras una invalidación en que la caché se vuelve a llenar desde la
+# base principal: la réplica puede no tener todavía el cambio que la provocó
+PRIMARY_READS_AFTER_INVALIDATION = 5.0
+
+# Campos de salida que no forman parte de la consulta
+_IGNORED_PARAM_FIELDS = {"keyset_used", "next_cursor"}
+
+_MISSING = object()
+
+
+class ReadCache:
+    """
+    Caché en proceso (LRU con TTL) para lecturas de catálogo.
+
+    Cada invalidación incrementa la generación; un resultado leído de la
+    base de datos antes de una invalidación no se guarda, para no volver a
+    llenar la caché con datos viejos.
+    """
+
+    def __init__(self, namespace: str, maxsize: int, ttl: float):
+        self.namespace = namespace
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.generation = 0
+        self.invalidated_at: Optional[float] = None
+
+        # Métricas
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Obtiene un valor o _MISSING si no está (o expiró)"""
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, generation: int):
+        """Guarda un valor si no hubo invalidaciones desde que se leyó"""
+        if generation == self.generation:
+            self._cache[key] = value
+
+    def invalidate(self):
+        self.generation += 1
+        self.invalidations += 1
+        self.invalidated_at = time.monotonic()
+        self._cache.clear()
+
+    def recently_invalidated(self) -> bool:
+        """La última invalidación fue hace menos de PRIMARY_READS_AFTER_INVALIDATION"""
+        return (
+            self.invalidated_at is not None
+            and time.monotonic() - self.invalidated_at
+            < PRIMARY_READS_AFTER_INVALIDATION
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "maxsize": self._cache.maxsize,
+            "ttl": self._cache.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+_read_caches: Dict[str, ReadCache] = {}
+
+
+def get_read_cache(namespace: str) -> ReadCache:
+    """Obtiene (o crea) la caché de un espacio de nombres"""
+    cache = _read_caches.get(namespace)
+    if cache is None:
+        maxsize, ttl = READ_CACHE_CONFIG.get(namespace, DEFAULT_CACHE_CONFIG)
+        cache = ReadCache(namespace, maxsize, ttl)
+        _read_caches[namespace] = cache
+    return cache
+
+
+def invalidate_read_cache(*namespaces: str):
+    """Vacía las cachés indicadas (o todas si no se indica ninguna)"""
+    for namespace in namespaces or tuple(_read_caches):
+        get_read_cache(namespace).invalidate()
+        logger.debug(f"Read cache '{namespace}' invalidated")
+
+
+def get_read_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Obtiene los aciertos, fallos y tamaño de cada caché"""
+    return {namespace: cache.get_stats() for namespace, cache in _read_caches.items()}
+
+
+def make_cache_key(name: str, args: tuple, kwargs: dict) -> Hashable:
+    """Construye una clave a partir de parámetros normalizados"""
+    return (
+        name,
+        tuple(_normalize(arg) for arg in args),
+        tuple(sorted((key, _normalize(value)) for key, value in kwargs.items())),
+    )
+
+
+def _normalize(value: Any) -> Hashable:
+    """Convierte parámetros de consulta en valores hashables equivalentes"""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (str, UUID)):
+        return str(value)
+    if isinstance(value, SortParams):
+        # Sin campo de orden, la dirección no cambia el resultado
+        if not value.sort_by:
+            return None
+        return (value.sort_by, (value.sort_order or "asc").lower())
+    if isinstance(value, BaseModel):
+        data = value.model_dump(exclude_none=True, exclude=_IGNORED_PARAM_FIELDS)
+        return (type(value).__name__, _normalize(data))
+    if isinstance(value, dict):
+        return tuple(sorted((key, _normalize(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_normalize(item) for item in value)
+    return repr(value)
+
+
+def cached_read(namespace: str):
+    """
+    Decorador para métodos de lectura de repositorios.
+    La clave incluye el nombre del método y sus argumentos normalizados.
+    Guarda y retorna copias: quien llama puede modificar las entidades sin
+    afectar a otras peticiones. Justo después de una invalidación, el método
+    lee de la sesión principal del repositorio en lugar de la réplica.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache = get_read_cache(namespace)
+            key = make_cache_key(func.__name__, args, kwargs)
+
+            value = cache.get(key)
+            if value is not _MISSING:
+                return copy.deepcopy(value)
+
+            generation = cache.generation
+            if cache.recently_invalidated():
+                with _reading_from_primary(self):
+                    value = await func(self, *args, **kwargs)
+            else:
+                value = await func(self, *args, **kwargs)
+            cache.set(key, copy.deepcopy(value), generation)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def _reading_from_primary(repository):
+    """Apunta read_db del repositorio a su sesión principal mientras dura"""
+    read_db = getattr(repository, "read_db", None)
+    if read_db is None or read_db is repository.db:
+        yield
+        return
+
+    repository.read_db = repository.db
+    try:
+        yield
+    finally:
+        repository.read_db = read_db
@@ -11,6 +11,18 @@ class AppSettings(BaseSettingsConfig):
     allowed_origins: list[str]
     trusted_hosts: list[str]
 
+    # Logging de requests: fracción de respuestas exitosas que se registran
+    # (errores y requests lentos se registran siempre)
+    request_log_sample_rate: float = 1.0
+    slow_request_threshold: float = 1.0
+
+    # Formato de los logs ("text" o "json") y volumen por logger:
+    # {"websockets": 0.1} registra el 10% de los INFO/DEBUG de ese logger,
+    # {"websockets": 50} registra como máximo 50 por segundo
+    log_format: str = "text"
+    log_sample_rates: dict[str, float] = {}
+    log_rate_limits: dict[str, int] = {}
+
     def is_development(self) -> bool:
         """Verifica si estamos en ambiente de desarrollo"""
         env = (self.environment or "").lower()
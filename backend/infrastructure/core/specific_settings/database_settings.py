@@ -1,3 +1,5 @@
+from typing import Optional
+
 from .base_settings_config import BaseSettingsConfig
 
 
@@ -7,3 +9,25 @@ class DatabaseSettings(BaseSettingsConfig):
     postgres_user: str
     postgres_password: str
     postgres_db: str
+
+    # URL async de la réplica de lectura (ej. postgresql+asyncpg://...).
+    # Sin valor, las lecturas usan el engine principal
+    database_read_url: Optional[str] = None
+
+    # Pool del engine asíncrono (la aplicación)
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 10.0  # segundos esperando una conexión libre
+    db_pool_recycle: int = 1800  # segundos antes de reabrir una conexión
+    db_pool_pre_ping: bool = True
+
+    # Caché de sentencias preparadas de asyncpg; 0 detrás de PgBouncer en
+    # modo transaction
+    db_statement_cache_size: int = 100
+
+    # Pool del engine síncrono (admin y migraciones)
+    db_sync_pool_size: int = 5
+    db_sync_max_overflow: int = 5
+
+    # Ocupación del pool a partir de la cual /health lo reporta saturado
+    db_pool_saturation_threshold: float = 0.9
@@ -1,4 +1,13 @@
 from .base import Base
 from .config import get_async_postgres_url, get_postgres_url
-from .connection import async_engine, engine, get_async_db, get_db
+from .connection import (
+    async_engine,
+    async_read_engine,
+    engine,
+    get_async_db,
+    get_async_read_db,
+    get_db,
+    use_primary_for_reads,
+)
+from .pool import get_pool_status
 from .init_db import create_tables
@@ -1,4 +1,12 @@
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import declarative_base
 
 # Create the declarative base
 Base = declarative_base()
+
+# Los índices gin_trgm_ops necesitan pg_trgm antes de crear las tablas
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
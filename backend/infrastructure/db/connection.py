@@ -1,19 +1,75 @@
+from fastapi import Depends
+from infrastructure.core import settings
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from starlette.requests import HTTPConnection
 
 from .config import get_async_postgres_url, get_postgres_url
+from .pool import InstrumentedAsyncPool, instrument_engine
+
+database_settings = settings.database_settings
+
+# Cabecera con la que un cliente pide leer de la base principal (por ejemplo
+# justo después de una escritura)
+READ_YOUR_WRITES_HEADER = "x-read-your-writes"
 
 # Engine síncrono (para migraciones y admin)
-engine = create_engine(get_postgres_url())
+engine = create_engine(
+    get_postgres_url(),
+    pool_size=database_settings.db_sync_pool_size,
+    max_overflow=database_settings.db_sync_max_overflow,
+    pool_timeout=database_settings.db_pool_timeout,
+    pool_recycle=database_settings.db_pool_recycle,
+    pool_pre_ping=database_settings.db_pool_pre_ping,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def _create_async_engine(url: str, label: str):
+    """Crea un engine asíncrono con el pool configurado e instrumentado"""
+    connect_args = {}
+    if make_url(url).get_driver_name() == "asyncpg":
+        # Caché de asyncpg y la del adaptador de SQLAlchemy
+        connect_args = {
+            "statement_cache_size": database_settings.db_statement_cache_size,
+            "prepared_statement_cache_size": database_settings.db_statement_cache_size,
+        }
+
+    async_engine = create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedAsyncPool,
+        pool_logging_name=label,
+        pool_size=database_settings.db_pool_size,
+        max_overflow=database_settings.db_max_overflow,
+        pool_timeout=database_settings.db_pool_timeout,
+        pool_recycle=database_settings.db_pool_recycle,
+        pool_pre_ping=database_settings.db_pool_pre_ping,
+        connect_args=connect_args,
+    )
+    instrument_engine(async_engine, label, database_settings.db_max_overflow)
+    return async_engine
+
+
 # Engine asíncrono (para la aplicación)
-async_engine = create_async_engine(get_async_postgres_url(), echo=False)
+async_engine = _create_async_engine(get_async_postgres_url(), "primary")
 AsyncSessionLocal = async_sessionmaker(
     async_engine, class_=AsyncSession, expire_on_commit=False
 )
 
+# Engine de la réplica de lectura (opcional)
+async_read_engine = async_engine
+AsyncReadSessionLocal = AsyncSessionLocal
+if database_settings.database_read_url:
+    async_read_engine = _create_async_engine(
+        database_settings.database_read_url, "replica"
+    )
+    AsyncReadSessionLocal = async_sessionmaker(
+        async_read_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
 
 def get_db():
     """Obtiene sesión síncrona (para admin y migraciones)"""
@@ -31,3 +87,52 @@ async def get_async_db():
             yield session
         finally:
             await session.close()
+
+
+def use_primary_for_reads(endpoint):
+    """
+    Decorador para rutas que deben leer sus propias escrituras.
+
+    Marca la función de la ruta; get_async_read_db lo consulta en el scope
+    de la conexión, así que no depende del orden en que FastAPI resuelva
+    las dependencias.
+    """
+    endpoint.read_from_primary = True
+    return endpoint
+
+
+def reads_from_primary(connection: HTTPConnection) -> bool:
+    """Indica si las lecturas de esta conexión deben ir a la base principal"""
+    # Los WebSocket mantienen la sesión toda la conexión y leen lo que
+    # acaban de escribir: siempre la principal
+    if connection.scope["type"] == "websocket":
+        return True
+    endpoint = connection.scope.get("endpoint")
+    if getattr(endpoint, "read_from_primary", False):
+        return True
+    return connection.headers.get(READ_YOUR_WRITES_HEADER, "").lower() in (
+        "1",
+        "true",
+    )
+
+
+async def get_async_read_db(
+    connection: HTTPConnection, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Obtiene sesión asíncrona para lecturas.
+
+    Usa la réplica si está configurada; si no, o si la conexión debe leer
+    sus propias escrituras (WebSocket, rutas con use_primary_for_reads o
+    cabecera X-Read-Your-Writes), devuelve la misma sesión principal de la
+    petición (no abre una segunda conexión).
+    """
+    if AsyncReadSessionLocal is AsyncSessionLocal or reads_from_primary(connection):
+        yield db
+        return
+
+    async with AsyncReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
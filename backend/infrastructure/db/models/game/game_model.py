@@ -1,9 +1,9 @@
 import uuid
 
 from domain.enums import GameTypeEnum
-from sqlalchemy import Column, Float, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, Float, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.types import Enum as SqlEnum
 
 from ...base import Base
@@ -12,6 +12,17 @@ from ..common import TimeStampModelMixin, game_categories
 
 class GameModel(Base, TimeStampModelMixin):
     __tablename__ = "games"
+    __table_args__ = (
+        # Búsqueda de texto (FullTextSearch en GameFilterParams)
+        Index("ix_games_search_vector", "search_vector", postgresql_using="gin"),
+        # Filtro game_name por subcadena (ILIKE) con pg_trgm
+        Index(
+            "ix_games_game_name_trgm",
+            "game_name",
+            postgresql_using="gin",
+            postgresql_ops={"game_name": "gin_trgm_ops"},
+        ),
+    )
 
     game_id = Column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True
@@ -25,6 +36,25 @@ class GameModel(Base, TimeStampModelMixin):
 
     house_odds = Column(Float, default=1.0, nullable=False)
 
+    # Agregados de reseñas, mantenidos por los casos de uso de reseñas
+    review_count = Column(Integer, default=0, server_default="0", nullable=False)
+    rating_sum = Column(Integer, default=0, server_default="0", nullable=False)
+    rating_avg = Column(
+        Float, default=0.0, server_default="0", nullable=False, index=True
+    )
+
+    # Generada por PostgreSQL; no se carga con el modelo
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "to_tsvector('simple', coalesce(game_name, '') || ' ' || "
+                "coalesce(game_description, ''))",
+                persisted=True,
+            ),
+        )
+    )
+
     game_type = Column(
         SqlEnum(GameTypeEnum, name="gametype", create_type=True), nullable=False
     )
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, ForeignKey, Integer, Text
+from sqlalchemy import Column, ForeignKey, Index, Integer, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -10,6 +10,12 @@ from ..common import TimeStampModelMixin
 
 class GameReviewModel(Base, TimeStampModelMixin):
     __tablename__ = "game_reviews"
+    __table_args__ = (
+        # Una reseña por usuario y juego (get_by_user_and_game_id)
+        UniqueConstraint("user_id", "game_id", name="uq_game_reviews_user_id_game_id"),
+        # Reseñas de un juego (get_by_game_id)
+        Index("ix_game_reviews_game_id_created_at", "game_id", "created_at"),
+    )
 
     review_id = Column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True
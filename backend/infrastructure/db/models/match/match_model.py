@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, Column, Float, ForeignKey
+from sqlalchemy import Boolean, Column, Float, ForeignKey, Index, Integer, false, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -10,6 +10,25 @@ from ..common import TimeStampModelMixin
 
 class MatchModel(Base, TimeStampModelMixin):
     __tablename__ = "matches"
+    __table_args__ = (
+        # Partidas por juego (get_by_game_id) y conteo de partidas abiertas
+        Index(
+            "ix_matches_game_id_is_finished_created_at",
+            "game_id",
+            "is_finished",
+            "created_at",
+        ),
+        Index("ix_matches_created_by_id", "created_by_id"),
+        # Lobby: partidas abiertas de un juego por antigüedad (get_open_by_game_id)
+        Index(
+            "ix_matches_open_lobby",
+            "game_id",
+            "created_at",
+            "match_id",
+            postgresql_where=text("is_finished = false"),
+            postgresql_include=["participant_count"],
+        ),
+    )
 
     match_id = Column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True
@@ -41,9 +60,20 @@ class MatchModel(Base, TimeStampModelMixin):
     is_finished = Column(
         Boolean,
         default=False,
+        server_default=false(),
+        nullable=False,
         comment="Indica si la partida ha finalizado",
     )
 
+    # Se fija al crear la partida y se incrementa de forma atómica al unirse
+    participant_count = Column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Cantidad de participantes de la partida",
+    )
+
     participants = relationship(
         "MatchParticipationModel",
         back_populates="match",
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy import Column, ForeignKey, Index, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -10,6 +10,12 @@ from ..common import TimeStampModelMixin
 
 class MatchParticipationModel(Base, TimeStampModelMixin):
     __tablename__ = "match_participations"
+    __table_args__ = (
+        # Participantes de una partida (get_match_participant_ids)
+        Index("ix_match_participations_match_id_user_id", "match_id", "user_id"),
+        # Partidas de un usuario y borrado en cascada de usuarios
+        Index("ix_match_participations_user_id", "user_id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
 
@@ -1,7 +1,7 @@
 import uuid
 
 from domain.enums import TransferStateEnum
-from sqlalchemy import Column, Float, ForeignKey, String, Text
+from sqlalchemy import Column, Float, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import Enum as SqlEnum
@@ -12,6 +12,17 @@ from ..common import TimeStampModelMixin
 
 class TransferPaymentModel(Base, TimeStampModelMixin):
     __tablename__ = "transfer_payments"
+    __table_args__ = (
+        # Transferencias de un usuario (get_by_user_id)
+        Index("ix_transfer_payments_user_id_created_at", "user_id", "created_at"),
+        # Búsqueda por subcadena (TrigramSearch en TransferPaymentFilterParams)
+        Index(
+            "ix_transfer_payments_transfer_description_trgm",
+            "transfer_description",
+            postgresql_using="gin",
+            postgresql_ops={"transfer_description": "gin_trgm_ops"},
+        ),
+    )
 
     transfer_id = Column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True
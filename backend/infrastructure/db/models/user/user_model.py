@@ -1,7 +1,7 @@
 import uuid
 
 from domain.enums import UserRole
-from sqlalchemy import Column, Float, String
+from sqlalchemy import Column, Float, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import Enum as SqlEnum
@@ -14,6 +14,15 @@ ON_DELETE_CASCADE = "all, delete-orphan"
 
 class UserModel(Base, TimeStampModelMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        # Búsqueda por subcadena de email (TrigramSearch en UserFilterParams)
+        Index(
+            "ix_users_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
 
     user_id = Column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True
@@ -0,0 +1,76 @@
+import time
+from typing import Any, Dict, Tuple
+
+from infrastructure.metrics import (
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_CONNECTION_HOLD,
+    DB_POOL_IN_USE,
+    DB_POOL_TIMEOUTS,
+)
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Pools monitoreados: etiqueta -> (engine, max_overflow)
+_monitored_pools: Dict[str, Tuple[AsyncEngine, int]] = {}
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    Pool asíncrono que mide cuánto espera cada checkout de conexión.
+    La etiqueta de la métrica es pool_logging_name del engine.
+    """
+
+    def connect(self):
+        label = self.logging_name or "primary"
+        started_at = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            DB_POOL_TIMEOUTS.labels(label).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(label).observe(
+                time.perf_counter() - started_at
+            )
+
+
+def instrument_engine(engine: AsyncEngine, label: str, max_overflow: int):
+    """Registra eventos de checkout/checkin del pool para métricas y /health"""
+    in_use = DB_POOL_IN_USE.labels(label)
+    hold_time = DB_POOL_CONNECTION_HOLD.labels(label)
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        in_use.inc()
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            in_use.dec()
+            hold_time.observe(time.perf_counter() - checked_out_at)
+
+    _monitored_pools[label] = (engine, max_overflow)
+
+
+def get_pool_status() -> Dict[str, Dict[str, Any]]:
+    """Ocupación actual de cada pool monitoreado"""
+    status = {}
+    for label, (engine, max_overflow) in _monitored_pools.items():
+        pool = engine.sync_engine.pool
+        size = pool.size()
+        checked_out = pool.checkedout()
+        capacity = size + max_overflow
+        status[label] = {
+            "size": size,
+            "max_overflow": max_overflow,
+            "capacity": capacity,
+            "checked_out": checked_out,
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+        }
+    return status
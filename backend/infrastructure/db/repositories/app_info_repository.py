@@ -3,6 +3,7 @@ from typing import Optional
 from application.mixins.logging_mixin import LoggingMixin
 from domain.entities import AppInfoEntity
 from domain.repositories.app_info_repository import IAppInfoRepository
+from infrastructure.cache import APP_INFO_CACHE, cached_read
 from ..models import AppInfoModel, AccountModel
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -15,6 +16,7 @@ class PostgresAppInfoRepository(IAppInfoRepository, LoggingMixin):
         self.db = db_session
         self.model = db_model
 
+    @cached_read(APP_INFO_CACHE)
     async def get_app_info(self) -> Optional[AppInfoEntity]:
         """Obtiene la información de la aplicación (único registro)."""
         self.logger.info("Fetching app info from database")
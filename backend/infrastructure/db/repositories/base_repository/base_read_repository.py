@@ -22,11 +22,18 @@ class BaseReadOnlyPostgresRepository(
     """Repositorio base de solo lectura para PostgreSQL."""
 
     def __init__(
-        self, db_session: AsyncSession, db_model: Type[ModelType], *args, **kwargs
+        self,
+        db_session: AsyncSession,
+        db_model: Type[ModelType],
+        *args,
+        read_session: Optional[AsyncSession] = None,
+        **kwargs,
     ):
         # Configurar atributos necesarios
         self.db = db_session
         self.model = db_model
+        # Sesión para listados (réplica de lectura si está configurada)
+        self.read_db = read_session or db_session
 
     async def get_paginated(
         self,
@@ -37,7 +44,7 @@ class BaseReadOnlyPostgresRepository(
         """Obtiene entidades paginadas con filtros y ordenamiento."""
         return await self.get_paginated_mixin(
             model=self.model,
-            db_session=self.db,
+            db_session=self.read_db,
             pagination=pagination,
             filters=filters,
             sort_params=sort_params,
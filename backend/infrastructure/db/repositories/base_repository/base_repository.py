@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Type
+from typing import Optional, Type
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,7 +15,15 @@ class BasePostgresRepository(
 ):
     """Repositorio base para PostgreSQL que implementa operaciones CRUD completas."""
 
-    def __init__(self, db_session: AsyncSession, db_model: Type[ModelType]):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        db_model: Type[ModelType],
+        read_session: Optional[AsyncSession] = None,
+    ):
         # Configurar atributos comunes una sola vez
         self.db = db_session
         self.model = db_model
+        # Solo los listados usan la réplica; las lecturas que preceden a una
+        # escritura siguen en la sesión principal
+        self.read_db = read_session or db_session
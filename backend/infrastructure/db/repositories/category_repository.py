@@ -5,6 +5,7 @@ from api.http.common.pagination import PaginationParams
 from api.http.common.sort import SortParams
 from domain.entities import CategoryEntity
 from domain.repositories import ICategoryRepository
+from infrastructure.cache import CATEGORIES_CACHE, cached_read
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
@@ -18,6 +19,7 @@ class PostgresCategoryRepository(
 ):
     """Repositorio de categorías para PostgreSQL."""
 
+    @cached_read(CATEGORIES_CACHE)
     async def get_paginated(
         self,
         pagination: PaginationParams,
@@ -27,7 +29,7 @@ class PostgresCategoryRepository(
         """Obtiene categorías paginadas con eager loading."""
         return await self.get_paginated_mixin(
             model=self.model,
-            db_session=self.db,
+            db_session=self.read_db,
             pagination=pagination,
             filters=filters,
             sort_params=sort_params,
@@ -35,6 +37,7 @@ class PostgresCategoryRepository(
             custom_filter_fn=lambda stmt: stmt.options(selectinload(self.model.games)),
         )
 
+    @cached_read(CATEGORIES_CACHE)
     async def get_by_game_id(
         self,
         game_id: str,
@@ -46,7 +49,7 @@ class PostgresCategoryRepository(
         self.logger.debug(f"Getting categories by game ID: {game_id}")
         return await self.get_paginated_mixin(
             model=self.model,
-            db_session=self.db,
+            db_session=self.read_db,
             pagination=pagination,
             filters=filters,
             sort_params=sort_params,
@@ -56,6 +59,7 @@ class PostgresCategoryRepository(
             ).where(self.model.games.any(game_id=game_id)),
         )
 
+    @cached_read(CATEGORIES_CACHE)
     async def get_by_id(self, entity_id: str) -> Optional[CategoryEntity]:
         """Obtiene una categoría por ID con eager loading."""
         self.logger.debug(f"Getting category by ID: {entity_id}")
@@ -64,7 +68,7 @@ class PostgresCategoryRepository(
             .options(selectinload(self.model.games))
             .where(self.model.category_id == entity_id)
         )
-        result = await self.db.execute(stmt)
+        result = await self.read_db.execute(stmt)
         model_instance = result.scalar_one_or_none()
 
         if model_instance:
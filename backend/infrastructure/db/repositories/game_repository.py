@@ -4,11 +4,18 @@ from api.http.common.filters.specific_filters import GameFilterParams
 from api.http.common.pagination import PaginationParams
 from api.http.common.sort import SortParams
 from domain.entities.game import GameEntity
+from domain.exceptions.game import GameNotFoundError
 from domain.repositories import IGameRepository
-from sqlalchemy import select
+from infrastructure.cache import (
+    GAMES_CACHE,
+    cached_read,
+    invalidate_after_commit,
+    invalidate_read_cache,
+)
+from sqlalchemy import case, false, func, select, update
 from sqlalchemy.orm import selectinload
 
-from ..models import GameModel
+from ..models import GameModel, MatchModel
 from .base_repository import BaseReadOnlyPostgresRepository
 
 
@@ -25,65 +32,157 @@ class PostgresGameRepository(
         filters: GameFilterParams,
         sort_params: SortParams,
     ) -> Tuple[List[GameEntity], int]:
-        """Obtiene juegos por ID de categoría con eager loading."""
+        """Obtiene juegos por ID de categoría con sus categorías y estadísticas."""
         self.logger.debug(f"Getting games by category ID: {category_id}")
+        games, total_count = await self._get_cached_by_category_id(
+            category_id, pagination, filters, sort_params
+        )
+        await self._attach_match_counts(games)
+        return games, total_count
+
+    async def get_paginated(
+        self,
+        pagination: PaginationParams,
+        filters: Optional[GameFilterParams] = None,
+        sort_params: Optional[SortParams] = None,
+    ) -> Tuple[List[GameEntity], int]:
+        """Obtiene juegos paginados con sus categorías y estadísticas."""
+        games, total_count = await self._get_cached_paginated(
+            pagination, filters, sort_params
+        )
+        await self._attach_match_counts(games)
+        return games, total_count
 
+    async def get_by_id(self, entity_id: str) -> Optional[GameEntity]:
+        """Obtiene un juego por ID con sus categorías y estadísticas."""
+        self.logger.debug(f"Getting game by ID: {entity_id}")
+        game = await self._get_cached_by_id(entity_id)
+
+        if game:
+            self.logger.debug(f"Game found with ID: {entity_id}")
+            await self._attach_match_counts([game])
+        else:
+            self.logger.debug(f"No game found with ID: {entity_id}")
+        return game
+
+    @cached_read(GAMES_CACHE)
+    async def _get_cached_by_category_id(
+        self,
+        category_id: str,
+        pagination: PaginationParams,
+        filters: GameFilterParams,
+        sort_params: SortParams,
+    ) -> Tuple[List[GameEntity], int]:
         return await self.get_paginated_mixin(
             model=self.model,
-            db_session=self.db,
+            db_session=self.read_db,
             pagination=pagination,
             filters=filters,
             sort_params=sort_params,
             to_entity=self._model_to_entity,
-            custom_filter_fn=lambda stmt: stmt.options(
-                selectinload(self.model.categories),
-                selectinload(self.model.reviews),
-                selectinload(self.model.matches),
-            ).where(self.model.categories.any(category_id=category_id)),
+            custom_filter_fn=lambda stmt: stmt.options(*self.get_load_options()).where(
+                self.model.categories.any(category_id=category_id)
+            ),
         )
 
-    async def get_paginated(
+    @cached_read(GAMES_CACHE)
+    async def _get_cached_paginated(
         self,
         pagination: PaginationParams,
         filters: Optional[GameFilterParams] = None,
         sort_params: Optional[SortParams] = None,
     ) -> Tuple[List[GameEntity], int]:
-        """Obtiene juegos paginados con eager loading."""
         return await self.get_paginated_mixin(
             model=self.model,
-            db_session=self.db,
+            db_session=self.read_db,
             pagination=pagination,
             filters=filters,
             sort_params=sort_params,
             to_entity=self._model_to_entity,
-            custom_filter_fn=lambda stmt: stmt.options(
-                selectinload(self.model.categories),
-                selectinload(self.model.reviews),
-                selectinload(self.model.matches),
-            ),
+            custom_filter_fn=lambda stmt: stmt.options(*self.get_load_options()),
         )
 
-    async def get_by_id(self, entity_id: str) -> Optional[GameEntity]:
-        """Obtiene un juego por ID con eager loading."""
-        self.logger.debug(f"Getting game by ID: {entity_id}")
+    @cached_read(GAMES_CACHE)
+    async def _get_cached_by_id(self, entity_id: str) -> Optional[GameEntity]:
         stmt = (
             select(self.model)
-            .options(
-                selectinload(self.model.categories),
-                selectinload(self.model.reviews),
-                selectinload(self.model.matches),
-            )
+            .options(*self.get_load_options())
             .where(self.model.game_id == entity_id)
         )
-        result = await self.db.execute(stmt)
+        result = await self.read_db.execute(stmt)
         model_instance = result.scalar_one_or_none()
+        return self._model_to_entity(model_instance) if model_instance else None
 
-        if model_instance:
-            self.logger.debug(f"Game found with ID: {entity_id}")
-            return self._model_to_entity(model_instance)
-        else:
-            self.logger.debug(f"No game found with ID: {entity_id}")
-            return None
+    async def _attach_match_counts(self, games: List[GameEntity]) -> None:
+        """
+        Completa los conteos de partidas con una consulta agrupada. Cambian
+        con cada partida creada o terminada, por eso no se guardan en la caché.
+        """
+        if not games:
+            return
+
+        stmt = (
+            select(
+                MatchModel.game_id,
+                func.count().filter(MatchModel.is_finished == false()),
+                func.count(),
+            )
+            .where(MatchModel.game_id.in_([game.game_id for game in games]))
+            .group_by(MatchModel.game_id)
+        )
+        result = await self.read_db.execute(stmt)
+        counts = {
+            str(game_id): (open_count, total_count)
+            for game_id, open_count, total_count in result.all()
+        }
+
+        for game in games:
+            game.open_match_count, game.total_match_count = counts.get(
+                game.game_id, (0, 0)
+            )
+
+    async def apply_review_change(
+        self, game_id: str, review_count_delta: int, rating_delta: int
+    ) -> None:
+        """Ajusta los agregados de reseñas con un UPDATE atómico, sin hacer commit."""
+        review_count = self.model.review_count + review_count_delta
+        rating_sum = self.model.rating_sum + rating_delta
+        stmt = (
+            update(self.model)
+            .where(self.model.game_id == game_id)
+            .values(
+                review_count=review_count,
+                rating_sum=rating_sum,
+                rating_avg=case(
+                    (review_count > 0, rating_sum * 1.0 / review_count),
+                    else_=0.0,
+                ),
+            )
+            .returning(self.model.game_id)
+        )
+        if await self.db.scalar(stmt) is None:
+            raise GameNotFoundError(f"Game with ID {game_id} not found")
+
+        # Vaciar la caché de juegos cuando la reseña se confirme
+        invalidate_after_commit(self.db, lambda: invalidate_read_cache(GAMES_CACHE))
+
+        self.logger.debug(
+            f"Review aggregates for game {game_id} adjusted by "
+            f"({review_count_delta}, {rating_delta})"
+        )
+
+    def get_load_options(self, include_relations: bool = False) -> list:
+        """
+        Carga las categorías. Las reseñas y partidas completas solo se cargan
+        si se piden; los conteos de partidas los agrega _attach_match_counts.
+        """
+        options = [selectinload(self.model.categories)]
+        if include_relations:
+            options += [
+                selectinload(self.model.reviews),
+                selectinload(self.model.matches),
+            ]
+        return options
 
     def _model_to_entity(self, model: GameModel) -> GameEntity:
         """Convierte GameModel a GameEntity."""
@@ -106,6 +205,8 @@ class PostgresGameRepository(
             categories=category_ids,
             created_at=model.created_at,
             updated_at=model.updated_at,
+            review_count=model.review_count,
+            average_rating=model.rating_avg if model.review_count else None,
         )
 
     def _get_id_field(self):
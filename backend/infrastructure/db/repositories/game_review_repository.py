@@ -8,9 +8,12 @@ from domain.exceptions.game import GameReviewAlreadyExistsError, GameReviewNotFo
 from domain.repositories import IGameReviewRepository
 from infrastructure.db.models import GameReviewModel
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from .base_repository import BasePostgresRepository
 
+UNIQUE_USER_GAME_CONSTRAINT = "uq_game_reviews_user_id_game_id"
+
 
 class PostgresGameReviewRepository(
     BasePostgresRepository[GameReviewEntity, GameReviewModel, GameReviewFilterParams],
@@ -28,7 +31,7 @@ class PostgresGameReviewRepository(
         """Obtiene reviews del juego con paginación y ordenamiento."""
         return await self.get_paginated_mixin(
             model=self.model,
-            db_session=self.db,
+            db_session=self.read_db,
             pagination=pagination,
             filters=filters,
             sort_params=sort_params,
@@ -60,20 +63,26 @@ class PostgresGameReviewRepository(
             )
             return None
 
+    async def get_by_id_for_update(self, review_id: str) -> Optional[GameReviewEntity]:
+        """
+        SELECT ... FOR UPDATE sobre la sesión principal: dos cambios
+        simultáneos de la misma reseña se aplican uno después del otro.
+        """
+        stmt = (
+            select(self.model)
+            .where(self.model.review_id == review_id)
+            .with_for_update()
+        )
+        model_instance = await self.db.scalar(stmt)
+        return self._model_to_entity(model_instance) if model_instance else None
+
     async def save(self, entity: GameReviewEntity) -> GameReviewEntity:
-        """Creates a new GameReview. Throws exception if review already exists for user+game."""
+        """
+        Creates a new GameReview. Throws exception if review already exists for user+game.
+        El duplicado lo detecta la restricción única (user_id, game_id), sin
+        consulta previa ni carrera entre dos peticiones simultáneas.
+        """
         try:
-            # Verificar si ya existe una reseña del usuario para el juego
-            existing_review = await self.get_by_user_and_game_id(
-                user_id=entity.user_id, game_id=entity.game_id
-            )
-
-            if existing_review:
-                self.logger.error("Review already exists for this user")
-                raise GameReviewAlreadyExistsError(
-                    "User already has a review for this game"
-                )
-
             self.logger.debug(f"Creating new game review: {entity}")
             new_model = self._entity_to_model(entity)
             self.db.add(new_model)
@@ -81,6 +90,16 @@ class PostgresGameReviewRepository(
             await self.db.refresh(new_model)
             return self._model_to_entity(new_model)
 
+        except IntegrityError as e:
+            await self.db.rollback()
+            if UNIQUE_USER_GAME_CONSTRAINT in str(e.orig):
+                self.logger.warning("Review already exists for this user")
+                raise GameReviewAlreadyExistsError(
+                    "User already has a review for this game"
+                ) from e
+            self.logger.error(f"Error creating game review: {e}")
+            raise
+
         except Exception as e:
             self.logger.error(f"Error creating game review: {e}")
             await self.db.rollback()
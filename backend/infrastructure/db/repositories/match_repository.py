@@ -1,17 +1,22 @@
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 from api.http.common.filters.specific_filters.match_filters import MatchFilterParams
 from api.http.common.pagination import PaginationParams
 from api.http.common.sort import SortParams
 from domain.entities.match.match import MatchEntity
+from domain.entities.match.match_settlement import MatchSettlement
 from domain.exceptions.match import MatchNotFoundError
+from domain.exceptions.user import UserNotFoundError
 from domain.repositories.match_repository import IMatchRepository
+from infrastructure.cache import invalidate_principal
+from infrastructure.db.models.game.game_model import GameModel
 from infrastructure.db.models.match.match_model import MatchModel
 from infrastructure.db.models.match.match_participation_model import (
     MatchParticipationModel,
 )
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from infrastructure.db.models.user.user_model import UserModel
+from sqlalchemy import false, select, update
+from sqlalchemy.orm import lazyload, selectinload
 
 from .base_repository import BasePostgresRepository
 
@@ -28,19 +33,72 @@ class PostgresMatchRepository(
         pagination: PaginationParams,
         filters: Optional[MatchFilterParams] = None,
         sort_params: Optional[SortParams] = None,
-    ) -> Tuple[List[MatchEntity], int]:
-        """Obtiene partidas por ID de juego con paginación y ordenamiento."""
+    ) -> Tuple[List[MatchEntity], Optional[int]]:
+        """
+        Obtiene partidas por ID de juego con paginación y ordenamiento.
+        Admite paginación por cursor (pagination.cursor / include_total).
+        """
         return await self.get_paginated_mixin(
             model=self.model,
-            db_session=self.db,
+            db_session=self.read_db,
             pagination=pagination,
             filters=filters,
             sort_params=sort_params,
             to_entity=self._model_to_entity,
             custom_filter_fn=lambda stmt: stmt.where(self.model.game_id == game_id),
             load_options=self.get_load_options(),
+            cursor_field=self.model.match_id,
         )
 
+    async def get_open_by_game_id(
+        self, game_id: str, capacity: int, pagination: PaginationParams
+    ) -> Tuple[List[MatchEntity], Optional[int]]:
+        """
+        Lobby: partidas sin terminar y con lugar libre, de la más antigua a
+        la más nueva. Usa el índice parcial ix_matches_open_lobby y el
+        contador participant_count en lugar de cargar participaciones.
+        """
+        return await self.get_paginated_mixin(
+            model=self.model,
+            db_session=self.read_db,
+            pagination=pagination,
+            sort_params=SortParams(sort_by="created_at", sort_order="asc"),
+            to_entity=self._model_to_entity,
+            custom_filter_fn=lambda stmt: stmt.where(
+                self.model.game_id == game_id,
+                self.model.is_finished == false(),
+                self.model.participant_count < capacity,
+            ),
+            # Solo los IDs de participantes: sin los joins de match/user/game
+            load_options=[
+                lazyload(self.model.game),
+                selectinload(self.model.participants).options(
+                    lazyload(MatchParticipationModel.match),
+                    lazyload(MatchParticipationModel.user),
+                ),
+            ],
+            cursor_field=self.model.match_id,
+        )
+
+    async def reserve_participant_slot(self, match_id: str, capacity: int) -> bool:
+        """
+        Ocupa un lugar en la partida con un UPDATE condicional, sin hacer
+        commit. La fila queda bloqueada hasta el commit, así dos uniones
+        simultáneas no pueden superar la capacidad.
+        """
+        stmt = (
+            update(self.model)
+            .where(
+                self.model.match_id == match_id,
+                self.model.is_finished == false(),
+                self.model.participant_count < capacity,
+            )
+            .values(participant_count=self.model.participant_count + 1)
+            .returning(self.model.participant_count)
+            .execution_options(synchronize_session=False)
+        )
+        return await self.db.scalar(stmt) is not None
+
     async def get_match_participant_ids(self, match_id: str) -> List[str]:
         """Obtiene la lista de IDs de participantes de una partida."""
         try:
@@ -97,6 +155,78 @@ class PostgresMatchRepository(
             await self.db.rollback()
             raise
 
+    async def settle(
+        self,
+        match_id: str,
+        winner_id: Optional[str],
+        calculate_reward: Callable[[MatchEntity, Optional[float]], float],
+    ) -> MatchSettlement:
+        """Finaliza la partida y paga al ganador con un único commit."""
+        try:
+            # Bloquear la partida para que dos liquidaciones no se crucen
+            stmt = (
+                select(self.model)
+                .options(
+                    lazyload(self.model.game), selectinload(self.model.participants)
+                )
+                .where(self.model.match_id == match_id)
+                .with_for_update(of=self.model)
+            )
+            result = await self.db.execute(stmt)
+            match_model = result.scalar_one_or_none()
+
+            if not match_model:
+                raise MatchNotFoundError(f"Match with ID {match_id} not found")
+
+            house_odds = await self.db.scalar(
+                select(GameModel.house_odds).where(
+                    GameModel.game_id == match_model.game_id
+                )
+            )
+
+            match = self._model_to_entity(match_model)
+            reward = calculate_reward(match, house_odds)
+
+            updated_at = await self.db.scalar(
+                update(self.model)
+                .where(self.model.match_id == match_id)
+                .values(winner_id=winner_id, is_finished=True)
+                .returning(self.model.updated_at)
+            )
+
+            # Suma atómica: no se pierden pagos concurrentes al mismo usuario
+            winner_balance = None
+            if winner_id and reward > 0:
+                winner_balance = await self.db.scalar(
+                    update(UserModel)
+                    .where(UserModel.user_id == winner_id)
+                    .values(virtual_currency=UserModel.virtual_currency + reward)
+                    .returning(UserModel.virtual_currency)
+                )
+                if winner_balance is None:
+                    raise UserNotFoundError(f"Winner with ID {winner_id} not found")
+
+            await self.db.commit()
+            if winner_balance is not None:
+                invalidate_principal(winner_id)
+
+            match.winner_id = winner_id
+            match.is_finished = True
+            match.updated_at = updated_at
+
+            self.logger.info(f"Successfully settled match: {match_id}")
+            return MatchSettlement(
+                match=match,
+                house_odds=house_odds,
+                reward=reward,
+                winner_balance=winner_balance,
+            )
+
+        except Exception as e:
+            self.logger.error(f"Error settling match {match_id}: {e}")
+            await self.db.rollback()
+            raise
+
     async def get_by_id(self, entity_id: str) -> Optional[MatchEntity]:
         """Obtiene una partida por ID con sus participaciones."""
         try:
@@ -160,6 +290,7 @@ class PostgresMatchRepository(
             winner_id=entity.winner_id,
             is_finished=entity.is_finished,
             participants=participants,
+            participant_count=len(participants),
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
@@ -32,7 +32,7 @@ class PostgresTransferPaymentRepository(
 
         return await self.get_paginated_mixin(
             model=self.model,
-            db_session=self.db,
+            db_session=self.read_db,
             pagination=pagination,
             filters=filters,
             sort_params=sort_params,
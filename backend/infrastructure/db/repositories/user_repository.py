@@ -7,7 +7,8 @@ from api.http.common.filters.specific_filters import UserFilterParams
 from domain.entities import UserEntity
 from domain.exceptions import UserNotFoundError
 from domain.repositories import IUserRepository
-from sqlalchemy import select
+from infrastructure.cache import invalidate_after_commit, invalidate_principal
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import UserModel
@@ -48,10 +49,34 @@ class PostgresUserRepository(
             user_model.virtual_currency = user.virtual_currency
             user_model.role = user.role
             await self.db.commit()
+            # El saldo o el rol pudieron cambiar: descartar el usuario cacheado
+            invalidate_principal(user_id)
             self.logger.info(f"Successfully updated user: {user_id}")
         else:
             raise UserNotFoundError(f"User with ID {user_id} not found")
 
+    async def debit_if_sufficient(self, user_id: str, amount: float) -> Optional[float]:
+        """Descuenta saldo con un UPDATE condicional, sin hacer commit."""
+        if amount < 0:
+            raise ValueError("Amount to deduct must be positive")
+
+        stmt = (
+            update(self.model)
+            .where(
+                self.model.user_id == user_id,
+                self.model.virtual_currency >= amount,
+            )
+            .values(virtual_currency=self.model.virtual_currency - amount)
+            .returning(self.model.virtual_currency)
+        )
+        new_balance = await self.db.scalar(stmt)
+
+        if new_balance is None:
+            self.logger.debug(f"Debit of {amount} rejected for user: {user_id}")
+        else:
+            invalidate_after_commit(self.db, lambda: invalidate_principal(user_id))
+        return new_balance
+
     def _model_to_entity(self, model: UserModel) -> UserEntity:
         """Convierte UserModel a UserEntity."""
         return UserEntity(
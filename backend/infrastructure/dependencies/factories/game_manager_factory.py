@@ -49,6 +49,10 @@ class GameManagerRegistry:
         """Retorna la lista de tipos de juego disponibles"""
         return list(self._managers.keys())
 
+    def get_instances(self) -> list[BaseGameWebSocketManager]:
+        """Retorna los managers ya creados"""
+        return list(self._instances.values())
+
 
 # Instancia global del registry
 _game_manager_registry = GameManagerRegistry()
@@ -90,3 +94,8 @@ def register_game_manager(
 def get_available_game_types() -> list[str]:
     """Retorna la lista de tipos de juego disponibles"""
     return _game_manager_registry.get_available_game_types()
+
+
+def get_active_game_managers() -> list[BaseGameWebSocketManager]:
+    """Retorna los managers de juego instanciados (uno o más por tipo)"""
+    return _game_manager_registry.get_instances()
@@ -3,6 +3,12 @@ Proveedores de repositorios para acceso a datos.
 
 Este módulo contiene las funciones que crean instancias de repositorios
 configurados con las conexiones de base de datos apropiadas.
+
+Los listados (get_paginated y similares) y los repositorios de solo lectura
+usan get_async_read_db, que apunta a la réplica si DATABASE_READ_URL está
+configurada. Las rutas que necesiten leer sus propias escrituras se decoran
+con @use_primary_for_reads o el cliente envía X-Read-Your-Writes: 1; los
+WebSocket leen siempre de la principal.
 """
 
 from domain.repositories import (
@@ -15,7 +21,7 @@ from domain.repositories import (
 )
 from fastapi import Depends
 from domain.repositories.app_info_repository import IAppInfoRepository
-from infrastructure.db.connection import get_async_db
+from infrastructure.db.connection import get_async_db, get_async_read_db
 from infrastructure.db.models import (
     CategoryModel,
     GameModel,
@@ -50,21 +56,25 @@ def get_user_repository(db: AsyncSession = Depends(get_async_db)) -> IUserReposi
     return PostgresUserRepository(db, UserModel)
 
 
-def get_game_repository(db: AsyncSession = Depends(get_async_db)) -> IGameRepository:
+def get_game_repository(
+    db: AsyncSession = Depends(get_async_db),
+    read_db: AsyncSession = Depends(get_async_read_db),
+) -> IGameRepository:
     """
     Proveedor para el repositorio de juegos.
 
     Args:
-        db: Sesión de base de datos inyectada
+        db: Sesión principal (agregados de reseñas)
+        read_db: Sesión de lectura
 
     Returns:
         IGameRepository: Repositorio de juegos configurado
     """
-    return PostgresGameRepository(db, GameModel)
+    return PostgresGameRepository(db, GameModel, read_session=read_db)
 
 
 def get_category_repository(
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> ICategoryRepository:
     """
     Proveedor para el repositorio de categorías.
@@ -80,48 +90,58 @@ def get_category_repository(
 
 def get_game_review_repository(
     db: AsyncSession = Depends(get_async_db),
+    read_db: AsyncSession = Depends(get_async_read_db),
 ) -> IGameReviewRepository:
     """
     Proveedor para el repositorio de reseñas de juegos.
 
     Args:
         db: Sesión de base de datos inyectada
+        read_db: Sesión para los listados
 
     Returns:
         IGameReviewRepository: Repositorio de reseñas configurado
     """
-    return PostgresGameReviewRepository(db, GameReviewModel)
+    return PostgresGameReviewRepository(db, GameReviewModel, read_session=read_db)
 
 
 def get_transfer_payment_repository(
     db: AsyncSession = Depends(get_async_db),
+    read_db: AsyncSession = Depends(get_async_read_db),
 ) -> ITransferPaymentRepository:
     """
     Proveedor para el repositorio de transferencias de pago.
 
     Args:
         db: Sesión de base de datos inyectada
+        read_db: Sesión para los listados
 
     Returns:
         ITransferPaymentRepository: Repositorio de transferencias configurado
     """
-    return PostgresTransferPaymentRepository(db, TransferPaymentModel)
+    return PostgresTransferPaymentRepository(db, TransferPaymentModel, read_session=read_db)
 
 
-def get_match_repository(db: AsyncSession = Depends(get_async_db)) -> IMatchRepository:
+def get_match_repository(
+    db: AsyncSession = Depends(get_async_db),
+    read_db: AsyncSession = Depends(get_async_read_db),
+) -> IMatchRepository:
     """
     Proveedor para el repositorio de partidas.
 
     Args:
         db: Sesión de base de datos inyectada
+        read_db: Sesión para los listados
 
     Returns:
         IMatchRepository: Repositorio de partidas configurado
     """
-    return PostgresMatchRepository(db, MatchModel)
+    return PostgresMatchRepository(db, MatchModel, read_session=read_db)
 
 
-def get_app_info_repository(db: AsyncSession = Depends(get_async_db)) -> IAppInfoRepository:
+def get_app_info_repository(
+    db: AsyncSession = Depends(get_async_read_db),
+) -> IAppInfoRepository:
     """
     Proveedor para el repositorio de información de la aplicación.
 
@@ -1,10 +1,14 @@
-from application.services import PasswordHasher
+from application.services import BoundedExecutor, PasswordHasher
 from domain.interfaces import IPasswordHasher, ITokenProvider
 from infrastructure.auth.jwt_service import JWTService
 from infrastructure.auth.security import CustomHTTPBearer
 from passlib.context import CryptContext
 
 
+# Instancia única: el pool de hashing se comparte entre todas las peticiones
+_password_hasher_instance = None
+
+
 def get_password_hasher() -> IPasswordHasher:
     """
     Proveedor para el servicio de hash de contraseñas.
@@ -12,9 +16,13 @@ def get_password_hasher() -> IPasswordHasher:
     Returns:
         IPasswordHasher: Servicio de hash de contraseñas
     """
-    hasher = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-    return PasswordHasher(hasher)
+    global _password_hasher_instance
+    if _password_hasher_instance is None:
+        hasher = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        _password_hasher_instance = PasswordHasher(
+            hasher, executor=BoundedExecutor("password-hasher")
+        )
+    return _password_hasher_instance
 
 
 def get_token_provider() -> ITokenProvider:
@@ -1,3 +1,11 @@
-from .providers import get_game_finish_service, get_game_websocket_manager
+from .providers import (
+    get_game_finish_service,
+    get_game_websocket_manager,
+    get_settlement_queue,
+)
 
-__all__ = ["get_game_websocket_manager", "get_game_finish_service"]
+__all__ = [
+    "get_game_websocket_manager",
+    "get_game_finish_service",
+    "get_settlement_queue",
+]
@@ -1,16 +1,54 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from application.services.game_finish_service import GameFinishService
+from application.services.settlement_queue import SettlementQueue
 from application.use_cases.match.finish_match import FinishMatchUseCase
 from fastapi import Depends
+from infrastructure.db.connection import AsyncSessionLocal
 
 from ...websockets.unified_game_manager import UnifiedGameWebSocketManager
+from ..converters.match_converters import get_match_converter
+from ..repositories.database_repos import get_match_repository
 from ..use_cases.match_participations_use_cases import get_finish_match_use_case
 
 
+@asynccontextmanager
+async def settlement_finish_service() -> AsyncIterator[GameFinishService]:
+    """Provides a GameFinishService with its own session for one settlement."""
+    async with AsyncSessionLocal() as db:
+        finish_match_use_case = FinishMatchUseCase(
+            match_repo=get_match_repository(db, read_db=db),
+            match_converter=get_match_converter(),
+        )
+        yield GameFinishService(finish_match_use_case=finish_match_use_case)
+
+
+# Instancia singleton de la cola de liquidación de partidas
+_settlement_queue_instance = None
+
+
+def get_settlement_queue() -> SettlementQueue:
+    """Returns the singleton SettlementQueue used for automatic game finishes."""
+    global _settlement_queue_instance
+
+    if _settlement_queue_instance is None:
+        _settlement_queue_instance = SettlementQueue(
+            finish_service_factory=settlement_finish_service
+        )
+
+    return _settlement_queue_instance
+
+
 def get_game_finish_service(
     finish_match_use_case: FinishMatchUseCase = Depends(get_finish_match_use_case),
+    settlement_queue: SettlementQueue = Depends(get_settlement_queue),
 ) -> GameFinishService:
     """Returns an instance of GameFinishService with all dependencies."""
-    return GameFinishService(finish_match_use_case=finish_match_use_case)
+    return GameFinishService(
+        finish_match_use_case=finish_match_use_case,
+        settlement_queue=settlement_queue,
+    )
 
 
 # Instancia singleton del UnifiedGameWebSocketManager
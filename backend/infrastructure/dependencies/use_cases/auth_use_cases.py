@@ -10,6 +10,7 @@ from dtos.response.auth.auth_response_dto import LoginResponseDTO
 from dtos.response.user.user_response import UserResponseDTO
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials
+from infrastructure.cache import get_principal_cache
 from infrastructure.dependencies.converters.auth_converters import get_login_assembler
 
 from ..converters import get_user_converter, get_user_registration_converter
@@ -86,7 +87,9 @@ def get_current_user_use_case(
     Returns:
         GetCurrentUserUseCase: Caso de uso configurado
     """
-    return GetCurrentUserUseCase(user_repo, token_provider, user_converter)
+    return GetCurrentUserUseCase(
+        user_repo, token_provider, user_converter, get_principal_cache()
+    )
 
 
 async def get_current_user_from_request_use_case(
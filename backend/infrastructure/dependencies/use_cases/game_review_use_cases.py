@@ -9,7 +9,7 @@ from application.use_cases.game import (
     GetGameReviewsByGameIdUseCase,
     UpdateGameReviewUseCase,
 )
-from domain.repositories import IGameReviewRepository
+from domain.repositories import IGameRepository, IGameReviewRepository
 from dtos.response.user.user_response import UserBaseResponseDTO
 from fastapi import Depends
 
@@ -17,7 +17,7 @@ from ..converters import (
     get_game_review_converter,
     get_game_review_entity_to_dto_converter,
 )
-from ..repositories import get_game_review_repository
+from ..repositories import get_game_repository, get_game_review_repository
 from .auth_use_cases import get_current_user_from_request_use_case
 
 
@@ -48,11 +48,13 @@ def get_game_review_by_id_use_case(
 def get_create_game_review_use_case(
     user: UserBaseResponseDTO = Depends(get_current_user_from_request_use_case),
     game_review_repo: IGameReviewRepository = Depends(get_game_review_repository),
+    game_repo: IGameRepository = Depends(get_game_repository),
     review_converter: BidirectionalConverter = Depends(get_game_review_converter),
 ) -> CreateGameReviewUseCase:
     return CreateGameReviewUseCase(
         user=user,
         review_repository=game_review_repo,
+        game_repository=game_repo,
         game_review_converter=review_converter,
     )
 
@@ -60,11 +62,13 @@ def get_create_game_review_use_case(
 def get_update_game_review_use_case(
     user: UserBaseResponseDTO = Depends(get_current_user_from_request_use_case),
     game_review_repo: IGameReviewRepository = Depends(get_game_review_repository),
+    game_repo: IGameRepository = Depends(get_game_repository),
     review_converter: BidirectionalConverter = Depends(get_game_review_converter),
 ) -> UpdateGameReviewUseCase:
     return UpdateGameReviewUseCase(
         user=user,
         review_repository=game_review_repo,
+        game_repository=game_repo,
         game_review_converter=review_converter,
     )
 
@@ -72,10 +76,12 @@ def get_update_game_review_use_case(
 def get_delete_game_review_use_case(
     user: UserBaseResponseDTO = Depends(get_current_user_from_request_use_case),
     game_review_repo: IGameReviewRepository = Depends(get_game_review_repository),
+    game_repo: IGameRepository = Depends(get_game_repository),
 ) -> DeleteGameReviewUseCase:
     return DeleteGameReviewUseCase(
         user=user,
         review_repository=game_review_repo,
+        game_repository=game_repo,
     )
 
 
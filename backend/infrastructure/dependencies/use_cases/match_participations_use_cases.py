@@ -4,7 +4,6 @@ from application.mixins.dto_converter_mixin import BidirectionalConverter
 from application.use_cases.match import GetMatchParticipantsUseCase, JoinMatchUseCase
 from application.use_cases.match.finish_match import FinishMatchUseCase
 from domain.interfaces.base_assembler import BaseAssembler
-from domain.repositories.game_repository import IGameRepository
 from domain.repositories.match_repository import IMatchRepository
 from domain.repositories.user_repository import IUserRepository
 from dtos.response.user.user_response import UserResponseDTO
@@ -55,15 +54,11 @@ def get_join_match_use_case(
 
 def get_finish_match_use_case(
     match_repo: IMatchRepository = Depends(get_match_repository),
-    user_repo: IUserRepository = Depends(get_user_repository),
-    game_repo: IGameRepository = Depends(get_game_repository),
     match_converter: BidirectionalConverter = Depends(get_match_converter),
 ) -> FinishMatchUseCase:
     """Get update match use case dependency."""
     return FinishMatchUseCase(
         match_repo=match_repo,
-        user_repo=user_repo,
-        game_repo=game_repo,
         match_converter=match_converter,
     )
 
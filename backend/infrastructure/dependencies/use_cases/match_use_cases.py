@@ -6,6 +6,7 @@ from application.use_cases.match import (
     CreateMatchUseCase,
     GetMatchByIdUseCase,
     GetMatchesByGameIdUseCase,
+    GetOpenMatchesByGameIdUseCase,
 )
 from domain.repositories.game_repository import IGameRepository
 from domain.repositories.match_repository import IMatchRepository
@@ -56,6 +57,19 @@ def get_matches_by_game_id_use_case(
     )
 
 
+def get_open_matches_by_game_id_use_case(
+    match_repo: IMatchRepository = Depends(get_match_repository),
+    match_converter: EntityToDTOConverter = Depends(get_match_entity_to_dto_converter),
+    game_repo: IGameRepository = Depends(get_game_repository),
+) -> GetOpenMatchesByGameIdUseCase:
+    """Get open matches (lobby) use case dependency."""
+    return GetOpenMatchesByGameIdUseCase(
+        match_repo=match_repo,
+        game_repo=game_repo,
+        match_converter=match_converter,
+    )
+
+
 def get_match_by_id_use_case(
     match_repo: IMatchRepository = Depends(get_match_repository),
     game_repo: IGameRepository = Depends(get_game_repository),
@@ -72,5 +86,6 @@ def get_match_by_id_use_case(
 __all__ = [
     "get_create_match_use_case",
     "get_matches_by_game_id_use_case",
+    "get_open_matches_by_game_id_use_case",
     "get_match_by_id_use_case",
 ]
@@ -1,2 +1,9 @@
-from .decorators import log_execution, log_performance
+from .context import (
+    bind_log_context,
+    get_request_id,
+    new_request_id,
+    request_id_var,
+)
+from .decorators import log_execution, log_performance, refresh_log_decorators
+from .latency import LatencyHistogram, get_latency_registry
 from .logging_config import LoggingConfig, app_logger, get_logger
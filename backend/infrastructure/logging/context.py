@@ -0,0 +1,37 @@
+import random
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+# ID del request HTTP en curso; lo fija LoggingMiddleware
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Partida y usuario de la conexión o request en curso
+match_id_var: ContextVar[Optional[str]] = ContextVar("match_id", default=None)
+user_id_var: ContextVar[Optional[str]] = ContextVar("user_id", default=None)
+
+# Campos de contexto que se agregan a cada registro de log
+LOG_CONTEXT_VARS: Dict[str, ContextVar[Optional[str]]] = {
+    "request_id": request_id_var,
+    "match_id": match_id_var,
+    "user_id": user_id_var,
+}
+
+
+def new_request_id() -> str:
+    """ID corto de request (8 caracteres hex) sin llamadas al sistema"""
+    return f"{random.getrandbits(32):08x}"
+
+
+def get_request_id() -> Optional[str]:
+    """Obtiene el ID del request en curso, si lo hay"""
+    return request_id_var.get()
+
+
+def bind_log_context(**fields: Any) -> None:
+    """
+    Fija campos de contexto (match_id, user_id, ...) para el resto de la
+    tarea actual; cada request y cada conexión WebSocket tienen su propia
+    copia del contexto.
+    """
+    for name, value in fields.items():
+        LOG_CONTEXT_VARS[name].set(None if value is None else str(value))
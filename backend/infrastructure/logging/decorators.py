@@ -1,9 +1,12 @@
 import asyncio
 import functools
+import logging
+import sys
 import time
-from typing import Any, Callable, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from infrastructure.logging.logging_config import get_logger
+from infrastructure.logging.latency import LatencyHistogram, get_latency_registry
+from infrastructure.logging.logging_config import LoggingConfig, get_logger
 
 logger = get_logger("decorators")
 
@@ -101,6 +104,7 @@ def _execute_with_logging(
     include_args: bool,
     include_result: bool,
     log_level: str,
+    recorder: Optional["_LatencyRecorder"] = None,
 ) -> Tuple[Any, float]:
     """Execute function with logging and return result and duration."""
     args_info = ""
@@ -121,6 +125,9 @@ def _execute_with_logging(
         duration = time.perf_counter() - start_time
         _log_execution_error(func_name, class_name, e, duration)
         raise
+    finally:
+        if recorder is not None:
+            recorder.observe(args, time.perf_counter() - start_time)
 
 
 async def _async_execute_with_logging(
@@ -132,6 +139,7 @@ async def _async_execute_with_logging(
     include_args: bool,
     include_result: bool,
     log_level: str,
+    recorder: Optional["_LatencyRecorder"] = None,
 ) -> Tuple[Any, float]:
     """Execute async function with logging and return result and duration."""
     args_info = ""
@@ -152,6 +160,129 @@ async def _async_execute_with_logging(
         duration = time.perf_counter() - start_time
         _log_execution_error(func_name, class_name, e, duration)
         raise
+    finally:
+        if recorder is not None:
+            recorder.observe(args, time.perf_counter() - start_time)
+
+
+class _LatencyRecorder:
+    """
+    Registra la latencia de un sitio decorado. En métodos, el histograma es
+    el de la clase concreta (ej. GetAllGamesUseCase.execute y no
+    BasePaginatedUseCase.execute).
+    """
+
+    def __init__(self, func: Callable, threshold: Optional[float]):
+        self.func_name = func.__name__
+        self.qualname = func.__qualname__
+        self.threshold = threshold
+        self.is_method = "." in self.qualname and "<locals>" not in self.qualname
+        self._histograms: Dict[type, LatencyHistogram] = {}
+
+    def observe(self, args: tuple, duration: float) -> None:
+        owner = type(args[0]) if self.is_method and args else None
+        histogram = self._histograms.get(owner)
+        if histogram is None:
+            name = self.qualname
+            if owner is not None:
+                name = f"{owner.__name__}.{self.func_name}"
+            histogram = get_latency_registry().get(name, self.threshold)
+            self._histograms[owner] = histogram
+        histogram.observe(duration)
+
+
+class _Layer:
+    """Un decorador aplicado: cuándo está activo y cómo envuelve la función"""
+
+    def __init__(
+        self,
+        is_active: Callable[[], bool],
+        wrap: Callable[[Callable, Optional[_LatencyRecorder]], Callable],
+        threshold: Optional[float] = None,
+    ):
+        self.is_active = is_active
+        self.wrap = wrap
+        self.threshold = threshold
+
+
+class _DecoratedSite:
+    """
+    Función decorada con sus capas de logging.
+
+    Cada capa inactiva se omite por completo, así que si ninguna está activa
+    se usa la función original sin wrappers. Solo la capa activa más interna
+    registra la latencia para no contar dos veces la misma llamada.
+    """
+
+    def __init__(self, func: Callable):
+        self.original = func
+        self.layers: List[_Layer] = []
+        self.current = func
+
+    def build(self) -> Callable:
+        impl = self.original
+        recorder = None
+        for layer in self.layers:
+            if not layer.is_active():
+                continue
+            if recorder is None:
+                threshold = next(
+                    (item.threshold for item in self.layers if item.threshold), None
+                )
+                recorder = _LatencyRecorder(self.original, threshold)
+                impl = layer.wrap(impl, recorder)
+            else:
+                impl = layer.wrap(impl, None)
+        self.current = impl
+        return impl
+
+
+_sites: Dict[Tuple[str, str], _DecoratedSite] = {}
+
+
+def _decorate(func: Callable, layer: _Layer) -> Callable:
+    """Agrega la capa al sitio de la función y devuelve la implementación"""
+    key = (func.__module__, func.__qualname__)
+    site = _sites.get(key)
+    if site is None or site.current is not func:
+        site = _sites[key] = _DecoratedSite(func)
+    site.layers.append(layer)
+    return site.build()
+
+
+def refresh_log_decorators() -> int:
+    """
+    Vuelve a decidir qué decoradores están activos tras cambiar niveles de
+    log y reemplaza los métodos en sus clases. Retorna cuántos cambiaron.
+    """
+    changed = 0
+    for (module_name, qualname), site in _sites.items():
+        owner, attr = _resolve_owner(module_name, qualname)
+        previous = site.current
+        if owner is None or vars(owner).get(attr) is not previous:
+            continue
+        current = site.build()
+        if current is not previous:
+            setattr(owner, attr, current)
+            changed += 1
+    if changed:
+        logger.debug(f"Log decorators refreshed: {changed} changed")
+    return changed
+
+
+# setup_logging puede cambiar los niveles: se revisan los decoradores
+LoggingConfig.add_reconfigure_hook(refresh_log_decorators)
+
+
+def _resolve_owner(module_name: str, qualname: str) -> Tuple[Any, str]:
+    """Clase (o módulo) donde está definida la función"""
+    parts = qualname.split(".")
+    owner = sys.modules.get(module_name)
+    if "<locals>" in parts:
+        return None, parts[-1]
+    for part in parts[:-1]:
+        owner = getattr(owner, part, None)
+    return owner, parts[-1]
 
 
 def log_execution(
@@ -160,50 +291,51 @@ def log_execution(
     """
     Decorador que registra la ejecución de métodos/funciones, soporta async y sync.
 
+    Si el nivel no está habilitado al decorar se devuelve la función sin
+    envolver (ver refresh_log_decorators).
+
     Args:
         include_args: Si incluir los argumentos en el log
         include_result: Si incluir el resultado en el log
         log_level: Nivel de log (DEBUG, INFO, WARNING, ERROR)
     """
+    level = logging.getLevelName(log_level.upper())
 
-    def decorator(func: Callable) -> Callable:
-        is_coroutine = asyncio.iscoroutinefunction(func)
-
+    def wrap(func: Callable, recorder: Optional[_LatencyRecorder]) -> Callable:
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs) -> Any:
-            func_name = func.__name__
-            class_name = _get_class_name(args)
-
             result, _ = await _async_execute_with_logging(
                 func,
                 args,
                 kwargs,
-                func_name,
-                class_name,
+                func.__name__,
+                _get_class_name(args),
                 include_args,
                 include_result,
                 log_level,
+                recorder,
             )
             return result
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs) -> Any:
-            func_name = func.__name__
-            class_name = _get_class_name(args)
-
             result, _ = _execute_with_logging(
                 func,
                 args,
                 kwargs,
-                func_name,
-                class_name,
+                func.__name__,
+                _get_class_name(args),
                 include_args,
                 include_result,
                 log_level,
+                recorder,
             )
             return result
 
-        return async_wrapper if is_coroutine else sync_wrapper
+        return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
+
+    def decorator(func: Callable) -> Callable:
+        return _decorate(func, _Layer(lambda: logger.isEnabledFor(level), wrap))
 
     return decorator
 
@@ -236,31 +368,43 @@ def _check_and_log_performance(
 
 def log_performance(threshold_seconds: float = 1.0):
     """
-    Decorador que registra métodos que tardan más de un umbral específico.
-    Soporta funciones async y sync.
+    Decorador que mide la latencia de métodos en un histograma (percentiles
+    en get_latency_registry) y registra los que superan el umbral.
+    Soporta funciones async y sync; si WARNING no está habilitado devuelve
+    la función sin envolver.
     """
 
-    def decorator(func: Callable) -> Callable:
-        is_coroutine = asyncio.iscoroutinefunction(func)
-
+    def wrap(func: Callable, recorder: Optional[_LatencyRecorder]) -> Callable:
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
             start = time.perf_counter()
-            result = await func(*args, **kwargs)
-            duration = time.perf_counter() - start
-
-            _check_and_log_performance(func, args, duration, threshold_seconds)
-            return result
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - start
+                if recorder is not None:
+                    recorder.observe(args, duration)
+                _check_and_log_performance(func, args, duration, threshold_seconds)
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
             start = time.perf_counter()
-            result = func(*args, **kwargs)
-            duration = time.perf_counter() - start
+            try:
+                return func(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - start
+                if recorder is not None:
+                    recorder.observe(args, duration)
+                _check_and_log_performance(func, args, duration, threshold_seconds)
 
-            _check_and_log_performance(func, args, duration, threshold_seconds)
-            return result
+        return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
 
-        return async_wrapper if is_coroutine else sync_wrapper
+    def decorator(func: Callable) -> Callable:
+        return _decorate(
+            func,
+            _Layer(
+                lambda: logger.isEnabledFor(logging.WARNING), wrap, threshold_seconds
+            ),
+        )
 
     return decorator
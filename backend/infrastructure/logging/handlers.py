@@ -0,0 +1,128 @@
+import copy
+import logging
+import random
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional, Tuple
+
+from .context import LOG_CONTEXT_VARS
+
+# Formatter usado solo para serializar tracebacks antes de encolar
+_exception_formatter = logging.Formatter()
+
+
+class ContextFilter(logging.Filter):
+    """
+    Copia los campos de contexto (request_id, match_id, user_id) al registro.
+    Debe correr en el hilo que emite el log: el listener no ve los contextvars.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for name, var in LOG_CONTEXT_VARS.items():
+            setattr(record, name, var.get())
+        return True
+
+
+class LogVolumeFilter(logging.Filter):
+    """
+    Muestreo y límite por segundo de registros por logger.
+
+    Las reglas se indican por nombre de logger y aplican también a sus
+    hijos (la regla de "websockets" cubre "websockets.game_handler"); gana
+    la más específica. WARNING y superiores nunca se descartan.
+    """
+
+    def __init__(
+        self,
+        sample_rates: Optional[Dict[str, float]] = None,
+        rate_limits: Optional[Dict[str, int]] = None,
+    ):
+        super().__init__()
+        self.sample_rates = dict(sample_rates or {})
+        self.rate_limits = dict(rate_limits or {})
+        self._rules: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._windows: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        rule = self._rules.get(record.name)
+        if rule is None:
+            rule = self._rules[record.name] = self._resolve(record.name)
+        sample_rate, limit_key = rule
+
+        if sample_rate < 1.0 and random.random() >= sample_rate:
+            self.dropped += 1
+            return False
+        if limit_key is not None and not self._within_limit(limit_key, record):
+            self.dropped += 1
+            return False
+        return True
+
+    def _resolve(self, name: str) -> Tuple[float, Optional[str]]:
+        """Busca la regla más específica para el logger y sus padres"""
+        sample_key = _lookup_key(self.sample_rates, name)
+        sample_rate = 1.0 if sample_key is None else self.sample_rates[sample_key]
+        return sample_rate, _lookup_key(self.rate_limits, name)
+
+    def _within_limit(self, key: str, record: logging.LogRecord) -> bool:
+        """Ventana fija de un segundo por regla"""
+        second = int(record.created)
+        with self._lock:
+            window, count = self._windows.get(key, (second, 0))
+            if window != second:
+                window, count = second, 0
+            count += 1
+            self._windows[key] = (window, count)
+        return count <= self.rate_limits[key]
+
+
+class ContextQueueHandler(QueueHandler):
+    """
+    QueueHandler que deja el registro listo para otro hilo: mensaje ya
+    interpolado y traceback como texto, conservando los campos de contexto.
+    """
+
+    def __init__(self, queue, route: str):
+        super().__init__(queue)
+        self.route = route
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        record.log_route = self.route
+        return record
+
+
+class RoutingQueueListener(QueueListener):
+    """
+    Un único hilo que escribe los registros de todos los loggers; cada
+    registro va a los handlers configurados para el logger que lo emitió.
+    """
+
+    def __init__(self, queue, routes: Dict[str, List[logging.Handler]]):
+        super().__init__(queue, respect_handler_level=True)
+        self.routes = routes
+
+    def handle(self, record: logging.LogRecord) -> None:
+        record = self.prepare(record)
+        for handler in self.routes.get(getattr(record, "log_route", ""), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def _lookup_key(rules: Dict, name: str) -> Optional[str]:
+    """Regla del logger o de su ancestro más cercano ("root" cubre todos)"""
+    while name:
+        if name in rules:
+            return name
+        name = name.rpartition(".")[0]
+    return "root" if "root" in rules else None
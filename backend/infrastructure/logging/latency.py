@@ -0,0 +1,130 @@
+import bisect
+import math
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+# Límites superiores de los buckets en segundos (estilo Prometheus)
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    math.inf,
+)
+
+
+class LatencyHistogram:
+    """
+    Histograma de latencias con buckets fijos.
+
+    Registrar una muestra cuesta una búsqueda binaria y un incremento; los
+    percentiles se estiman interpolando dentro del bucket, igual que
+    histogram_quantile de Prometheus.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: Optional[float] = None,
+        buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.threshold = threshold
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.slow = 0
+
+    def observe(self, duration: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.sum += duration
+        if duration > self.max:
+            self.max = duration
+        if self.threshold is not None and duration > self.threshold:
+            self.slow += 1
+
+    def percentile(self, q: float) -> float:
+        """Estima el percentil q (0-1) a partir de los buckets"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        lower = 0.0
+        for upper, bucket_count in zip(self.buckets, self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                if math.isinf(upper):
+                    return self.max
+                fraction = (rank - cumulative) / bucket_count
+                return min(lower + (upper - lower) * fraction, self.max)
+            cumulative += bucket_count
+            lower = upper
+        return self.max
+
+    def cumulative_counts(self) -> Tuple[Tuple[float, int], ...]:
+        """Pares (límite superior, muestras <= límite) para exportar"""
+        total = 0
+        result = []
+        for upper, bucket_count in zip(self.buckets, self.counts):
+            total += bucket_count
+            result.append((upper, total))
+        return tuple(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.sum / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.50) * 1000, 3),
+            "p95_ms": round(self.percentile(0.95) * 1000, 3),
+            "p99_ms": round(self.percentile(0.99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "threshold_ms": (
+                None if self.threshold is None else round(self.threshold * 1000, 3)
+            ),
+            "slow": self.slow,
+        }
+
+
+class LatencyRegistry:
+    """Histogramas de latencia por nombre (ej. 'LoginUserUseCase.execute')"""
+
+    def __init__(self):
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, threshold: Optional[float] = None) -> LatencyHistogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    name, LatencyHistogram(name, threshold)
+                )
+        if threshold is not None and histogram.threshold is None:
+            histogram.threshold = threshold
+        return histogram
+
+    def histograms(self) -> Tuple[LatencyHistogram, ...]:
+        return tuple(self._histograms.values())
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: histogram.get_stats()
+            for name, histogram in sorted(self._histograms.items())
+        }
+
+
+_latency_registry = LatencyRegistry()
+
+
+def get_latency_registry() -> LatencyRegistry:
+    """Obtiene el registro global de histogramas de latencia"""
+    return _latency_registry
@@ -1,12 +1,24 @@
+import atexit
+import json
 import logging
 import logging.config
 import logging.handlers
+import queue
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from infrastructure.core.settings_config import settings
 
+from .context import LOG_CONTEXT_VARS
+from .handlers import (
+    ContextFilter,
+    ContextQueueHandler,
+    LogVolumeFilter,
+    RoutingQueueListener,
+)
+
 
 def get_relative_path(file_path: str) -> str:
     """Convierte una ruta absoluta a relativa al proyecto."""
@@ -26,8 +38,48 @@ class CustomFormatter(logging.Formatter):
         return super().format(record)
 
 
+class JsonFormatter(logging.Formatter):
+    """Formatter de una línea JSON por registro, con los campos de contexto."""
+
+    def format(self, record):
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "file": get_relative_path(record.pathname),
+            "line": record.lineno,
+        }
+        for name in LOG_CONTEXT_VARS:
+            value = getattr(record, name, None)
+            if value is not None:
+                payload[name] = value
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
 class LoggingConfig:
-    """Configuración centralizada de logging."""
+    """
+    Configuración centralizada de logging.
+
+    Los loggers no escriben directamente en consola ni en archivos: encolan
+    el registro y un único hilo (QueueListener) hace la E/S, así el event
+    loop nunca se bloquea escribiendo logs.
+    """
+
+    _queue_listener: Optional[RoutingQueueListener] = None
+    # Se ejecutan cada vez que se (re)configuran los niveles de log
+    _reconfigure_hooks: List[Callable[[], Any]] = []
+
+    @staticmethod
+    def add_reconfigure_hook(hook: Callable[[], Any]) -> None:
+        LoggingConfig._reconfigure_hooks.append(hook)
 
     @staticmethod
     def get_logging_config() -> Dict[str, Any]:
@@ -37,6 +89,7 @@ class LoggingConfig:
 
         debug_mode = app_settings.debug
         env = app_settings.environment
+        json_output = app_settings.log_format.lower() == "json"
 
         formatter_style = {
             "detailed": {
@@ -55,19 +108,20 @@ class LoggingConfig:
                 "style": "{",
                 "datefmt": "%Y-%m-%d %H:%M:%S",
             },
+            "json": {"()": JsonFormatter},
         }
 
         handlers = {
             "console": {
                 "class": "logging.StreamHandler",
                 "level": "DEBUG" if debug_mode else "INFO",
-                "formatter": "console",
+                "formatter": "json" if json_output else "console",
                 "stream": sys.stdout,
             },
             "file_info": {
                 "class": "logging.handlers.RotatingFileHandler",
                 "level": "INFO",
-                "formatter": "detailed",
+                "formatter": "json" if json_output else "detailed",
                 "filename": f"logs/{env}.log",
                 "maxBytes": 10_485_760,  # 10 MB
                 "backupCount": 5,
@@ -76,7 +130,7 @@ class LoggingConfig:
             "file_error": {
                 "class": "logging.handlers.RotatingFileHandler",
                 "level": "ERROR",
-                "formatter": "detailed",
+                "formatter": "json" if json_output else "detailed",
                 "filename": f"logs/{env}_errors.log",
                 "maxBytes": 10_485_760,
                 "backupCount": 5,
@@ -114,11 +168,54 @@ class LoggingConfig:
 
     @staticmethod
     def setup_logging() -> logging.Logger:
-        logging.config.dictConfig(LoggingConfig.get_logging_config())
+        LoggingConfig.shutdown_logging()
+        config = LoggingConfig.get_logging_config()
+        logging.config.dictConfig(config)
+        LoggingConfig._queue_listener = LoggingConfig._route_through_queue(config)
+        for hook in LoggingConfig._reconfigure_hooks:
+            hook()
         logger = logging.getLogger("app")
         logger.info("Logging configured successfully")
         return logger
 
+    @staticmethod
+    def _route_through_queue(config: Dict[str, Any]) -> RoutingQueueListener:
+        """
+        Reemplaza los handlers de cada logger configurado por un QueueHandler.
+        Los loggers con los mismos handlers comparten ruta en el listener.
+        """
+        app_settings = settings.app_settings
+        log_queue = queue.SimpleQueue()
+        volume_filter = LogVolumeFilter(
+            app_settings.log_sample_rates, app_settings.log_rate_limits
+        )
+        context_filter = ContextFilter()
+
+        routes: Dict[str, list] = {}
+        queue_handlers: Dict[str, ContextQueueHandler] = {}
+        for name in [*config["loggers"], "root"]:
+            logger = logging.getLogger(None if name == "root" else name)
+            route = ",".join(handler.name for handler in logger.handlers)
+            if route not in queue_handlers:
+                routes[route] = list(logger.handlers)
+                queue_handler = ContextQueueHandler(log_queue, route)
+                queue_handler.addFilter(volume_filter)
+                queue_handler.addFilter(context_filter)
+                queue_handlers[route] = queue_handler
+            logger.handlers = [queue_handlers[route]]
+
+        listener = RoutingQueueListener(log_queue, routes)
+        listener.start()
+        return listener
+
+    @staticmethod
+    def shutdown_logging() -> None:
+        """Escribe los registros pendientes y detiene el hilo de logging"""
+        listener = LoggingConfig._queue_listener
+        if listener is not None:
+            LoggingConfig._queue_listener = None
+            listener.stop()
+
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     return logging.getLogger(name or "app")
@@ -126,3 +223,4 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
 
 # Configura logging automáticamente al importar
 app_logger = LoggingConfig.setup_logging()
+atexit.register(LoggingConfig.shutdown_logging)
@@ -0,0 +1,41 @@
+from .app_metrics import (
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_CONNECTION_HOLD,
+    DB_POOL_IN_USE,
+    DB_POOL_TIMEOUTS,
+    HTTP_REQUEST_DURATION,
+    SETTLEMENT_DURATION,
+    WEBSOCKET_BROADCAST_DURATION,
+    WEBSOCKET_BROADCAST_RECIPIENTS,
+    WEBSOCKET_MESSAGES,
+    get_metrics_registry,
+    message_type_label,
+)
+from .registry import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    SnapshotFamily,
+    histogram_samples,
+)
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "SnapshotFamily",
+    "histogram_samples",
+    "get_metrics_registry",
+    "message_type_label",
+    "DB_POOL_CHECKOUT_WAIT",
+    "DB_POOL_CONNECTION_HOLD",
+    "DB_POOL_IN_USE",
+    "DB_POOL_TIMEOUTS",
+    "HTTP_REQUEST_DURATION",
+    "SETTLEMENT_DURATION",
+    "WEBSOCKET_BROADCAST_DURATION",
+    "WEBSOCKET_BROADCAST_RECIPIENTS",
+    "WEBSOCKET_MESSAGES",
+]
@@ -0,0 +1,73 @@
+from .registry import MetricsRegistry
+
+# Registro global del proceso; se exporta en /metrics
+metrics_registry = MetricsRegistry()
+
+# Cantidad de destinatarios de un broadcast
+FAN_OUT_BUCKETS = (1, 2, 4, 8, 16, 32, 64, float("inf"))
+
+HTTP_REQUEST_DURATION = metrics_registry.histogram(
+    "http_request_duration_seconds",
+    "Latencia de requests HTTP por método, plantilla de ruta y estado",
+    ("method", "route", "status"),
+)
+
+WEBSOCKET_MESSAGES = metrics_registry.counter(
+    "websocket_messages",
+    "Mensajes WebSocket por dirección (in/out) y tipo",
+    ("direction", "type"),
+)
+
+WEBSOCKET_BROADCAST_DURATION = metrics_registry.histogram(
+    "websocket_broadcast_duration_seconds",
+    "Tiempo en repartir un broadcast a las conexiones de un match",
+    ("game_type",),
+)
+
+WEBSOCKET_BROADCAST_RECIPIENTS = metrics_registry.histogram(
+    "websocket_broadcast_recipients",
+    "Conexiones que reciben cada broadcast",
+    ("game_type",),
+    buckets=FAN_OUT_BUCKETS,
+)
+
+SETTLEMENT_DURATION = metrics_registry.histogram(
+    "match_settlement_duration_seconds",
+    "Duración de la liquidación de partidas (incluye reintentos)",
+    ("outcome",),
+)
+
+DB_POOL_CHECKOUT_WAIT = metrics_registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Espera para obtener una conexión del pool de base de datos",
+    ("pool",),
+)
+
+DB_POOL_TIMEOUTS = metrics_registry.counter(
+    "db_pool_checkout_timeouts",
+    "Checkouts que superaron db_pool_timeout sin obtener conexión",
+    ("pool",),
+)
+
+DB_POOL_IN_USE = metrics_registry.gauge(
+    "db_pool_connections_in_use",
+    "Conexiones del pool actualmente prestadas",
+    ("pool",),
+)
+
+DB_POOL_CONNECTION_HOLD = metrics_registry.histogram(
+    "db_pool_connection_hold_seconds",
+    "Tiempo que cada conexión permanece prestada antes de devolverse",
+    ("pool",),
+)
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Obtiene el registro global de métricas"""
+    return metrics_registry
+
+
+def message_type_label(message) -> str:
+    """Tipo de mensaje acotado para usarlo como etiqueta"""
+    message_type = message.get("type") if isinstance(message, dict) else None
+    return str(message_type)[:64] if message_type else "unknown"
@@ -0,0 +1,147 @@
+"""
+Métricas calculadas al exportar a partir del estado en memoria del proceso
+(managers de juego, cola de liquidación, cachés, pools). Se registran desde
+la ruta /metrics para no crear dependencias circulares con los módulos que
+instrumentan métricas.
+"""
+
+from typing import Iterable, List
+
+from infrastructure.cache import get_principal_cache, get_read_cache_stats
+from infrastructure.db import get_pool_status
+from infrastructure.dependencies.factories.game_manager_factory import (
+    get_active_game_managers,
+)
+from infrastructure.dependencies.services.auth_services import get_password_hasher
+from infrastructure.dependencies.sockets import get_settlement_queue
+from infrastructure.logging import get_latency_registry
+
+from .app_metrics import get_metrics_registry
+from .registry import SnapshotFamily, histogram_samples
+
+
+def collect_game_metrics() -> Iterable[SnapshotFamily]:
+    """Partidas activas, conexiones y profundidad de actores por tipo de juego"""
+    matches = SnapshotFamily(
+        "websocket_active_matches", "Partidas con juego en memoria por tipo"
+    )
+    connections = SnapshotFamily(
+        "websocket_active_connections", "Conexiones WebSocket abiertas por tipo"
+    )
+    inbox_depth = SnapshotFamily(
+        "match_actor_inbox_depth", "Comandos en cola en los actores de partidas"
+    )
+
+    totals = {}
+    for manager in get_active_game_managers():
+        game_matches, game_connections, game_depth = totals.get(
+            manager.game_type, (0, 0, 0)
+        )
+        state = manager.game_state_manager
+        totals[manager.game_type] = (
+            game_matches + len(state.active_games),
+            game_connections
+            + sum(len(conns) for conns in manager.active_connections.values()),
+            game_depth + sum(actor.depth for actor in state.match_actors.values()),
+        )
+
+    for game_type, (game_matches, game_connections, game_depth) in totals.items():
+        matches.add(game_matches, game_type=game_type)
+        connections.add(game_connections, game_type=game_type)
+        inbox_depth.add(game_depth, game_type=game_type)
+    return [matches, connections, inbox_depth]
+
+
+def collect_settlement_metrics() -> Iterable[SnapshotFamily]:
+    stats = get_settlement_queue().get_stats()
+    queue_depth = SnapshotFamily(
+        "settlement_queue_depth", "Liquidaciones de partidas en espera"
+    )
+    queue_depth.add(stats["queue_depth"])
+    running = SnapshotFamily("settlement_running", "Liquidaciones en curso")
+    running.add(stats["running"])
+    events = SnapshotFamily(
+        "settlement_events",
+        "Eventos de la cola de liquidación (settled, failed, retries, duplicates)",
+        metric_type="counter",
+    )
+    for event in ("settled", "failed", "retries", "duplicates"):
+        events.add(stats[event], suffix="_total", event=event)
+    return [queue_depth, running, events]
+
+
+def collect_cache_metrics() -> Iterable[SnapshotFamily]:
+    """Aciertos y fallos de las cachés en proceso"""
+    lookups = SnapshotFamily(
+        "cache_lookups", "Consultas a cachés en proceso", metric_type="counter"
+    )
+    size = SnapshotFamily("cache_entries", "Entradas en cachés en proceso")
+
+    caches = dict(get_read_cache_stats())
+    caches["principal"] = get_principal_cache().get_stats()
+    for cache, stats in caches.items():
+        lookups.add(stats["hits"], suffix="_total", cache=cache, result="hit")
+        lookups.add(stats["misses"], suffix="_total", cache=cache, result="miss")
+        size.add(stats["size"], cache=cache)
+    return [lookups, size]
+
+
+def collect_executor_metrics() -> Iterable[SnapshotFamily]:
+    """Pool acotado que ejecuta bcrypt"""
+    executor = getattr(get_password_hasher(), "executor", None)
+    if executor is None:
+        return []
+    stats = executor.get_stats()
+    queue_depth = SnapshotFamily(
+        "executor_queue_depth", "Trabajos esperando un hilo libre"
+    )
+    queue_depth.add(stats["queue_depth"], executor=executor.name)
+    rejected = SnapshotFamily(
+        "executor_rejected", "Trabajos rechazados por saturación", "counter"
+    )
+    rejected.add(stats["rejected"], suffix="_total", executor=executor.name)
+    return [queue_depth, rejected]
+
+
+def collect_db_pool_metrics() -> Iterable[SnapshotFamily]:
+    """Tamaño, capacidad y ocupación de los pools de conexiones"""
+    size = SnapshotFamily("db_pool_size", "Conexiones abiertas en el pool")
+    capacity = SnapshotFamily(
+        "db_pool_capacity", "Máximo de conexiones (pool_size + max_overflow)"
+    )
+    saturation = SnapshotFamily(
+        "db_pool_saturation", "Fracción de la capacidad del pool en uso"
+    )
+    for pool, status in get_pool_status().items():
+        size.add(status["checked_in"] + status["checked_out"], pool=pool)
+        capacity.add(status["capacity"], pool=pool)
+        saturation.add(status["saturation"], pool=pool)
+    return [size, capacity, saturation]
+
+
+def collect_use_case_latency() -> Iterable[SnapshotFamily]:
+    """Histogramas de log_execution/log_performance"""
+    name = "use_case_duration_seconds"
+    samples: List = []
+    for histogram in get_latency_registry().histograms():
+        samples.extend(histogram_samples(name, {"name": histogram.name}, histogram))
+    family = SnapshotFamily(
+        name,
+        "Latencia de casos de uso medida por los decoradores de logging",
+        metric_type="histogram",
+        samples=samples,
+    )
+    return [family]
+
+
+def register_default_collectors():
+    registry = get_metrics_registry()
+    for collector in (
+        collect_game_metrics,
+        collect_settlement_metrics,
+        collect_cache_metrics,
+        collect_executor_metrics,
+        collect_db_pool_metrics,
+        collect_use_case_latency,
+    ):
+        registry.register_collector(collector)
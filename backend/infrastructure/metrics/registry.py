@@ -0,0 +1,244 @@
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from infrastructure.logging.latency import DEFAULT_LATENCY_BUCKETS, LatencyHistogram
+
+# Series por métrica a partir de las cuales las nuevas combinaciones de
+# etiquetas se agrupan en OVERFLOW_LABEL (acota la memoria ante valores
+# inesperados, ej. tipos de mensaje enviados por clientes)
+MAX_SERIES_PER_METRIC = 500
+OVERFLOW_LABEL = "_other"
+
+Labels = Tuple[str, ...]
+Sample = Tuple[str, Dict[str, str], float]
+
+
+class MetricFamily:
+    """Métrica con nombre, ayuda y una serie por combinación de etiquetas"""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Labels, object] = {}
+
+    def labels(self, *values) -> object:
+        """Obtiene (o crea) la serie de esos valores de etiquetas"""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"Metric {self.name} expects labels {self.labelnames}, got {key}"
+                )
+            if len(self._children) >= MAX_SERIES_PER_METRIC:
+                key = (OVERFLOW_LABEL,) * len(self.labelnames)
+                child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = self._new_child()
+        return child
+
+    def _new_child(self) -> object:
+        raise NotImplementedError
+
+    def samples(self) -> Iterable[Sample]:
+        raise NotImplementedError
+
+    def _label_dict(self, key: Labels) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Counter(MetricFamily):
+    type = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def samples(self) -> Iterable[Sample]:
+        for key, child in self._children.items():
+            yield f"{self.name}_total", self._label_dict(key), child.value
+
+
+class Gauge(MetricFamily):
+    type = "gauge"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self.labels().dec(amount)
+
+    def samples(self) -> Iterable[Sample]:
+        for key, child in self._children.items():
+            yield self.name, self._label_dict(key), child.value
+
+
+class Histogram(MetricFamily):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+
+    def _new_child(self) -> LatencyHistogram:
+        return LatencyHistogram(self.name, buckets=self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def samples(self) -> Iterable[Sample]:
+        for key, child in self._children.items():
+            yield from histogram_samples(self.name, self._label_dict(key), child)
+
+
+class SnapshotFamily:
+    """Métrica calculada al momento de exportar (ej. conexiones activas)"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str = "gauge",
+        samples: Optional[List[Sample]] = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.type = metric_type
+        self._samples = samples if samples is not None else []
+
+    def add(self, value: float, suffix: str = "", **labels: str):
+        self._samples.append((f"{self.name}{suffix}", labels, value))
+
+    def samples(self) -> Iterable[Sample]:
+        return self._samples
+
+
+Collector = Callable[[], Iterable[SnapshotFamily]]
+
+
+class MetricsRegistry:
+    """Registro en proceso de métricas, exportable en formato de texto"""
+
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+        self._collectors: List[Collector] = []
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Collector):
+        """Agrega una función que produce métricas al momento de exportar"""
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Exporta todas las métricas en el formato de texto de Prometheus"""
+        lines: List[str] = []
+        families: List = list(self._families.values())
+        for collector in self._collectors:
+            families.extend(collector())
+
+        for family in families:
+            # En el formato 0.0.4 la cabecera usa el nombre de las muestras
+            name = f"{family.name}_total" if family.type == "counter" else family.name
+            lines.append(f"# HELP {name} {_escape_help(family.documentation)}")
+            lines.append(f"# TYPE {name} {family.type}")
+            for sample_name, labels, value in family.samples():
+                lines.append(
+                    f"{sample_name}{_format_labels(labels)} {_format_value(value)}"
+                )
+        lines.append("")
+        return "\n".join(lines)
+
+    def _register(self, family):
+        existing = self._families.get(family.name)
+        if existing is not None:
+            if type(existing) is not type(family):
+                raise ValueError(f"Metric {family.name} already registered")
+            return existing
+        self._families[family.name] = family
+        return family
+
+
+def histogram_samples(
+    name: str, labels: Dict[str, str], histogram: LatencyHistogram
+) -> Iterable[Sample]:
+    """Series _bucket/_sum/_count de un histograma"""
+    for upper, count in histogram.cumulative_counts():
+        yield f"{name}_bucket", {**labels, "le": _format_value(upper)}, count
+    yield f"{name}_sum", labels, histogram.sum
+    yield f"{name}_count", labels, histogram.count
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{key}="{_escape_label(str(value))}"' for key, value in labels.items()
+    )
+    return f"{{{pairs}}}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
@@ -1,2 +1,3 @@
 from .logging_middleware import LoggingMiddleware
+from .metrics_middleware import MetricsMiddleware
 from .proxy_header_middleware import SimpleProxyHeadersMiddleware
@@ -1,62 +1,125 @@
+import logging
+import random
 import time
-import uuid
+from typing import Optional
 
 from application.mixins.logging_mixin import LoggingMixin
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-
-
-class LoggingMiddleware(BaseHTTPMiddleware, LoggingMixin):
-    """Middleware para logging automático de requests HTTP"""
-
-    def __init__(self, app):
-        super().__init__(app)
-
-    async def dispatch(self, request: Request, call_next):
-        # Generar ID único para el request
-        request_id = str(uuid.uuid4())[:8]
-
-        # Información del request
-        method = request.method
-        url = str(request.url)
-        client_ip = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("user-agent", "unknown")
-
-        # Log del inicio del request
-        self.logger.info(
-            f"[{request_id}] {method} {url} - IP: {client_ip} - User-Agent: {user_agent[:50]}..."
+from infrastructure.core.settings_config import settings
+from infrastructure.logging.context import new_request_id, request_id_var
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class LoggingMiddleware(LoggingMixin):
+    """
+    Middleware ASGI para logging automático de requests HTTP.
+
+    No envuelve el request ni el cuerpo de la respuesta: agrega los headers
+    de debugging al enviar el inicio de la respuesta y deja el ID del request
+    en un contextvar para el resto del logging. Las líneas de log solo se
+    formatean si el nivel está habilitado; las respuestas exitosas y rápidas
+    se muestrean según request_log_sample_rate.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: Optional[float] = None,
+        slow_threshold: Optional[float] = None,
+    ):
+        self.app = app
+        app_settings = settings.app_settings
+        self.sample_rate = (
+            app_settings.request_log_sample_rate if sample_rate is None else sample_rate
+        )
+        self.slow_threshold = (
+            app_settings.slow_request_threshold
+            if slow_threshold is None
+            else slow_threshold
         )
 
-        # Timing
-        start_time = time.time()
-
-        try:
-            # Procesar request
-            response = await call_next(request)
-
-            # Calcular tiempo de procesamiento
-            process_time = time.time() - start_time
-
-            # Log del response exitoso
-            self.logger.info(
-                f"[{request_id}] {method} {url} - Status: {response.status_code} - "
-                f"Time: {process_time:.3f}s"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = new_request_id()
+        token = request_id_var.set(request_id)
+        start_time = time.perf_counter()
+        status_code = 500
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "[%s] %s %s - IP: %s - User-Agent: %.50s",
+                request_id,
+                scope["method"],
+                _request_target(scope),
+                _client_ip(scope),
+                _header(scope, b"user-agent") or "unknown",
             )
 
-            # Agregar headers de debugging
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Process-Time"] = f"{process_time:.3f}"
-
-            return response
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Agregar headers de debugging
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Request-ID", request_id)
+                headers.append(
+                    "X-Process-Time", f"{time.perf_counter() - start_time:.3f}"
+                )
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_with_headers)
         except Exception as e:
-            # Calcular tiempo incluso en caso de error
-            process_time = time.time() - start_time
-
-            # Log del error
             self.logger.error(
-                f"[{request_id}] {method} {url} - ERROR: {str(e)} - Time: {process_time:.3f}s"
+                "[%s] %s %s - ERROR: %s - Time: %.3fs",
+                request_id,
+                scope["method"],
+                _request_target(scope),
+                e,
+                time.perf_counter() - start_time,
             )
-
-            # Re-lanzar la excepción
             raise
+        else:
+            process_time = time.perf_counter() - start_time
+            if self._should_log(status_code, process_time):
+                self.logger.info(
+                    "[%s] %s %s - Status: %s - Time: %.3fs",
+                    request_id,
+                    scope["method"],
+                    _request_target(scope),
+                    status_code,
+                    process_time,
+                )
+        finally:
+            request_id_var.reset(token)
+
+    def _should_log(self, status_code: int, process_time: float) -> bool:
+        """Errores y requests lentos siempre; el resto según el muestreo"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return False
+        if status_code >= 400 or process_time >= self.slow_threshold:
+            return True
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+
+def _request_target(scope: Scope) -> str:
+    """Ruta y query string sin reconstruir la URL completa"""
+    query_string = scope.get("query_string")
+    if query_string:
+        return f"{scope['path']}?{query_string.decode('latin-1')}"
+    return scope["path"]
+
+
+def _client_ip(scope: Scope) -> str:
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _header(scope: Scope, name: bytes) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
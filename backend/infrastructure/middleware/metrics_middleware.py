@@ -0,0 +1,48 @@
+import time
+
+from infrastructure.metrics import HTTP_REQUEST_DURATION
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Etiqueta de ruta para requests que no coinciden con ninguna ruta (404):
+# usar la ruta real crearía una serie por cada URL inventada
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que registra la latencia HTTP por plantilla de ruta
+    (ej. /games/{game_id}), que el router deja en scope["route"].
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUEST_DURATION.labels(
+                scope["method"], _route_template(scope), status_code
+            ).observe(time.perf_counter() - start_time)
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    return getattr(route, "path_format", None) or getattr(
+        route, "path", UNMATCHED_ROUTE
+    )
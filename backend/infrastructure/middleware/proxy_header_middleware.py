@@ -1,17 +1,35 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+# Esquemas equivalentes para conexiones WebSocket
+_WEBSOCKET_SCHEMES = {"http": "ws", "https": "wss"}
 
-class SimpleProxyHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            ip = forwarded_for.split(",")[0].strip()
-            request.scope["client"] = (ip, 0)
 
-        forwarded_proto = request.headers.get("x-forwarded-proto")
-        if forwarded_proto:
-            request.scope["scheme"] = forwarded_proto
+class SimpleProxyHeadersMiddleware:
+    """
+    Middleware ASGI que toma la IP del cliente y el esquema de los headers
+    X-Forwarded-For / X-Forwarded-Proto del proxy.
+    """
 
-        response = await call_next(request)
-        return response
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket"):
+            forwarded_for = forwarded_proto = None
+            for name, value in scope["headers"]:
+                if name == b"x-forwarded-for" and forwarded_for is None:
+                    forwarded_for = value
+                elif name == b"x-forwarded-proto" and forwarded_proto is None:
+                    forwarded_proto = value
+
+            if forwarded_for:
+                ip = forwarded_for.decode("latin-1").split(",")[0].strip()
+                scope["client"] = (ip, 0)
+
+            if forwarded_proto:
+                scheme = forwarded_proto.decode("latin-1").strip()
+                if scope["type"] == "websocket":
+                    scheme = _WEBSOCKET_SCHEMES.get(scheme, scheme)
+                scope["scheme"] = scheme
+
+        await self.app(scope, receive, send)
@@ -2,6 +2,7 @@ from .base_game_manager import BaseGameWebSocketManager
 from .connect4_manager import Connect4WebSocketManager
 from .game_actions import GameActions
 from .game_state_manager import GameStateManager
+from .match_actor import MatchActor
 from .message_handler import MessageHandler
 from .player_actions import PlayerActions
 from .player_manager import PlayerManager
@@ -12,6 +13,7 @@ __all__ = [
     "Connect4WebSocketManager",
     "TictactoeWebSocketManager",
     "GameStateManager",
+    "MatchActor",
     "PlayerManager",
     "MessageHandler",
     "PlayerActions",
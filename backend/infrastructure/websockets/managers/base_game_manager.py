@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from fastapi import WebSocket
 from infrastructure.logging.logging_config import get_logger
+from infrastructure.websockets.protocol import PROTOCOL_DELTA
 from infrastructure.websockets.websocket_manager import WebSocketManager
 
 from .game_actions import GameActions
@@ -59,10 +60,28 @@ class BaseGameWebSocketManager(WebSocketManager, ABC):
         """Obtiene la instancia de juego para un match"""
         return self.game_state_manager.get_game(match_id)
 
+    async def run_in_match(
+        self, match_id: str, handler: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Ejecuta un comando en el actor que serializa las acciones del match"""
+        return await self.game_state_manager.run_in_match(match_id, handler)
+
     def get_player_symbol(self, match_id: str, player_id: str) -> Optional[str]:
         """Obtiene el símbolo del jugador en un match"""
         return self.player_manager.get_player_symbol(match_id, player_id)
 
+    def build_state_snapshot(self, match_id: str, websocket: WebSocket) -> dict:
+        """Construye el mensaje con el estado completo del juego para una conexión"""
+        game = self.get_game(match_id)
+        response = {
+            "type": "game_state",
+            "game_state": game.get_game_state() if game else None,
+            "players": self.player_manager.get_match_players(match_id),
+        }
+        if self.get_protocol_version(websocket) == PROTOCOL_DELTA:
+            response["seq"] = game.move_count if game else 0
+        return response
+
     def remove_game(self, match_id: str):
         """Elimina un juego y limpia recursos"""
         self.game_state_manager.remove_game(match_id)
@@ -85,6 +104,14 @@ class BaseGameWebSocketManager(WebSocketManager, ABC):
             super().connect(match_id, websocket)
             logger.info(f"Anonymous connection added to match {match_id}")
 
+        # Todos los mensajes hacia esta conexión pasan por su cola de salida
+        self.register_outbound_queue(
+            match_id,
+            websocket,
+            lambda: self.build_state_snapshot(match_id, websocket),
+            user_id,
+        )
+
         connections_count = len(self.active_connections.get(match_id, []))
         logger.info(f"Total connections for match {match_id}: {connections_count}")
 
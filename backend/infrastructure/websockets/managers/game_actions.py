@@ -1,8 +1,10 @@
-from typing import Any, Protocol
+from typing import Any, Dict, Protocol
 
 from fastapi import WebSocket
 from infrastructure.logging.logging_config import get_logger
 
+from ..protocol import PROTOCOL_DELTA, PROTOCOL_V1
+
 logger = get_logger("websockets.game_actions")
 
 # Constantes para mensajes
@@ -21,6 +23,18 @@ class GameManagerProtocol(Protocol):
     async def broadcast(self, match_id: str, message: dict):
         ...
 
+    async def broadcast_by_protocol(self, match_id: str, messages: Dict[int, dict]):
+        ...
+
+    def get_protocol_version(self, websocket: WebSocket) -> int:
+        ...
+
+    def build_state_snapshot(self, match_id: str, websocket: WebSocket) -> dict:
+        ...
+
+    async def send_to_connection(self, websocket: WebSocket, message: dict):
+        ...
+
 
 class GameActions:
     """Maneja las acciones específicas del juego"""
@@ -35,8 +49,8 @@ class GameActions:
         """Maneja un movimiento del juego"""
         game = self.manager.get_game(match_id)
         if not game:
-            await websocket.send_json(
-                {"type": "error", "message": GAME_NOT_FOUND_ERROR}
+            await self.manager.send_to_connection(
+                websocket, {"type": "error", "message": GAME_NOT_FOUND_ERROR}
             )
             return
 
@@ -44,7 +58,9 @@ class GameActions:
         player_symbol = self.manager.get_player_symbol(match_id, player_id)
 
         if player_symbol != game.current_player:
-            await websocket.send_json({"type": "error", "message": "No es tu turno"})
+            await self.manager.send_to_connection(
+                websocket, {"type": "error", "message": "No es tu turno"}
+            )
             return
 
         try:
@@ -67,7 +83,15 @@ class GameActions:
                 f"Move processed for match {match_id}: {result.get('game_over', False) and result.get('winner', 'None')}"
             )
 
-            await self.manager.broadcast(match_id, response)
+            await self.manager.broadcast_by_protocol(
+                match_id,
+                {
+                    PROTOCOL_V1: response,
+                    PROTOCOL_DELTA: self._build_move_delta(
+                        game, player_id, player_symbol, result
+                    ),
+                },
+            )
 
             # Verificar si el juego terminó y manejar automáticamente la finalización
             if (
@@ -80,7 +104,9 @@ class GameActions:
                 await self._handle_automatic_game_finish(match_id, result)
 
         except ValueError as e:
-            await websocket.send_json({"type": "error", "message": str(e)})
+            await self.manager.send_to_connection(
+                websocket, {"type": "error", "message": str(e)}
+            )
 
     async def handle_get_game_state(
         self, match_id: str, websocket: WebSocket, message: dict
@@ -88,31 +114,52 @@ class GameActions:
         """Envía el estado actual del juego al jugador que lo solicita"""
         game = self.manager.get_game(match_id)
         if not game:
-            await websocket.send_json(
-                {"type": "error", "message": GAME_NOT_FOUND_ERROR}
+            await self.manager.send_to_connection(
+                websocket, {"type": "error", "message": GAME_NOT_FOUND_ERROR}
             )
             return
 
-        # Obtener jugadores desde el manager
-        players = {}
-        if hasattr(self.manager, "player_manager"):
-            players = self.manager.player_manager.get_match_players(match_id)
-
-        response = {
-            "type": "game_state",
-            "game_state": game.get_game_state(),
-            "players": players,
+        response = self.manager.build_state_snapshot(match_id, websocket)
+
+        if self.manager.get_protocol_version(websocket) == PROTOCOL_DELTA:
+            # El cliente solo necesita el estado completo si perdió algún delta
+            client_seq = message.get("seq")
+            if client_seq is not None and client_seq == game.move_count:
+                response = {"type": "state_in_sync", "seq": game.move_count}
+
+        await self.manager.send_to_connection(websocket, response)
+
+    def _build_move_delta(
+        self, game: Any, player_id: str, player_symbol: str, result: dict
+    ) -> dict:
+        """
+        Construye el mensaje move_made del protocolo delta: solo la celda que
+        cambió, el siguiente jugador y las banderas de fin de juego.
+        seq es el número de movimientos aplicados; si el cliente detecta un
+        salto debe pedir el estado completo con get_game_state.
+        """
+        return {
+            "type": "move_made",
+            "seq": result["move_count"],
+            "player_id": player_id,
+            "player_symbol": player_symbol,
+            "row": result["row"],
+            "column": result["column"],
+            "next_player": game.current_player,
+            "game_over": result["game_over"],
+            "winner": result["winner"],
+            "is_tie": result["is_tie"],
+            "winning_positions": result["winning_positions"],
         }
 
-        await websocket.send_json(response)
-
     async def handle_game_finished(
         self, match_id: str, websocket: WebSocket, message: dict
     ):
         """Maneja el final manual del juego (ej: rendición)"""
         if not self.game_finish_service:
-            await websocket.send_json(
-                {"type": "error", "message": "Game finish service not available"}
+            await self.manager.send_to_connection(
+                websocket,
+                {"type": "error", "message": "Game finish service not available"},
             )
             return
 
@@ -121,8 +168,9 @@ class GameActions:
             participants_data = message.get("participants", [])
 
             if not participants_data:
-                await websocket.send_json(
-                    {"type": "error", "message": "No participants data provided"}
+                await self.manager.send_to_connection(
+                    websocket,
+                    {"type": "error", "message": "No participants data provided"},
                 )
                 return
 
@@ -139,8 +187,9 @@ class GameActions:
             logger.error(
                 f"Error finishing game manually for match {match_id}: {str(e)}"
             )
-            await websocket.send_json(
-                {"type": "error", "message": f"Failed to finish game: {str(e)}"}
+            await self.manager.send_to_connection(
+                websocket,
+                {"type": "error", "message": f"Failed to finish game: {str(e)}"},
             )
 
     async def _handle_automatic_game_finish(self, match_id: str, game_result: dict):
@@ -190,15 +239,8 @@ class GameActions:
 
             if participants_data:
                 logger.info(
-                    f"Calling game finish service with participants: {participants_data}"
+                    f"Scheduling game finish with participants: {participants_data}"
                 )
-                # Llamar al servicio para finalizar el juego automáticamente
-                await self.game_finish_service.handle_game_finished(
-                    match_id=match_id,
-                    participants_data=participants_data,
-                    websocket_manager=self.manager,
-                )
-
                 # Enviar mensaje adicional de confirmación de finalización del juego
                 confirmation_message = {
                     "type": "game_finished_automatically",
@@ -209,14 +251,23 @@ class GameActions:
                     "message": "El juego ha finalizado automáticamente",
                 }
 
-                await self.manager.broadcast(match_id, confirmation_message)
-
-                if is_tie:
-                    logger.info(f"Game {match_id} finished automatically with tie")
-                else:
-                    logger.info(
-                        f"Game {match_id} finished automatically. Winner: {winner}"
-                    )
+                async def broadcast_confirmation(_: dict):
+                    await self.manager.broadcast(match_id, confirmation_message)
+                    if is_tie:
+                        logger.info(f"Game {match_id} finished automatically with tie")
+                    else:
+                        logger.info(
+                            f"Game {match_id} finished automatically. Winner: {winner}"
+                        )
+
+                # La liquidación se encola para no bloquear el manejo de mensajes;
+                # el servicio difunde game_over y luego la confirmación
+                await self.game_finish_service.schedule_game_finished(
+                    match_id=match_id,
+                    participants_data=participants_data,
+                    websocket_manager=self.manager,
+                    on_settled=broadcast_confirmation,
+                )
             else:
                 logger.warning(
                     f"No participants found for automatic finish of match {match_id}"
@@ -2,6 +2,8 @@ from typing import Any, Dict, Optional
 
 from infrastructure.logging.logging_config import get_logger
 
+from .match_actor import CommandHandler, MatchActor
+
 logger = get_logger("websockets.game_state_manager")
 
 
@@ -10,13 +12,32 @@ class GameStateManager:
 
     def __init__(self):
         self.active_games: Dict[str, Any] = {}  # match_id -> game_engine
+        self.match_actors: Dict[str, MatchActor] = {}  # match_id -> actor
 
     def create_game(self, match_id: str, game_engine: Any) -> Any:
         """Crea una nueva instancia de juego"""
         self.active_games[match_id] = game_engine
+        self._start_actor(match_id)
         logger.info(f"Created game for match {match_id}")
         return game_engine
 
+    def _start_actor(self, match_id: str):
+        """Inicia el actor del match si aún no tiene uno"""
+        if match_id in self.match_actors:
+            return
+        try:
+            self.match_actors[match_id] = MatchActor(match_id)
+        except RuntimeError:
+            # Sin event loop activo los comandos se ejecutan en línea
+            logger.warning(f"No running event loop for match {match_id} actor")
+
+    async def run_in_match(self, match_id: str, handler: CommandHandler) -> Any:
+        """Ejecuta un comando en el actor del match, en orden de llegada"""
+        actor = self.match_actors.get(match_id)
+        if actor is None:
+            return await handler()
+        return await actor.submit(handler)
+
     def get_game(self, match_id: str) -> Optional[Any]:
         """Obtiene la instancia de juego para un match"""
         return self.active_games.get(match_id)
@@ -24,6 +45,9 @@ class GameStateManager:
     def remove_game(self, match_id: str) -> bool:
         """Elimina un juego y retorna True si existía"""
         game = self.active_games.pop(match_id, None)
+        actor = self.match_actors.pop(match_id, None)
+        if actor:
+            actor.stop()
         if game:
             logger.info(f"Removed game for match {match_id}")
             return True
@@ -36,3 +60,9 @@ class GameStateManager:
     def get_all_active_matches(self) -> list[str]:
         """Obtiene todos los match_ids activos"""
         return list(self.active_games.keys())
+
+    def get_actor_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Obtiene las métricas del actor de cada match activo"""
+        return {
+            match_id: actor.get_stats() for match_id, actor in self.match_actors.items()
+        }
@@ -0,0 +1,143 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from infrastructure.logging.logging_config import get_logger
+
+logger = get_logger("websockets.match_actor")
+
+# Máximo de comandos que el actor procesa por vuelta antes de ceder el loop
+MAX_BATCH_SIZE = 32
+
+# Profundidad del inbox a partir de la cual se registra una advertencia
+INBOX_DEPTH_WARNING = 50
+
+CommandHandler = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class _Command:
+    handler: CommandHandler
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class MatchActor:
+    """
+    Tarea única dueña de un match.
+
+    Todos los comandos que modifican el juego se encolan en su inbox y se
+    ejecutan de uno en uno y en orden de llegada, por lo que nunca se
+    intercalan entre los await de apply_move, broadcast o la finalización.
+    """
+
+    def __init__(self, match_id: str, max_batch_size: int = MAX_BATCH_SIZE):
+        self.match_id = match_id
+        self.max_batch_size = max_batch_size
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.stopped = False
+
+        # Métricas
+        self.processed = 0
+        self.failed = 0
+        self.max_depth = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+        self._task = asyncio.create_task(self._run(), name=f"match-actor-{match_id}")
+
+    @property
+    def depth(self) -> int:
+        """Comandos pendientes en el inbox"""
+        return self.inbox.qsize()
+
+    async def submit(self, handler: CommandHandler) -> Any:
+        """Encola un comando y espera su resultado"""
+        # Un comando del propio actor se ejecuta en línea para no bloquearse
+        # esperándose a sí mismo; tras detenerse, los comandos tardíos también
+        if self.stopped or asyncio.current_task() is self._task:
+            return await handler()
+
+        command = _Command(handler, asyncio.get_running_loop().create_future())
+        self.inbox.put_nowait(command)
+
+        depth = self.inbox.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+            if depth >= INBOX_DEPTH_WARNING:
+                logger.warning(f"Match {self.match_id} actor inbox depth: {depth}")
+
+        return await command.future
+
+    def stop(self):
+        """
+        Detiene el actor después de procesar los comandos ya encolados.
+        Es seguro llamarlo desde un comando del propio actor.
+        """
+        if self.stopped:
+            return
+        self.stopped = True
+        self.inbox.put_nowait(None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Obtiene la profundidad del inbox y las latencias del actor"""
+        processed = self.processed or 1
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "processed": self.processed,
+            "failed": self.failed,
+            "avg_wait_ms": round(self.total_wait / processed * 1000, 3),
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+            "avg_latency_ms": round(self.total_latency / processed * 1000, 3),
+            "max_latency_ms": round(self.max_latency * 1000, 3),
+            "stopped": self.stopped,
+        }
+
+    async def _run(self):
+        """Procesa el inbox en lotes hasta recibir la señal de parada"""
+        while True:
+            batch = [await self.inbox.get()]
+            while len(batch) < self.max_batch_size and not self.inbox.empty():
+                batch.append(self.inbox.get_nowait())
+
+            for command in batch:
+                if command is None:
+                    logger.info(
+                        f"Match {self.match_id} actor stopped "
+                        f"after {self.processed} commands"
+                    )
+                    return
+                await self._process(command)
+
+    async def _process(self, command: _Command):
+        """Ejecuta un comando y entrega su resultado a quien lo envió"""
+        started_at = time.perf_counter()
+        result: Optional[Any] = None
+        error: Optional[BaseException] = None
+
+        try:
+            result = await command.handler()
+        except Exception as e:
+            error = e
+            self.failed += 1
+
+        finished_at = time.perf_counter()
+        wait = started_at - command.enqueued_at
+        latency = finished_at - command.enqueued_at
+        self.processed += 1
+        self.total_wait += wait
+        self.total_latency += latency
+        self.max_wait = max(self.max_wait, wait)
+        self.max_latency = max(self.max_latency, latency)
+
+        # Quien envió el comando pudo haberse cancelado (ej. desconexión)
+        if command.future.done():
+            return
+        if error is not None:
+            command.future.set_exception(error)
+        else:
+            command.future.set_result(result)
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Any, Awaitable, Callable, Protocol
 
 from fastapi import WebSocket
 from infrastructure.logging.logging_config import get_logger
@@ -20,6 +20,11 @@ class MessageHandlerProtocol(Protocol):
     async def broadcast(self, match_id: str, message: dict):
         ...
 
+    async def run_in_match(
+        self, match_id: str, handler: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        ...
+
 
 class MessageHandler:
     """Maneja el enrutamiento de mensajes WebSocket"""
@@ -37,7 +42,11 @@ class MessageHandler:
     async def handle_message(
         self, match_id: str, websocket: WebSocket, message: dict, user_id: str = None
     ):
-        """Factory method para manejar diferentes tipos de mensajes"""
+        """
+        Factory method para manejar diferentes tipos de mensajes.
+        Las acciones del juego pasan por el actor del match para que se
+        procesen de una en una y en orden de llegada.
+        """
         message_type = message.get("type") or message.get("action")
 
         if message_type in (JOIN_GAME, CREATE_GAME):
@@ -48,21 +57,35 @@ class MessageHandler:
                 )
         elif message_type == MAKE_MOVE:
             if self.game_actions:
-                await self.game_actions.handle_make_move(match_id, websocket, message)
+                await self.manager.run_in_match(
+                    match_id,
+                    lambda: self.game_actions.handle_make_move(
+                        match_id, websocket, message
+                    ),
+                )
         elif message_type == RESTART_GAME:
             if self.game_actions:
-                await self.game_actions.handle_restart_game(
-                    match_id, websocket, message
+                await self.manager.run_in_match(
+                    match_id,
+                    lambda: self.game_actions.handle_restart_game(
+                        match_id, websocket, message
+                    ),
                 )
         elif message_type == GET_GAME_STATE:
             if self.game_actions:
-                await self.game_actions.handle_get_game_state(
-                    match_id, websocket, message
+                await self.manager.run_in_match(
+                    match_id,
+                    lambda: self.game_actions.handle_get_game_state(
+                        match_id, websocket, message
+                    ),
                 )
         elif message_type == GAME_FINISHED:
             if self.game_actions:
-                await self.game_actions.handle_game_finished(
-                    match_id, websocket, message
+                await self.manager.run_in_match(
+                    match_id,
+                    lambda: self.game_actions.handle_game_finished(
+                        match_id, websocket, message
+                    ),
                 )
         else:
             # Mensaje no reconocido, hacer broadcast
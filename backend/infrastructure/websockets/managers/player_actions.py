@@ -3,6 +3,8 @@ from typing import Any, Protocol
 from fastapi import WebSocket
 from infrastructure.logging.logging_config import get_logger
 
+from ..protocol import PROTOCOL_DELTA, SUPPORTED_PROTOCOL_VERSIONS
+
 logger = get_logger("websockets.player_actions")
 
 
@@ -27,6 +29,15 @@ class PlayerActionManagerProtocol(Protocol):
     async def broadcast(self, match_id: str, message: dict):
         ...
 
+    def set_protocol_version(self, websocket: WebSocket, version: int):
+        ...
+
+    def get_protocol_version(self, websocket: WebSocket) -> int:
+        ...
+
+    async def send_to_connection(self, websocket: WebSocket, message: dict):
+        ...
+
 
 class PlayerActions:
     """Maneja las acciones relacionadas con los jugadores"""
@@ -47,11 +58,16 @@ class PlayerActions:
 
         if not player_id:
             logger.error(f"No player_id or user_id provided for match {match_id}")
-            await websocket.send_json(
-                {"type": "error", "message": "Player ID required"}
+            await self.manager.send_to_connection(
+                websocket, {"type": "error", "message": "Player ID required"}
             )
             return
 
+        # El cliente elige la versión del protocolo al unirse (por defecto v1)
+        protocol_version = message.get("protocol_version")
+        if protocol_version in SUPPORTED_PROTOCOL_VERSIONS:
+            self.manager.set_protocol_version(websocket, protocol_version)
+
         # Verificar si el jugador ya está en el match
         if hasattr(
             self.manager, "player_manager"
@@ -140,7 +156,8 @@ class PlayerActions:
             "message": "Player already in game",
         }
 
-        await websocket.send_json(response)
+        self._add_sequence(response, websocket, game)
+        await self.manager.send_to_connection(websocket, response)
 
     async def _send_game_state_to_player(
         self,
@@ -168,7 +185,13 @@ class PlayerActions:
             "winner": None,
         }
 
-        await websocket.send_json(response)
+        self._add_sequence(response, websocket, game)
+        await self.manager.send_to_connection(websocket, response)
+
+    def _add_sequence(self, response: dict, websocket: WebSocket, game: Any):
+        """Agrega el número de secuencia al estado completo para clientes delta"""
+        if self.manager.get_protocol_version(websocket) == PROTOCOL_DELTA:
+            response["seq"] = game.move_count if game else 0
 
     async def _broadcast_player_joined(
         self, match_id: str, player_id: str, player_symbol: str
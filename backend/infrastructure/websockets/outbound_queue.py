@@ -0,0 +1,140 @@
+import asyncio
+from collections import deque
+from contextlib import suppress
+from typing import Callable, Deque, Optional, Tuple
+
+from fastapi import WebSocket
+from infrastructure.logging.logging_config import get_logger
+
+from .protocol import encode_message
+
+logger = get_logger("websockets.outbound_queue")
+
+# Máximo de mensajes pendientes por conexión
+OUTBOUND_QUEUE_SIZE = 64
+
+# Código de cierre TRY_AGAIN_LATER (ver WebSocketConfig.ERROR_CODES)
+TRY_AGAIN_LATER = 1013
+
+# Tipo interno para las instantáneas de estado generadas al desbordar la cola
+STATE_SNAPSHOT = "state_snapshot"
+
+# Mensajes que pueden descartarse cuando el cliente no alcanza a leerlos,
+# porque una instantánea del estado completo los reemplaza
+DROPPABLE_MESSAGE_TYPES = frozenset({"move_made", STATE_SNAPSHOT})
+
+
+class OutboundQueue:
+    """
+    Cola de salida acotada de una conexión WebSocket.
+
+    Los productores solo encolan (nunca esperan al cliente) y una tarea
+    escritora dedicada envía los mensajes en orden. Si la cola se llena se
+    descartan los move_made pendientes y se encola una instantánea del
+    estado completo; si aun así no hay espacio la conexión se cierra con 1013.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        snapshot_factory: Callable[[], dict],
+        on_close: Optional[Callable[[], None]] = None,
+        max_size: int = OUTBOUND_QUEUE_SIZE,
+        send_timeout: float = 5.0,
+    ):
+        self.websocket = websocket
+        self.snapshot_factory = snapshot_factory
+        self.on_close = on_close
+        self.max_size = max_size
+        self.send_timeout = send_timeout
+        self.closed = False
+        self._messages: Deque[Tuple[Optional[str], str]] = deque()
+        self._ready = asyncio.Event()
+        self._closer: Optional[asyncio.Task] = None
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def enqueue(self, text: str, message_type: Optional[str] = None) -> bool:
+        """Encola un mensaje ya serializado sin bloquear al productor"""
+        if self.closed:
+            return False
+
+        if len(self._messages) >= self.max_size and not self._make_room():
+            logger.warning(
+                f"Outbound queue overflow ({self.max_size} messages), "
+                "closing slow connection"
+            )
+            self._fail(TRY_AGAIN_LATER)
+            return False
+
+        self._messages.append((message_type, text))
+        self._ready.set()
+        return True
+
+    def close(self, code: Optional[int] = None):
+        """Detiene la tarea escritora y opcionalmente cierra el websocket"""
+        if self.closed:
+            return
+        self.closed = True
+        self._messages.clear()
+
+        if self._writer is not asyncio.current_task():
+            self._writer.cancel()
+
+        if code is not None:
+            self._closer = asyncio.create_task(self._close_websocket(code))
+
+    def _make_room(self) -> bool:
+        """Reemplaza los mensajes descartables por una instantánea del estado"""
+        kept = deque(
+            entry for entry in self._messages if entry[0] not in DROPPABLE_MESSAGE_TYPES
+        )
+        # Debe quedar espacio para la instantánea y para el mensaje nuevo
+        if len(kept) + 1 >= self.max_size:
+            return False
+
+        try:
+            snapshot = encode_message(self.snapshot_factory())
+        except Exception as e:
+            logger.error(f"Error building state snapshot for slow connection: {e}")
+            return False
+
+        logger.info(
+            f"Dropped {len(self._messages) - len(kept)} pending messages "
+            "in favor of a state snapshot"
+        )
+        kept.append((STATE_SNAPSHOT, snapshot))
+        self._messages = kept
+        return True
+
+    def _fail(self, code: Optional[int] = None):
+        """Cierra la cola y avisa al manager para que elimine la conexión"""
+        self.close(code)
+        if self.on_close:
+            try:
+                self.on_close()
+            except Exception as e:
+                logger.error(f"Error in outbound queue close callback: {e}")
+
+    async def _write_loop(self):
+        """Envía los mensajes encolados de uno en uno y en orden"""
+        try:
+            while True:
+                await self._ready.wait()
+                while self._messages:
+                    _, text = self._messages.popleft()
+                    await asyncio.wait_for(
+                        self.websocket.send_text(text), self.send_timeout
+                    )
+                self._ready.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Outbound writer stopped: {type(e).__name__}: {e}")
+            self._fail()
+
+    async def _close_websocket(self, code: int):
+        with suppress(Exception):
+            await asyncio.wait_for(self.websocket.close(code=code), self.send_timeout)
@@ -0,0 +1,15 @@
+import json
+
+# Versiones del protocolo de mensajes WebSocket de juegos
+# v1: move_made incluye el resultado completo y el estado del juego
+# v2: move_made solo incluye la celda que cambió y un número de secuencia
+PROTOCOL_V1 = 1
+PROTOCOL_DELTA = 2
+
+SUPPORTED_PROTOCOL_VERSIONS = (PROTOCOL_V1, PROTOCOL_DELTA)
+DEFAULT_PROTOCOL_VERSION = PROTOCOL_V1
+
+
+def encode_message(message: dict) -> str:
+    """Serializa un mensaje igual que WebSocket.send_json"""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
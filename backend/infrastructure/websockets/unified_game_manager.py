@@ -155,6 +155,7 @@ class UnifiedGameWebSocketManager:
             "match_game_types": dict(self._match_game_types),
             "cached_managers": list(self._game_managers.keys()),
             "connections_by_manager": {},
+            "match_actors": {},
         }
 
         for game_type, manager in self._game_managers.items():
@@ -163,6 +164,10 @@ class UnifiedGameWebSocketManager:
                     match_id: len(connections)
                     for match_id, connections in manager.active_connections.items()
                 }
+            if hasattr(manager, "game_state_manager"):
+                debug_info["match_actors"].update(
+                    manager.game_state_manager.get_actor_stats()
+                )
 
         if match_id:
             specific_manager = self.get_game_manager_for_match(match_id)
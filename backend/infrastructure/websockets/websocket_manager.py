@@ -1,42 +1,188 @@
-from typing import Dict, List
+import asyncio
+import time
+from contextlib import suppress
+from typing import Callable, Dict, List, Optional, Set
 
 from fastapi import WebSocket
+from infrastructure.metrics import (
+    WEBSOCKET_BROADCAST_DURATION,
+    WEBSOCKET_BROADCAST_RECIPIENTS,
+    WEBSOCKET_MESSAGES,
+    message_type_label,
+)
 from starlette.websockets import WebSocketState
 
+from .outbound_queue import OUTBOUND_QUEUE_SIZE, TRY_AGAIN_LATER, OutboundQueue
+from .protocol import DEFAULT_PROTOCOL_VERSION, encode_message
+
+# Tiempo máximo (segundos) para entregar un mensaje a una conexión
+BROADCAST_SEND_TIMEOUT = 5.0
+
 
 class WebSocketManager:
-    def __init__(self):
+    def __init__(
+        self,
+        send_timeout: float = BROADCAST_SEND_TIMEOUT,
+        outbound_queue_size: int = OUTBOUND_QUEUE_SIZE,
+    ):
         self.active_connections: Dict[str, List[WebSocket]] = {}
+        self.protocol_versions: Dict[WebSocket, int] = {}
+        self.outbound_queues: Dict[WebSocket, OutboundQueue] = {}
+        self.send_timeout = send_timeout
+        self.outbound_queue_size = outbound_queue_size
+        # Cierres en curso de conexiones expulsadas por lentas
+        self._closing_tasks: Set[asyncio.Task] = set()
 
     def connect(self, match_id: str, websocket: WebSocket):
         if match_id not in self.active_connections:
             self.active_connections[match_id] = []
         self.active_connections[match_id].append(websocket)
 
-    def disconnect(self, match_id: str, websocket: WebSocket):
+    def disconnect(self, match_id: str, websocket: WebSocket, user_id: str = None):
+        """Elimina la conexión; user_id lo usan las subclases que registran usuarios"""
+        self.protocol_versions.pop(websocket, None)
+        outbound_queue = self.outbound_queues.pop(websocket, None)
+        if outbound_queue is not None:
+            outbound_queue.close()
         if match_id in self.active_connections:
             if websocket in self.active_connections[match_id]:
                 self.active_connections[match_id].remove(websocket)
             if not self.active_connections[match_id]:
                 del self.active_connections[match_id]
 
+    def register_outbound_queue(
+        self,
+        match_id: str,
+        websocket: WebSocket,
+        snapshot_factory: Callable[[], dict],
+        user_id: Optional[str] = None,
+    ) -> OutboundQueue:
+        """
+        Crea la cola de salida y la tarea escritora de una conexión. Si la
+        cola se cierra por lentitud se desconecta también al usuario.
+        """
+        outbound_queue = OutboundQueue(
+            websocket,
+            snapshot_factory,
+            on_close=lambda: self.disconnect(match_id, websocket, user_id),
+            max_size=self.outbound_queue_size,
+            send_timeout=self.send_timeout,
+        )
+        self.outbound_queues[websocket] = outbound_queue
+        return outbound_queue
+
+    def set_protocol_version(self, websocket: WebSocket, version: int):
+        self.protocol_versions[websocket] = version
+
+    def get_protocol_version(self, websocket: WebSocket) -> int:
+        return self.protocol_versions.get(websocket, DEFAULT_PROTOCOL_VERSION)
+
+    async def send_to_connection(self, websocket: WebSocket, message: dict):
+        """
+        Envía un mensaje a una sola conexión, a través de su cola de salida
+        si tiene una registrada
+        """
+        WEBSOCKET_MESSAGES.labels("out", message_type_label(message)).inc()
+        outbound_queue = self.outbound_queues.get(websocket)
+        if outbound_queue is not None:
+            outbound_queue.enqueue(encode_message(message), message.get("type"))
+        else:
+            await websocket.send_json(message)
+
     async def broadcast(self, match_id: str, message: dict, sender: WebSocket = None):
-        connections = self.active_connections.get(match_id, [])
+        await self.broadcast_by_protocol(
+            match_id, {DEFAULT_PROTOCOL_VERSION: message}, sender
+        )
+
+    async def broadcast_by_protocol(
+        self, match_id: str, messages: Dict[int, dict], sender: WebSocket = None
+    ):
+        """
+        Envía a cada conexión el mensaje de su versión de protocolo,
+        usando el de la versión por defecto si no hay uno específico.
+
+        Cada mensaje se serializa una sola vez. Las conexiones con cola de
+        salida solo encolan; el resto se envía en paralelo con un timeout por
+        conexión y las que fallan o expiran se eliminan en una sola pasada y
+        se cierran con 1013, igual que al desbordarse una cola de salida.
+        """
+        started_at = time.perf_counter()
+        encoded: Dict[int, str] = {}
+        recipients = []
         to_remove = []
-        for connection in connections:
+        recipient_count = 0
+        for connection in list(self.active_connections.get(match_id, [])):
             # Skip sending to the sender if provided
             if sender is not None and connection == sender:
                 continue
-            try:
-                if connection.application_state == WebSocketState.CONNECTED:
-                    await connection.send_json(message)
-                else:
-                    to_remove.append(connection)
-            except Exception:
+            if connection.application_state != WebSocketState.CONNECTED:
                 to_remove.append(connection)
+                continue
+
+            version = self.get_protocol_version(connection)
+            if version not in messages:
+                version = DEFAULT_PROTOCOL_VERSION
+            if version not in encoded:
+                encoded[version] = encode_message(messages[version])
+            recipient_count += 1
+
+            outbound_queue = self.outbound_queues.get(connection)
+            if outbound_queue is not None:
+                # Si la cola se desborda, ella misma elimina la conexión
+                outbound_queue.enqueue(encoded[version], messages[version].get("type"))
+            else:
+                recipients.append((connection, encoded[version]))
+
+        results = await asyncio.gather(
+            *(self._send_text(connection, text) for connection, text in recipients)
+        )
+        failed = [
+            connection
+            for (connection, _), delivered in zip(recipients, results)
+            if not delivered
+        ]
+        to_remove.extend(failed)
 
         for conn in to_remove:
             self.disconnect(match_id, conn)
+        for conn in failed:
+            self._close_evicted(conn)
+
+        self._record_broadcast(messages, recipient_count, started_at)
+
+    def _record_broadcast(
+        self, messages: Dict[int, dict], recipients: int, started_at: float
+    ):
+        """Métricas de fan-out: latencia, destinatarios y mensajes salientes"""
+        game_type = getattr(self, "game_type", "generic")
+        WEBSOCKET_BROADCAST_DURATION.labels(game_type).observe(
+            time.perf_counter() - started_at
+        )
+        WEBSOCKET_BROADCAST_RECIPIENTS.labels(game_type).observe(recipients)
+        if recipients:
+            message_type = message_type_label(messages[DEFAULT_PROTOCOL_VERSION])
+            WEBSOCKET_MESSAGES.labels("out", message_type).inc(recipients)
+
+    def _close_evicted(self, connection: WebSocket):
+        """
+        Cierra en segundo plano una conexión expulsada, para que su bucle de
+        lectura termine en lugar de quedar medio abierta
+        """
+        task = asyncio.create_task(self._close_websocket(connection, TRY_AGAIN_LATER))
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+
+    async def _close_websocket(self, connection: WebSocket, code: int):
+        with suppress(Exception):
+            await asyncio.wait_for(connection.close(code=code), self.send_timeout)
+
+    async def _send_text(self, connection: WebSocket, text: str) -> bool:
+        """Envía texto ya serializado; retorna False si falla o expira"""
+        try:
+            await asyncio.wait_for(connection.send_text(text), self.send_timeout)
+            return True
+        except Exception:
+            return False
 
     async def handle_message(self, match_id: str, websocket: WebSocket, message: dict):
         await self.broadcast(match_id, message, sender=websocket)
@@ -0,0 +1,108 @@
+"""foreign key and filter indexes
+
+Revision ID: 4b7c2e9d1a6f
+Revises: 9e8e98a4bf10
+Create Date: 2026-10-18 19:40:12.503114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4b7c2e9d1a6f"
+down_revision: Union[str, Sequence[str], None] = "9e8e98a4bf10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_match_participations_match_id_user_id",
+        "match_participations",
+        ["match_id", "user_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_match_participations_user_id",
+        "match_participations",
+        ["user_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_matches_game_id_is_finished_created_at",
+        "matches",
+        ["game_id", "is_finished", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_matches_created_by_id", "matches", ["created_by_id"], unique=False
+    )
+    op.create_index(
+        "ix_game_reviews_game_id_created_at",
+        "game_reviews",
+        ["game_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_transfer_payments_user_id_created_at",
+        "transfer_payments",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+
+    # Reseñas duplicadas creadas por la carrera del check-then-insert:
+    # se conserva la más antigua y se recalculan los agregados del juego
+    op.execute(
+        """
+        DELETE FROM game_reviews
+        WHERE review_id IN (
+            SELECT review_id FROM (
+                SELECT review_id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY user_id, game_id
+                           ORDER BY created_at, review_id
+                       ) AS position
+                FROM game_reviews
+            ) AS ranked
+            WHERE ranked.position > 1
+        )
+        """
+    )
+    op.execute(
+        """
+        UPDATE games
+        SET review_count = stats.review_count,
+            rating_sum = stats.rating_sum,
+            rating_avg = stats.rating_sum::float / stats.review_count
+        FROM (
+            SELECT game_id, COUNT(*) AS review_count, SUM(rating) AS rating_sum
+            FROM game_reviews
+            GROUP BY game_id
+        ) AS stats
+        WHERE games.game_id = stats.game_id
+        """
+    )
+    op.create_unique_constraint(
+        "uq_game_reviews_user_id_game_id", "game_reviews", ["user_id", "game_id"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "uq_game_reviews_user_id_game_id", "game_reviews", type_="unique"
+    )
+    op.drop_index(
+        "ix_transfer_payments_user_id_created_at", table_name="transfer_payments"
+    )
+    op.drop_index("ix_game_reviews_game_id_created_at", table_name="game_reviews")
+    op.drop_index("ix_matches_created_by_id", table_name="matches")
+    op.drop_index("ix_matches_game_id_is_finished_created_at", table_name="matches")
+    op.drop_index("ix_match_participations_user_id", table_name="match_participations")
+    op.drop_index(
+        "ix_match_participations_match_id_user_id",
+        table_name="match_participations",
+    )
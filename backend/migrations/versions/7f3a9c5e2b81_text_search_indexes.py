@@ -0,0 +1,82 @@
+"""text search indexes
+
+Revision ID: 7f3a9c5e2b81
+Revises: 4b7c2e9d1a6f
+Create Date: 2026-10-18 20:05:41.276530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7f3a9c5e2b81"
+down_revision: Union[str, Sequence[str], None] = "4b7c2e9d1a6f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column(
+        "games",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple', coalesce(game_name, '') || ' ' || "
+                "coalesce(game_description, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_games_search_vector",
+        "games",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_games_game_name_trgm",
+        "games",
+        ["game_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"game_name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_users_email_trgm",
+        "users",
+        ["email"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"email": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_transfer_payments_transfer_description_trgm",
+        "transfer_payments",
+        ["transfer_description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"transfer_description": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_transfer_payments_transfer_description_trgm",
+        table_name="transfer_payments",
+    )
+    op.drop_index("ix_users_email_trgm", table_name="users")
+    op.drop_index("ix_games_game_name_trgm", table_name="games")
+    op.drop_index("ix_games_search_vector", table_name="games")
+    op.drop_column("games", "search_vector")
+    # pg_trgm se deja instalada: otras bases del servidor pueden usarla
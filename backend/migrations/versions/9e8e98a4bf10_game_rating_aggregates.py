@@ -0,0 +1,60 @@
+"""game rating aggregates
+
+Revision ID: 9e8e98a4bf10
+Revises: d2c201291b3a
+Create Date: 2026-10-18 10:12:31.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9e8e98a4bf10"
+down_revision: Union[str, Sequence[str], None] = "d2c201291b3a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "games",
+        sa.Column("review_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "games",
+        sa.Column("rating_sum", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "games",
+        sa.Column("rating_avg", sa.Float(), server_default="0", nullable=False),
+    )
+
+    # Backfill de los agregados a partir de las reseñas existentes
+    op.execute(
+        """
+        UPDATE games
+        SET review_count = stats.review_count,
+            rating_sum = stats.rating_sum,
+            rating_avg = stats.rating_sum::float / stats.review_count
+        FROM (
+            SELECT game_id, COUNT(*) AS review_count, SUM(rating) AS rating_sum
+            FROM game_reviews
+            GROUP BY game_id
+        ) AS stats
+        WHERE games.game_id = stats.game_id
+        """
+    )
+
+    op.create_index(op.f("ix_games_rating_avg"), "games", ["rating_avg"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_games_rating_avg"), table_name="games")
+    op.drop_column("games", "rating_avg")
+    op.drop_column("games", "rating_sum")
+    op.drop_column("games", "review_count")
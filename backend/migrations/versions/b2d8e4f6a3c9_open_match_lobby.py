@@ -0,0 +1,78 @@
+"""open match lobby
+
+Revision ID: b2d8e4f6a3c9
+Revises: 7f3a9c5e2b81
+Create Date: 2026-10-18 20:48:09.114672
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b2d8e4f6a3c9"
+down_revision: Union[str, Sequence[str], None] = "7f3a9c5e2b81"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # El índice parcial y las consultas usan is_finished = false: sin NULLs
+    op.execute("UPDATE matches SET is_finished = false WHERE is_finished IS NULL")
+    op.alter_column(
+        "matches",
+        "is_finished",
+        existing_type=sa.Boolean(),
+        nullable=False,
+        server_default=sa.false(),
+        existing_comment="Indica si la partida ha finalizado",
+    )
+
+    op.add_column(
+        "matches",
+        sa.Column(
+            "participant_count",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Cantidad de participantes de la partida",
+        ),
+    )
+    op.execute(
+        """
+        UPDATE matches
+        SET participant_count = stats.participant_count
+        FROM (
+            SELECT match_id, COUNT(*) AS participant_count
+            FROM match_participations
+            GROUP BY match_id
+        ) AS stats
+        WHERE matches.match_id = stats.match_id
+        """
+    )
+
+    op.create_index(
+        "ix_matches_open_lobby",
+        "matches",
+        ["game_id", "created_at", "match_id"],
+        unique=False,
+        postgresql_where=sa.text("is_finished = false"),
+        postgresql_include=["participant_count"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_matches_open_lobby", table_name="matches")
+    op.drop_column("matches", "participant_count")
+    op.alter_column(
+        "matches",
+        "is_finished",
+        existing_type=sa.Boolean(),
+        nullable=True,
+        server_default=None,
+        existing_comment="Indica si la partida ha finalizado",
+    )
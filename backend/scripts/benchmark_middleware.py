@@ -0,0 +1,152 @@
+"""
+Benchmark: requests/seg de GET /games con los middlewares BaseHTTPMiddleware
+(versión anterior) frente a los middlewares ASGI puros.
+
+Monta el router real de juegos con GetAllGamesUseCase.execute devolviendo
+una página vacía, para medir solo el costo de la pila de middlewares y no el
+de la base de datos (la sesión se abre pero nunca se conecta). Las
+peticiones se envían directo a la aplicación ASGI.
+
+Uso (desde backend/):
+    python -m scripts.benchmark_middleware --requests 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.http.routes.game_routes import game_router  # noqa: E402
+from application.mixins.logging_mixin import LoggingMixin  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from application.use_cases.game import GetAllGamesUseCase  # noqa: E402
+from infrastructure.middleware import (  # noqa: E402
+    LoggingMiddleware,
+    SimpleProxyHeadersMiddleware,
+)
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware, LoggingMixin):
+    """Copia de LoggingMiddleware antes de pasar a ASGI puro"""
+
+    async def dispatch(self, request: Request, call_next):
+        request_id = str(uuid.uuid4())[:8]
+        method = request.method
+        url = str(request.url)
+        client_ip = request.client.host if request.client else "unknown"
+        user_agent = request.headers.get("user-agent", "unknown")
+        self.logger.info(
+            f"[{request_id}] {method} {url} - IP: {client_ip} - User-Agent: {user_agent[:50]}..."
+        )
+        start_time = time.time()
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        self.logger.info(
+            f"[{request_id}] {method} {url} - Status: {response.status_code} - "
+            f"Time: {process_time:.3f}s"
+        )
+        response.headers["X-Request-ID"] = request_id
+        response.headers["X-Process-Time"] = f"{process_time:.3f}"
+        return response
+
+
+class LegacyProxyHeadersMiddleware(BaseHTTPMiddleware):
+    """Copia de SimpleProxyHeadersMiddleware antes de pasar a ASGI puro"""
+
+    async def dispatch(self, request: Request, call_next):
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if forwarded_for:
+            request.scope["client"] = (forwarded_for.split(",")[0].strip(), 0)
+        forwarded_proto = request.headers.get("x-forwarded-proto")
+        if forwarded_proto:
+            request.scope["scheme"] = forwarded_proto
+        return await call_next(request)
+
+
+async def empty_page(self, pagination, filters, sort_params):
+    """Reemplaza GetAllGamesUseCase.execute: página vacía sin consultas"""
+    return [], 0
+
+
+def build_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+    app.include_router(game_router)
+    if legacy:
+        app.add_middleware(LegacyProxyHeadersMiddleware)
+        app.add_middleware(LegacyLoggingMiddleware)
+    else:
+        app.add_middleware(SimpleProxyHeadersMiddleware)
+        app.add_middleware(LoggingMiddleware)
+    return app
+
+
+async def call(app: FastAPI) -> int:
+    """Envía un GET /games/ directo a la aplicación ASGI"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/games/",
+        "raw_path": b"/games/",
+        "query_string": b"page=1&limit=10",
+        "root_path": "",
+        "headers": [
+            (b"host", b"localhost"),
+            (b"user-agent", b"benchmark"),
+            (b"x-forwarded-for", b"203.0.113.7"),
+            (b"x-forwarded-proto", b"https"),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def run(app: FastAPI, requests: int, concurrency: int) -> float:
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            assert await call(app) == 200
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started_at)
+
+
+async def main(requests: int, concurrency: int, rounds: int):
+    GetAllGamesUseCase.execute = empty_page
+    for legacy in (True, False):
+        app = build_app(legacy)
+        await run(app, min(requests, 200), concurrency)  # calentamiento
+        label = "before" if legacy else "after"
+        for _ in range(rounds):
+            rps = await run(app, requests, concurrency)
+            print(f"{label:<6} requests={requests:<6} req/s={rps:9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.rounds))
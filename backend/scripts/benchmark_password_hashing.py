@@ -0,0 +1,94 @@
+"""
+Benchmark: lag del event loop durante una ráfaga de logins concurrentes.
+
+Compara PasswordHasher.verify (bloqueante, dentro de la corrutina) con
+PasswordHasher.averify (pool acotado). Un "latido" duerme TICK_SECONDS en
+bucle y mide cuánto se retrasa; ese retraso es lo que sufren las partidas
+por WebSocket del mismo worker mientras se verifican contraseñas.
+
+Uso (desde backend/):
+    python -m scripts.benchmark_password_hashing --logins 50 --workers 4
+"""
+
+import argparse
+import asyncio
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.services.bounded_executor import BoundedExecutor  # noqa: E402
+from application.services.password_hasher import PasswordHasher  # noqa: E402
+from passlib.context import CryptContext  # noqa: E402
+
+TICK_SECONDS = 0.01
+PASSWORD = "benchmark-password"
+
+
+async def heartbeat(lags: list, stop: asyncio.Event):
+    """Registra cuánto tarda el loop en despertar tras cada sleep"""
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK_SECONDS
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(max(time.perf_counter() - expected, 0.0))
+
+
+async def run_burst(hasher: PasswordHasher, hashed: str, logins: int, mode: str):
+    async def login():
+        if mode == "sync":
+            # Lo que hacía LoginUserUseCase: verify directamente en el loop
+            assert hasher.verify(PASSWORD, hashed)
+        else:
+            assert await hasher.averify(PASSWORD, hashed)
+
+    lags: list = []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(lags, stop))
+    await asyncio.sleep(TICK_SECONDS * 3)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started_at
+
+    stop.set()
+    await beat
+    return elapsed, lags
+
+
+def summarize(mode: str, elapsed: float, lags: list, logins: int) -> str:
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    p95 = lags_ms[min(len(lags_ms) - 1, math.ceil(len(lags_ms) * 0.95) - 1)]
+    return (
+        f"{mode:<6} logins={logins:<4} total={elapsed:7.3f}s "
+        f"heartbeats={len(lags):<5} lag_avg={statistics.mean(lags_ms):8.2f}ms "
+        f"lag_p95={p95:8.2f}ms lag_max={lags_ms[-1]:8.2f}ms"
+    )
+
+
+async def main(logins: int, workers: int, rounds: int):
+    context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    executor = BoundedExecutor(
+        "benchmark-hasher", max_workers=workers, max_pending=max(logins, 1)
+    )
+    hasher = PasswordHasher(context, executor=executor)
+    hashed = context.hash(PASSWORD)
+
+    for mode in ("sync", "async"):
+        for _ in range(rounds):
+            elapsed, lags = await run_burst(hasher, hashed, logins, mode)
+            print(summarize(mode, elapsed, lags, logins))
+
+    print(f"executor stats: {executor.get_stats()}")
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.workers, args.rounds))
@@ -0,0 +1,100 @@
+"""
+Verificación: los listados paginan siguiendo sus enlaces `next`.
+
+Crea juegos de prueba en la base de datos configurada y recorre
+/games/?include_total=false con el TestClient de FastAPI siguiendo `next`
+hasta el final. Games no pagina por cursor: la respuesta debe traer
+enlaces por página (count y pages incluidos) y recorrerlos debe devolver
+cada juego una sola vez. Falla si la paginación se corta en la primera
+página o repite elementos. Los juegos creados se borran al final.
+
+Uso (desde backend/):
+    python -m scripts.check_pagination_smoke
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from domain.enums import GameTypeEnum  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from infrastructure.cache import GAMES_CACHE, invalidate_read_cache  # noqa: E402
+from infrastructure.db.connection import SessionLocal  # noqa: E402
+from infrastructure.db.models import GameModel  # noqa: E402
+from main import app  # noqa: E402
+
+SEEDED_GAMES = 5
+PAGE_SIZE = 2
+
+
+def seed_games(prefix: str) -> None:
+    with SessionLocal() as session:
+        session.add_all(
+            GameModel(
+                game_name=f"{prefix}-{index}",
+                game_description="check_pagination_smoke",
+                game_url="https://example.com",
+                game_type=GameTypeEnum.OFFLINE,
+            )
+            for index in range(SEEDED_GAMES)
+        )
+        session.commit()
+    invalidate_read_cache(GAMES_CACHE)
+
+
+def delete_games(prefix: str) -> None:
+    with SessionLocal() as session:
+        session.query(GameModel).filter(
+            GameModel.game_name.like(f"{prefix}-%")
+        ).delete(synchronize_session=False)
+        session.commit()
+    invalidate_read_cache(GAMES_CACHE)
+
+
+def walk(client: TestClient, path: str) -> int:
+    """Sigue los enlaces `next` y retorna la cantidad de fallas"""
+    seen = []
+    pages = 0
+    expected_count = None
+    url = path
+    while url:
+        response = client.get(url)
+        if response.status_code != 200:
+            print(f"FAIL  {url}: status {response.status_code}")
+            return 1
+        body = response.json()
+        info = body["info"]
+        if info["count"] is None or body["next_cursor"] is not None:
+            print(f"FAIL  {url}: cursor-shaped response without keyset pagination")
+            return 1
+        expected_count = info["count"]
+        seen.extend(game["game_id"] for game in body["results"])
+        pages += 1
+        url = info["next"]
+
+    if len(seen) != len(set(seen)):
+        print(f"FAIL  {path}: repeated games across pages")
+        return 1
+    if len(seen) != expected_count:
+        print(f"FAIL  {path}: walked {len(seen)} of {expected_count} games")
+        return 1
+    print(f"ok    {path} ({len(seen)} games in {pages} pages)")
+    return 0
+
+
+def main() -> int:
+    prefix = f"pagination-smoke-{uuid.uuid4().hex[:8]}"
+    seed_games(prefix)
+    try:
+        with TestClient(app) as client:
+            failures = walk(client, f"/games/?include_total=false&limit={PAGE_SIZE}")
+            failures += walk(client, f"/games/?limit={PAGE_SIZE}")
+    finally:
+        delete_games(prefix)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Verificación: las consultas calientes de los repositorios usan índices.
+
+Llama a los métodos reales de los repositorios contra la base de datos
+configurada, dentro de una transacción que se revierte al final, y captura
+las sentencias SQL que envían (con sus parámetros). Cada sentencia se vuelve
+a ejecutar como EXPLAIN (FORMAT JSON) con enable_seqscan desactivado: así,
+con tablas pequeñas, el planificador solo recurre a un Seq Scan (o a recorrer
+entero otro índice) si no hay un índice que sirva para ese filtro. Sale con
+código 1 si alguna consulta deja de usar un índice sobre la tabla filtrada,
+para usarlo en CI después de `alembic upgrade head`.
+
+Uso (desde backend/):
+    python -m scripts.check_query_plans
+"""
+
+import asyncio
+import importlib
+import json
+import re
+import sys
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# La app registra modelos y repositorios en el orden correcto
+importlib.import_module("main")
+
+from application.common import PaginationParams, SortParams  # noqa: E402
+from infrastructure.db.connection import AsyncSessionLocal, async_engine  # noqa: E402
+from infrastructure.db.models import (  # noqa: E402
+    GameModel,
+    GameReviewModel,
+    MatchModel,
+    TransferPaymentModel,
+)
+from infrastructure.db.repositories import (  # noqa: E402
+    PostgresGameRepository,
+    PostgresGameReviewRepository,
+    PostgresMatchRepository,
+    PostgresTransferPaymentRepository,
+)
+from sqlalchemy import event, text  # noqa: E402
+
+SAMPLE_ID = str(uuid.uuid4())
+BY_CREATED_AT = SortParams(sort_by="created_at", sort_order="desc")
+
+
+def page(**kwargs) -> PaginationParams:
+    return PaginationParams(limit=20, **kwargs)
+
+
+# (nombre, tabla que no debe recorrerse entera, llamada al repositorio).
+# Sin búsquedas por clave primaria: con tablas vacías el planificador puede
+# preferir un índice parcial más chico y daría falsos positivos.
+TARGETS = [
+    (
+        "MatchRepository.get_match_participant_ids",
+        "match_participations",
+        lambda repos: repos.matches.get_match_participant_ids(SAMPLE_ID),
+    ),
+    (
+        "MatchRepository.get_by_game_id",
+        "matches",
+        lambda repos: repos.matches.get_by_game_id(
+            SAMPLE_ID, page(), sort_params=BY_CREATED_AT
+        ),
+    ),
+    (
+        "MatchRepository.get_by_game_id (cursor)",
+        "matches",
+        lambda repos: repos.matches.get_by_game_id(
+            SAMPLE_ID, page(include_total=False), sort_params=BY_CREATED_AT
+        ),
+    ),
+    (
+        "MatchRepository.get_open_by_game_id (lobby)",
+        "matches",
+        lambda repos: repos.matches.get_open_by_game_id(SAMPLE_ID, 2, page()),
+    ),
+    (
+        "GameRepository._attach_match_counts",
+        "matches",
+        lambda repos: repos.games._attach_match_counts(
+            [SimpleNamespace(game_id=SAMPLE_ID)]
+        ),
+    ),
+    (
+        "GameReviewRepository.get_by_game_id",
+        "game_reviews",
+        lambda repos: repos.reviews.get_by_game_id(
+            SAMPLE_ID, page(), sort_params=BY_CREATED_AT
+        ),
+    ),
+    (
+        "GameReviewRepository.get_by_user_and_game_id",
+        "game_reviews",
+        lambda repos: repos.reviews.get_by_user_and_game_id(SAMPLE_ID, SAMPLE_ID),
+    ),
+    (
+        "TransferPaymentRepository.get_by_user_id",
+        "transfer_payments",
+        lambda repos: repos.transfers.get_by_user_id(
+            SAMPLE_ID, page(), None, BY_CREATED_AT
+        ),
+    ),
+]
+
+
+class StatementCapture:
+    """Registra las sentencias que el engine envía a la base de datos"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements: List[Tuple[str, tuple]] = []
+
+    def __enter__(self) -> "StatementCapture":
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append((statement, parameters))
+
+
+def build_repositories(session) -> SimpleNamespace:
+    return SimpleNamespace(
+        matches=PostgresMatchRepository(session, MatchModel),
+        games=PostgresGameRepository(session, GameModel),
+        reviews=PostgresGameReviewRepository(session, GameReviewModel),
+        transfers=PostgresTransferPaymentRepository(session, TransferPaymentModel),
+    )
+
+
+# Primera columna de cada índice (los de expresiones no aparecen)
+LEADING_COLUMNS_SQL = """
+SELECT index_class.relname, attribute.attname
+FROM pg_index AS index
+JOIN pg_class AS index_class ON index_class.oid = index.indexrelid
+JOIN pg_attribute AS attribute
+    ON attribute.attrelid = index.indrelid AND attribute.attnum = index.indkey[0]
+"""
+
+
+def seeks_index(node: dict, leading_columns: Dict[str, str]) -> bool:
+    """
+    El nodo busca en el índice por su primera columna. Una condición solo
+    sobre columnas posteriores obliga a recorrer el índice entero.
+    """
+    condition = node.get("Index Cond")
+    if not condition:
+        return False
+    column = leading_columns.get(node.get("Index Name"))
+    return column is None or re.search(rf"\b{column}\b", condition) is not None
+
+
+def bitmap_index_scans(plan: dict) -> List[dict]:
+    scans = []
+    for child in plan.get("Plans", []):
+        if child["Node Type"] == "Bitmap Index Scan":
+            scans.append(child)
+        else:
+            scans.extend(bitmap_index_scans(child))
+    return scans
+
+
+def find_table_scans(
+    plan: dict, table: str, leading_columns: Dict[str, str]
+) -> List[Tuple[str, bool]]:
+    """
+    Nodos que leen la tabla y si usan un índice para el filtro. Un Seq Scan
+    o un recorrido completo de un índice (sin Index Cond sobre su primera
+    columna) no lo usan.
+    """
+    scans = []
+    node_type = plan["Node Type"]
+    # ModifyTable (UPDATE/DELETE) también nombra la tabla: solo cuentan lecturas
+    if plan.get("Relation Name") == table and node_type.endswith("Scan"):
+        if node_type in ("Index Scan", "Index Only Scan"):
+            uses_index = seeks_index(plan, leading_columns)
+        elif node_type == "Bitmap Heap Scan":
+            index_scans = bitmap_index_scans(plan)
+            uses_index = bool(index_scans) and all(
+                seeks_index(index_scan, leading_columns) for index_scan in index_scans
+            )
+        else:
+            uses_index = False
+        scans.append((node_type, uses_index))
+    for child in plan.get("Plans", []):
+        scans.extend(find_table_scans(child, table, leading_columns))
+    return scans
+
+
+async def explain(connection, statement: str, parameters) -> dict:
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    )
+    raw_plan = result.scalar_one()
+    plan = json.loads(raw_plan) if isinstance(raw_plan, str) else raw_plan
+    return plan[0]["Plan"]
+
+
+async def run() -> int:
+    failures = 0
+    async with AsyncSessionLocal() as session:
+        connection = await session.connection()
+        await connection.execute(text("SET LOCAL enable_seqscan = off"))
+        rows = await connection.exec_driver_sql(LEADING_COLUMNS_SQL)
+        leading_columns = dict(rows.all())
+        repos = build_repositories(session)
+
+        for name, table, call in TARGETS:
+            with StatementCapture(async_engine.sync_engine) as capture:
+                await call(repos)
+
+            scans = []
+            for statement, parameters in capture.statements:
+                plan = await explain(connection, statement, parameters)
+                scans.extend(find_table_scans(plan, table, leading_columns))
+
+            full_scans = [
+                node_type for node_type, uses_index in scans if not uses_index
+            ]
+            if not scans:
+                failures += 1
+                print(f"FAIL  {name}: no statement read {table}")
+            elif full_scans:
+                failures += 1
+                print(f"FAIL  {name}: {', '.join(full_scans)} on {table}")
+            else:
+                print(f"ok    {name} ({len(capture.statements)} statements)")
+
+        await session.rollback()
+    await async_engine.dispose()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run()))
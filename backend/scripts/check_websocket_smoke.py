@@ -0,0 +1,47 @@
+"""
+Verificación: las rutas WebSocket resuelven sus dependencias.
+
+Abre /ws/games/{match_id} sin token con el TestClient de FastAPI. Las
+dependencias (repositorios, sesiones de lectura) se resuelven antes de
+aceptar la conexión; si alguna solo funciona en peticiones HTTP (por
+ejemplo, porque pide un Request), la conexión se rompe antes de aceptarse.
+Con dependencias correctas la conexión se acepta y el servidor la cierra
+por falta de token, sin tocar la base de datos.
+
+Uso (desde backend/):
+    python -m scripts.check_websocket_smoke
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from main import app  # noqa: E402
+from starlette.websockets import WebSocketDisconnect  # noqa: E402
+
+
+def main() -> int:
+    path = f"/ws/games/{uuid.uuid4()}"
+    with TestClient(app) as client:
+        try:
+            with client.websocket_connect(path) as websocket:
+                # Aceptada: lo que llegue después es el rechazo por el token
+                try:
+                    websocket.receive()
+                except WebSocketDisconnect:
+                    pass
+        except WebSocketDisconnect as e:
+            print(f"FAIL  {path}: closed before accept (code {e.code})")
+            return 1
+        except Exception as e:
+            print(f"FAIL  {path}: {type(e).__name__}: {e}")
+            return 1
+    print(f"ok    {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())